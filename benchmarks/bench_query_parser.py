@@ -0,0 +1,128 @@
+"""process_search_query 마이크로 벤치마크
+
+KeywordMatcher 기반 구현과 이전의 부분 문자열 반복 검사 구현을 비교합니다.
+두 구현의 결과가 같은지도 함께 확인합니다.
+
+사용법:
+    python -m benchmarks.bench_query_parser [--repeat 2000] [--extra-terms 3000]
+"""
+import argparse
+import random
+import timeit
+from typing import Dict
+
+from maat_mcp.util import query_parser
+from maat_mcp.util.keyword_matcher import KeywordMatcher
+from maat_mcp.util.query_parser import (
+    DEFAULT_FOOD_TYPES,
+    DEFAULT_SEARCH_SUFFIX,
+    FOOD_TYPE_ALIASES,
+    NEARBY_KEYWORDS,
+    SEARCH_REGIONS,
+    process_search_query
+)
+
+def legacy_process_search_query(query: str, context: str = "", regions=SEARCH_REGIONS, food_types=DEFAULT_FOOD_TYPES) -> Dict[str, str]:
+    """이전 구현: 사전의 항목마다 `in`으로 텍스트를 훑습니다."""
+    aliases = dict(FOOD_TYPE_ALIASES)
+    result = {"location": "", "search_query": "맛집", "use_current_location": False}
+    search_text = f"{query} {context}" if context else query
+
+    for keyword in NEARBY_KEYWORDS:
+        if keyword in search_text:
+            result["use_current_location"] = True
+            break
+
+    if context:
+        for location in regions:
+            if location in context:
+                result["location"] = location
+                break
+        for food_type, search_term in aliases.items():
+            if food_type in context:
+                result["search_query"] = search_term + DEFAULT_SEARCH_SUFFIX
+                break
+        else:
+            for food_type in food_types:
+                if food_type in context:
+                    result["search_query"] = food_type + DEFAULT_SEARCH_SUFFIX
+                    break
+
+    for location in regions:
+        if location in query:
+            result["location"] = location
+            break
+    for food_type, search_term in aliases.items():
+        if food_type in query:
+            result["search_query"] = search_term + DEFAULT_SEARCH_SUFFIX
+            break
+    else:
+        for food_type in food_types:
+            if food_type in query:
+                result["search_query"] = food_type + DEFAULT_SEARCH_SUFFIX
+                break
+    return result
+
+def _random_text(rng: random.Random, words, length: int, density: float = 0.1) -> str:
+    """사전 단어가 density 비율로 섞인 임의의 대화 문장을 만듭니다."""
+    filler = ["오늘", "점심", "뭐", "먹을까", "추천", "해줘", "좋은", "곳", "있어?", "그리고", "친구랑", "가려고"]
+    return " ".join(rng.choice(words) if rng.random() < density else rng.choice(filler) for _ in range(length))
+
+def _check_equivalence(rng: random.Random, samples: int = 5000) -> None:
+    words = SEARCH_REGIONS + DEFAULT_FOOD_TYPES + list(FOOD_TYPE_ALIASES) + NEARBY_KEYWORDS
+    for _ in range(samples):
+        query = _random_text(rng, words, rng.randint(1, 6))
+        context = _random_text(rng, words, rng.randint(0, 40)) if rng.random() < 0.7 else ""
+        expected = legacy_process_search_query(query, context)
+        actual = process_search_query(query, context)
+        assert expected == actual, (query, context, expected, actual)
+    print(f"결과 일치 확인: {samples}건")
+
+def _bench(label: str, func, repeat: int) -> float:
+    seconds = min(timeit.repeat(func, number=repeat, repeat=5)) / repeat
+    print(f"  {label:<10} {seconds * 1e6:9.2f} us/호출")
+    return seconds
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="process_search_query 마이크로 벤치마크")
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--extra-terms", type=int, default=3000, help="대규모 사전 비교에 추가할 가상 음식 종류 수")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    _check_equivalence(rng)
+
+    words = SEARCH_REGIONS + DEFAULT_FOOD_TYPES + list(FOOD_TYPE_ALIASES)
+    cases = {
+        "짧은 검색어": ("강남 한식 맛집", ""),
+        "짧은 맥락": ("근처 맛집", _random_text(rng, words, 30)),
+        "긴 맥락": ("맛집 추천", _random_text(rng, words, 2000, density=0.01)),
+        "긴 맥락(사전 단어 10%)": ("맛집 추천", _random_text(rng, words, 2000))
+    }
+    for name, (query, context) in cases.items():
+        print(f"{name} (맥락 {len(context)}자)")
+        legacy = _bench("이전", lambda: legacy_process_search_query(query, context), args.repeat)
+        current = _bench("현재", lambda: process_search_query(query, context), args.repeat)
+        print(f"  배율       {legacy / current:9.2f}x")
+
+    # 사전이 수천 개로 늘어난 경우 (가상 음식 종류 추가)
+    extra = [f"{rng.choice(words)}{i}" for i in range(args.extra_terms)]
+    food_types = DEFAULT_FOOD_TYPES + extra
+    original_matcher = query_parser._MATCHER
+    query_parser._MATCHER = KeywordMatcher(
+        [(k, (query_parser._NEARBY, 0, None)) for k in NEARBY_KEYWORDS]
+        + [(r, (query_parser._REGION, i, r)) for i, r in enumerate(SEARCH_REGIONS)]
+        + [(a, (query_parser._FOOD, i, t)) for i, (a, t) in enumerate(FOOD_TYPE_ALIASES.items())]
+        + [(f, (query_parser._FOOD, len(FOOD_TYPE_ALIASES) + i, f)) for i, f in enumerate(food_types)]
+    )
+    try:
+        query, context = cases["짧은 맥락"]
+        print(f"사전 {len(food_types) + len(SEARCH_REGIONS) + len(FOOD_TYPE_ALIASES)}개 (맥락 {len(context)}자)")
+        legacy = _bench("이전", lambda: legacy_process_search_query(query, context, food_types=food_types), args.repeat // 10 or 1)
+        current = _bench("현재", lambda: process_search_query(query, context), args.repeat // 10 or 1)
+        print(f"  배율       {legacy / current:9.2f}x")
+    finally:
+        query_parser._MATCHER = original_matcher
+
+if __name__ == "__main__":
+    main()
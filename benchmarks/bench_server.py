@@ -0,0 +1,296 @@
+"""MCP 도구 부하 테스트
+
+스텁 업스트림 서버(benchmarks.stub_upstreams)를 띄우고 Config의 업스트림 URL을 그쪽으로 바꾼 뒤,
+MCP 도구(find_restaurants, recommend_random_restaurant)를 지정한 동시성으로 호출합니다.
+지연 시간 p50/p95/p99, 초당 처리량, 요청당 업스트림 호출 수를 보고하며,
+결과를 JSON으로 저장해 이전 실행과 비교할 수 있습니다.
+
+사용법:
+    python -m benchmarks.bench_server --requests 500 --concurrency 20 --output baseline.json
+    python -m benchmarks.bench_server --requests 500 --concurrency 20 --compare baseline.json
+    python -m benchmarks.bench_server --cold --latency-ms 80 --error-rate 0.02 --pages 3
+
+    # 실행 중인 서버(상태 없는 streamable HTTP)를 HTTP로 호출 (워커 수별 처리량 비교용)
+    python -m benchmarks.bench_server --url http://127.0.0.1:8000/mcp --stub-url http://127.0.0.1:8900
+
+--cold를 주면 호출마다 메모리 캐시와 공간 인덱스를 비워 업스트림까지 가는 경로를 측정합니다(프로세스 내 실행만).
+--url을 주면 스텁 서버를 띄우지 않으므로, 서버와 스텁(python -m benchmarks.stub_upstreams)을 미리 실행해 두고
+--stub-url로 스텁 주소를 알려 주면 요청당 업스트림 호출 수를 스텁에서 읽어 옵니다.
+--compare의 기준보다 p95/p99 지연, 요청당 업스트림 호출 수가 --threshold 이상 늘거나
+처리량이 --threshold 이상 줄면 종료 코드 1로 끝납니다.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from benchmarks.stub_upstreams import StubUpstreams
+from maat_mcp.config import Config
+
+DEFAULT_QUERIES = ["맛집", "강남 한식", "홍대 카페", "이태원 양식", "내 주변 일식", "잠실 고기", "성수 카페", "근처 분식"]
+DEFAULT_CATEGORIES = ["한식", "중식", "일식", "양식", "카페", "강남 한식", "홍대 술집"]
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값에서 nearest-rank 방식으로 분위수를 구합니다."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+def _clear_caches() -> None:
+    """프로세스 안의 메모리 캐시, 공간 인덱스, 무작위 추천 후보 풀을 비웁니다."""
+    from maat_mcp.handlers import google_maps_api_handler, ip_location_api_handler
+    google_maps_api_handler._restaurant_cache.clear()
+    google_maps_api_handler._geocode_cache.clear()
+    google_maps_api_handler._details_cache.clear()
+    google_maps_api_handler._place_index.clear()
+    google_maps_api_handler._candidate_pools.clear()
+    ip_location_api_handler._ip_location_cache.clear()
+
+def _next_call(rng: random.Random, tool: str) -> Tuple[str, Dict[str, Any]]:
+    """호출할 도구와 인자를 고릅니다."""
+    if tool == "mixed":
+        tool = "find_restaurants" if rng.random() < 0.7 else "recommend_random_restaurant"
+    if tool == "find_restaurants":
+        return tool, {"query": rng.choice(DEFAULT_QUERIES)}
+    return tool, {"category": rng.choice(DEFAULT_CATEGORIES)}
+
+class InProcessTarget:
+    """스텁 서버를 띄우고 프로세스 안의 MCP 서버를 직접 호출합니다."""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.stub = StubUpstreams(args.latency_ms, args.jitter_ms, args.error_rate, args.pages, args.seed)
+        self.mcp = None
+
+    async def start(self) -> None:
+        await self.stub.start()
+        self.stub.configure()
+        Config.PAGE_TOKEN_DELAY = self.args.page_token_delay
+        Config.PERSISTENT_CACHE_PATH = ""
+
+        # Config를 바꾼 뒤에 서버 모듈을 불러옵니다.
+        from main import mcp
+        from maat_mcp.api.http import HttpClient
+        logging.getLogger().setLevel(logging.CRITICAL)
+        await HttpClient.open()
+        self.mcp = mcp
+
+    async def call(self, tool: str, arguments: Dict[str, Any]) -> None:
+        if self.args.cold:
+            _clear_caches()
+        await self.mcp.call_tool(tool, arguments)
+
+    async def reset_upstream_calls(self) -> None:
+        self.stub.calls.clear()
+
+    async def upstream_calls(self) -> Dict[str, int]:
+        return dict(self.stub.calls)
+
+    async def close(self) -> None:
+        from maat_mcp.api.http import HttpClient
+        await HttpClient.close()
+        await self.stub.stop()
+
+class HttpTarget:
+    """실행 중인 서버의 streamable HTTP 엔드포인트로 JSON-RPC tools/call을 보냅니다.
+
+    서버는 상태 없는 모드(MCP_STATELESS_HTTP=true)로 실행해야 합니다.
+    """
+
+    HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._request_ids = itertools.count(1)
+
+    async def start(self) -> None:
+        self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.args.concurrency))
+
+    async def call(self, tool: str, arguments: Dict[str, Any]) -> None:
+        payload = {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
+            "method": "tools/call",
+            "params": {"name": tool, "arguments": arguments}
+        }
+        async with self.session.post(self.args.url, json=payload, headers=self.HEADERS) as response:
+            if response.status != 200:
+                raise Exception(f"HTTP {response.status}")
+            body = await response.text()
+        if response.content_type == "text/event-stream":
+            body = next(line[5:] for line in body.splitlines() if line.startswith("data:"))
+        message = json.loads(body)
+        if "error" in message or message["result"].get("isError"):
+            raise Exception("도구 호출 실패")
+
+    async def reset_upstream_calls(self) -> None:
+        if self.args.stub_url:
+            async with self.session.post(f"{self.args.stub_url}/_reset"):
+                pass
+
+    async def upstream_calls(self) -> Dict[str, int]:
+        if not self.args.stub_url:
+            return {}
+        async with self.session.get(f"{self.args.stub_url}/_stats") as response:
+            return await response.json()
+
+    async def close(self) -> None:
+        await self.session.close()
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """부하를 건 뒤 결과를 반환합니다."""
+    target = HttpTarget(args) if args.url else InProcessTarget(args)
+    await target.start()
+
+    rng = random.Random(args.seed)
+    calls = [_next_call(rng, args.tool) for _ in range(args.warmup + args.requests)]
+    latencies: List[float] = []
+    errors = 0
+
+    async def call(tool: str, arguments: Dict[str, Any], record: bool) -> None:
+        nonlocal errors
+        start = time.perf_counter()
+        try:
+            await target.call(tool, arguments)
+        except Exception:
+            if record:
+                errors += 1
+        if record:
+            latencies.append(time.perf_counter() - start)
+
+    async def worker(queue: "asyncio.Queue[Tuple[str, Dict[str, Any]]]", record: bool) -> None:
+        while True:
+            try:
+                tool, arguments = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await call(tool, arguments, record)
+
+    async def drive(batch: List[Tuple[str, Dict[str, Any]]], record: bool) -> float:
+        queue: "asyncio.Queue[Tuple[str, Dict[str, Any]]]" = asyncio.Queue()
+        for item in batch:
+            queue.put_nowait(item)
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(queue, record) for _ in range(args.concurrency)))
+        return time.perf_counter() - start
+
+    try:
+        await drive(calls[:args.warmup], record=False)
+        await target.reset_upstream_calls()
+        duration = await drive(calls[args.warmup:], record=True)
+        upstream_calls = await target.upstream_calls()
+    finally:
+        await target.close()
+
+    latencies.sort()
+    upstream = {endpoint: round(count / args.requests, 4) for endpoint, count in sorted(upstream_calls.items())}
+    upstream["total"] = round(sum(upstream_calls.values()) / args.requests, 4)
+    return {
+        "config": {
+            "target": args.url or "in-process",
+            "tool": args.tool,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "cold": args.cold,
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "error_rate": args.error_rate,
+            "pages": args.pages,
+            "page_token_delay": args.page_token_delay
+        },
+        "errors": errors,
+        "duration_s": round(duration, 4),
+        "rps": round(args.requests / duration, 2) if duration else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50) * 1000, 3),
+            "p95": round(percentile(latencies, 0.95) * 1000, 3),
+            "p99": round(percentile(latencies, 0.99) * 1000, 3),
+            "mean": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+            "max": round(latencies[-1] * 1000, 3) if latencies else 0.0
+        },
+        "upstream_calls_per_request": upstream
+    }
+
+def print_report(result: Dict[str, Any]) -> None:
+    config = result["config"]
+    latency = result["latency_ms"]
+    print(f"대상: {config['target']}")
+    print(f"도구: {config['tool']}, 요청 {config['requests']}개, 동시성 {config['concurrency']}, 콜드: {config['cold']}")
+    print(f"스텁: 지연 {config['latency_ms']}±{config['jitter_ms']}ms, 오류율 {config['error_rate']}, 페이지 {config['pages']}")
+    print(f"처리량: {result['rps']} req/s ({result['duration_s']}초), 오류 {result['errors']}개")
+    print(f"지연(ms): p50 {latency['p50']}  p95 {latency['p95']}  p99 {latency['p99']}  평균 {latency['mean']}  최대 {latency['max']}")
+    print("요청당 업스트림 호출: " + ", ".join(f"{endpoint} {count}" for endpoint, count in result["upstream_calls_per_request"].items()))
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """기준 결과와 비교해 표를 출력하고, 기준을 넘은 회귀 항목을 반환합니다."""
+    # (이름, 값을 꺼내는 함수, 클수록 나쁜지)
+    metrics = [
+        ("p50 (ms)", lambda r: r["latency_ms"]["p50"], True),
+        ("p95 (ms)", lambda r: r["latency_ms"]["p95"], True),
+        ("p99 (ms)", lambda r: r["latency_ms"]["p99"], True),
+        ("rps", lambda r: r["rps"], False),
+        ("upstream/req", lambda r: r["upstream_calls_per_request"]["total"], True),
+        ("errors", lambda r: r["errors"], True)
+    ]
+    gated = {"p95 (ms)", "p99 (ms)", "rps", "upstream/req"}
+    regressions = []
+    print(f"{'지표':<14}{'기준':>12}{'현재':>12}{'변화':>10}")
+    for name, get_value, higher_is_worse in metrics:
+        before, after = get_value(baseline), get_value(current)
+        change = (after - before) / before if before else 0.0
+        print(f"{name:<14}{before:>12}{after:>12}{change:>+10.1%}")
+        worse = change > threshold if higher_is_worse else change < -threshold
+        if name in gated and worse:
+            regressions.append(f"{name}: {before} -> {after} ({change:+.1%})")
+    if baseline["config"] != current["config"]:
+        print("주의: 기준과 실행 설정이 다릅니다.")
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MCP 도구 부하 테스트 (스텁 업스트림 사용)")
+    parser.add_argument("--tool", choices=["find_restaurants", "recommend_random_restaurant", "mixed"], default="mixed")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--cold", action="store_true", help="호출마다 메모리 캐시를 비웁니다")
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--jitter-ms", type=float, default=10)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--pages", type=int, default=1)
+    parser.add_argument("--page-token-delay", type=float, default=0, help="next_page_token 대기 시간 (초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--url", help="실행 중인 서버의 streamable HTTP 엔드포인트 (예: http://127.0.0.1:8000/mcp)")
+    parser.add_argument("--stub-url", help="--url 사용 시 요청당 업스트림 호출 수를 읽어 올 스텁 서버 주소")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--compare", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=0.1, help="회귀로 볼 변화율 (기본 10%%)")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    print_report(result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, result, args.threshold)
+        if regressions:
+            print("성능 회귀:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""업스트림 API 스텁 서버
+
+ipify, IP2Location.io, ip-api.com, Google Geocoding/Places(nearbysearch, details) API를 흉내 내는
+로컬 aiohttp 서버입니다. 응답 지연, 오류율, nearbysearch 페이지 수를 설정할 수 있으며,
+엔드포인트별 호출 수를 셉니다(GET /_stats로 조회, POST /_reset으로 초기화).
+벤치마크가 Google 할당량을 쓰지 않도록 Config의 기본 URL을 이 서버로 바꿔 사용합니다.
+
+단독 실행:
+    python -m benchmarks.stub_upstreams --port 8900 --latency-ms 50 --error-rate 0.01
+"""
+import argparse
+import asyncio
+import hashlib
+import random
+from collections import Counter
+from typing import Any, Dict, List
+
+from aiohttp import web
+
+from maat_mcp.config import Config
+
+# 결과 한 페이지의 장소 수 (Places API와 같음)
+PAGE_SIZE = 20
+
+class StubUpstreams:
+    """업스트림 API 스텁 서버
+
+    Args:
+        latency_ms (float): 응답 평균 지연 (밀리초)
+        jitter_ms (float): 지연의 표준편차 (밀리초)
+        error_rate (float): HTTP 500으로 응답할 확률 (0~1)
+        pages (int): nearbysearch 결과 페이지 수
+        seed (int): 지연/오류 난수 시드
+    """
+
+    def __init__(self, latency_ms: float = 50, jitter_ms: float = 10, error_rate: float = 0.0, pages: int = 1, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.pages = pages
+        self.calls: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._runner = None
+        self.base_url = ""
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """서버를 시작하고 기본 URL을 반환합니다. port가 0이면 빈 포트를 사용합니다."""
+        app = web.Application()
+        app.router.add_get("/ipify", self._ipify)
+        app.router.add_get("/ip2location", self._ip2location)
+        app.router.add_get("/ip-api/{ip}", self._ip_api)
+        app.router.add_get("/maps/api/geocode/json", self._geocode)
+        app.router.add_get("/maps/api/place/nearbysearch/json", self._nearbysearch)
+        app.router.add_get("/maps/api/place/details/json", self._details)
+        app.router.add_get("/_stats", self._stats)
+        app.router.add_post("/_reset", self._reset)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{port}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        """서버를 종료합니다."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def configure(self) -> None:
+        """Config의 업스트림 URL과 API 키를 이 서버로 바꿉니다."""
+        Config.IPIFY_URL = f"{self.base_url}/ipify?format=json"
+        Config.IPLOCATION_BASE_URL = f"{self.base_url}/ip2location?ip="
+        Config.IP_API_BASE_URL = f"{self.base_url}/ip-api/"
+        Config.GOOGLE_MAPS_BASE_URL = f"{self.base_url}/maps/api"
+        Config.GOOGLE_MAPS_API_KEY = Config.GOOGLE_MAPS_API_KEY or "stub-key"
+
+    async def _delay(self, endpoint: str) -> bool:
+        """지연을 적용하고 호출 수를 셉니다. 오류로 응답해야 하면 True를 반환합니다."""
+        self.calls[endpoint] += 1
+        delay = max(0.0, self._rng.gauss(self.latency_ms, self.jitter_ms)) / 1000
+        if delay:
+            await asyncio.sleep(delay)
+        return self._rng.random() < self.error_rate
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response(dict(self.calls))
+
+    async def _reset(self, request: web.Request) -> web.Response:
+        self.calls.clear()
+        return web.json_response({})
+
+    async def _ipify(self, request: web.Request) -> web.Response:
+        if await self._delay("ipify"):
+            return web.Response(status=500)
+        return web.json_response({"ip": "203.0.113.10"})
+
+    async def _ip2location(self, request: web.Request) -> web.Response:
+        if await self._delay("ip2location"):
+            return web.Response(status=500)
+        return web.json_response({
+            "ip": request.query.get("ip", ""),
+            "latitude": 37.4979,
+            "longitude": 127.0276,
+            "city_name": "Seoul",
+            "country_name": "Korea (Republic of)"
+        })
+
+    async def _ip_api(self, request: web.Request) -> web.Response:
+        if await self._delay("ip_api"):
+            return web.Response(status=500)
+        return web.json_response({
+            "status": "success",
+            "lat": 37.4979,
+            "lon": 127.0276,
+            "city": "Seoul",
+            "country": "South Korea"
+        })
+
+    async def _geocode(self, request: web.Request) -> web.Response:
+        if await self._delay("geocode"):
+            return web.Response(status=500)
+        rng = _seeded(request.query.get("address", ""))
+        lat, lng = 37.4 + rng.random() * 0.3, 126.8 + rng.random() * 0.4
+        return web.json_response({
+            "status": "OK",
+            "results": [{
+                "geometry": {
+                    "location": {"lat": lat, "lng": lng},
+                    "viewport": {
+                        "northeast": {"lat": lat + 0.01, "lng": lng + 0.01},
+                        "southwest": {"lat": lat - 0.01, "lng": lng - 0.01}
+                    }
+                }
+            }]
+        })
+
+    async def _nearbysearch(self, request: web.Request) -> web.Response:
+        if await self._delay("nearbysearch"):
+            return web.Response(status=500)
+        page_token = request.query.get("pagetoken")
+        if page_token:
+            search_key, page = page_token.rsplit(":", 1)
+            page = int(page)
+        else:
+            search_key = f"{request.query.get('location', '')}|{request.query.get('keyword', '')}"
+            page = 0
+
+        response: Dict[str, Any] = {"status": "OK", "results": _places(search_key, page)}
+        if page + 1 < self.pages:
+            response["next_page_token"] = f"{search_key}:{page + 1}"
+        return web.json_response(response)
+
+    async def _details(self, request: web.Request) -> web.Response:
+        if await self._delay("details"):
+            return web.Response(status=500)
+        place_id = request.query.get("place_id", "")
+        rng = _seeded(place_id)
+        return web.json_response({
+            "status": "OK",
+            "result": {
+                "place_id": place_id,
+                "formatted_phone_number": f"02-{rng.randint(100, 9999)}-{rng.randint(1000, 9999)}",
+                "opening_hours": {"weekday_text": [f"{day}: 오전 11:00~오후 10:00" for day in "월화수목금토일"]},
+                "price_level": rng.randint(1, 4),
+                "website": f"https://example.com/{place_id}"
+            }
+        })
+
+def _seeded(key: str) -> random.Random:
+    """키마다 항상 같은 결과를 내는 난수 생성기를 반환합니다."""
+    return random.Random(int(hashlib.md5(key.encode("utf-8")).hexdigest()[:8], 16))
+
+def _places(search_key: str, page: int) -> List[Dict[str, Any]]:
+    """검색 조건과 페이지마다 고정된 가상 장소 목록을 만듭니다."""
+    rng = _seeded(f"{search_key}:{page}")
+    location = search_key.split("|", 1)[0] or "37.5,127.0"
+    lat, lng = (float(value) for value in location.split(","))
+    places = []
+    for index in range(PAGE_SIZE):
+        place_id = f"stub-{hashlib.md5(f'{search_key}:{page}:{index}'.encode('utf-8')).hexdigest()[:16]}"
+        places.append({
+            "name": f"스텁 식당 {page * PAGE_SIZE + index + 1}",
+            "vicinity": "서울특별시 어딘가",
+            "rating": round(rng.uniform(3.0, 5.0), 1),
+            "user_ratings_total": rng.randint(0, 3000),
+            "types": ["restaurant", "food", "point_of_interest", "establishment"],
+            "place_id": place_id,
+            "geometry": {"location": {"lat": lat + rng.uniform(-0.005, 0.005), "lng": lng + rng.uniform(-0.005, 0.005)}}
+        })
+    return places
+
+async def _serve(args: argparse.Namespace) -> None:
+    stub = StubUpstreams(args.latency_ms, args.jitter_ms, args.error_rate, args.pages)
+    base_url = await stub.start(args.host, args.port)
+    print(f"스텁 업스트림 서버 실행 중: {base_url}")
+    print("환경 변수 예시:")
+    print(f"  IPIFY_URL={base_url}/ipify?format=json")
+    print(f"  IPLOCATION_BASE_URL={base_url}/ip2location?ip=")
+    print(f"  IP_API_BASE_URL={base_url}/ip-api/")
+    print(f"  GOOGLE_MAPS_BASE_URL={base_url}/maps/api")
+    print("  GOOGLE_MAPS_API_KEY=stub-key")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await stub.stop()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="업스트림 API 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--jitter-ms", type=float, default=10)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--pages", type=int, default=1)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,31 @@ from maat_mcp.api.google_maps_api import GoogleMapsApi
 from maat_mcp.api.ip_location_api import IpLocationApi
 
 # 핸들러
-from maat_mcp.handlers.service_implementation import find_restaurants, find_random_restaurant
-from maat_mcp.handlers.google_maps_api_handler import get_restaurants_from_google_maps
-from maat_mcp.handlers.ip_location_api_handler import get_ip_location_info
+from maat_mcp.handlers.service_implementation import (
+    find_restaurants,
+    find_restaurants_batch,
+    find_random_restaurant
+)
+from maat_mcp.handlers.google_maps_api_handler import (
+    get_restaurants_from_google_maps,
+    search_restaurants,
+    recommend_restaurant,
+    recommend_restaurants,
+    iter_restaurant_pages_from_google_maps,
+    iter_restaurants_from_google_maps,
+    get_restaurant_cache_stats,
+    get_place_index_stats,
+    get_location_from_google_maps,
+    get_geocode_cache_stats,
+    get_candidate_pool_stats,
+    get_refresh_stats,
+    get_details_cache_stats,
+    get_place_details_batch,
+    refresh_popular_searches
+)
+from maat_mcp.handlers.region_location_handler import get_region_location
+from maat_mcp.handlers.ip_location_api_handler import client_context, get_ip_location_info, get_ip_location_cache_stats
+from maat_mcp.handlers.resource_snapshot import ResourceSnapshot, restaurant_results_snapshot
 
 # 유틸리티
 from maat_mcp.util import process_search_query, has_region_info
@@ -19,9 +41,29 @@ __all__ = [
     
     # 핸들러
     'find_restaurants',
+    'find_restaurants_batch',
     'find_random_restaurant',
     'get_restaurants_from_google_maps',
+    'search_restaurants',
+    'recommend_restaurant',
+    'recommend_restaurants',
+    'iter_restaurant_pages_from_google_maps',
+    'iter_restaurants_from_google_maps',
+    'get_restaurant_cache_stats',
+    'get_place_index_stats',
+    'get_location_from_google_maps',
+    'get_geocode_cache_stats',
+    'get_candidate_pool_stats',
+    'get_refresh_stats',
+    'get_details_cache_stats',
+    'get_place_details_batch',
+    'refresh_popular_searches',
+    'get_region_location',
+    'client_context',
+    'ResourceSnapshot',
+    'restaurant_results_snapshot',
     'get_ip_location_info',
+    'get_ip_location_cache_stats',
     
     # 유틸리티
     'process_search_query',
@@ -1,12 +1,67 @@
+import asyncio
 import logging
-from typing import Dict, Any
-from maat_mcp.api.http import HttpClient
+import aiohttp
+from typing import Dict, Any, AsyncIterator
+from maat_mcp.api.http import HttpClient, HttpRequestError
 from maat_mcp.config import Config
+from maat_mcp.util.rate_limiter import get_rate_limiter
+from maat_mcp.util.resilience import backoff_delay, remaining_budget
+from maat_mcp.util.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# 같은 요청의 속도 제한 대기와 OVER_QUERY_LIMIT 처리를 한 번만 하도록 합칩니다.
+_single_flight = SingleFlight()
+
 class GoogleMapsApi:
     """Google Maps API 요청을 처리하는 클라이언트 클래스입니다."""
+
+    @staticmethod
+    async def _get(endpoint: str, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """엔드포인트별 호출 속도 제한을 지켜 요청합니다.
+
+        호출 차례는 현재 우선순위(도구 호출 > 백그라운드 갱신)에 따라 대기열에서 기다리며,
+        OVER_QUERY_LIMIT 응답을 받으면 해당 엔드포인트의 호출 속도를 낮추고, HTTP 오류와 함께 Config.MAX_RETRIES회까지
+        다시 요청합니다. 다시 요청할 때도 토큰을 하나씩 씁니다.
+        같은 요청이 동시에 들어오면 대기와 재요청을 한 번만 하므로, 응답 하나에 속도를 한 번만 낮춥니다.
+        """
+        key = (url, tuple(sorted((k, str(v)) for k, v in params.items())))
+        return await _single_flight.do(key, lambda: GoogleMapsApi._get_limited(endpoint, url, params))
+
+    @staticmethod
+    async def _get_limited(endpoint: str, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """호출 차례를 기다려 요청합니다. 다시 요청할 때마다 차례를 다시 기다립니다.
+
+        HttpClient의 재시도는 호출 속도 제한을 거치지 않으므로 끄고, 여기서 Config.MAX_RETRIES회까지 다시 요청합니다.
+        OVER_QUERY_LIMIT 응답이나 HTTP 429를 받으면 속도를 낮추고, 5xx, 시간 초과, 연결 오류는 지수 백오프 후 다시 요청합니다.
+        """
+        limiter = get_rate_limiter(endpoint)
+        for attempt in range(Config.MAX_RETRIES + 1):
+            await limiter.acquire()
+            try:
+                response = await HttpClient.get(url, params, retries=0)
+            except (aiohttp.ClientError, asyncio.TimeoutError, HttpRequestError) as e:
+                rate_limited = isinstance(e, HttpRequestError) and e.status == 429
+                if isinstance(e, HttpRequestError) and not e.retryable:
+                    raise
+                if rate_limited:
+                    # 멈춤 시간은 호출 차례를 기다리며 지키므로 따로 기다리지 않습니다.
+                    limiter.penalize()
+                delay = 0.0 if rate_limited else backoff_delay(attempt)
+                remaining = remaining_budget()
+                if attempt == Config.MAX_RETRIES or (remaining is not None and delay >= remaining):
+                    raise
+                logger.warning(
+                    "%s 요청 실패, %.2f초 후 다시 요청합니다 (%d/%d): %r",
+                    endpoint, delay, attempt + 1, Config.MAX_RETRIES, e
+                )
+                await asyncio.sleep(delay)
+                continue
+            if response.get("status") != "OVER_QUERY_LIMIT":
+                limiter.record_success()
+                return response
+            limiter.penalize()
+        return response
     
     @staticmethod
     async def get_location_by_name(location_name: str) -> Dict[str, Any]:
@@ -16,24 +71,83 @@ class GoogleMapsApi:
             "address": location_name,
             "key": Config.get_google_api_key()
         }
-        logger.debug(f"위치 정보 조회 요청: {location_name}")
-        response = await HttpClient.get(url, params)
-        logger.debug(f"위치 정보 조회 응답: {response}")
+        logger.debug("위치 정보 조회 요청: %s", location_name)
+        response = await GoogleMapsApi._get("geocode", url, params)
+        logger.debug("위치 정보 조회 응답: %s (%d건)", response.get("status"), len(response.get("results", ())))
         return response
     
     @staticmethod
-    async def get_restaurants(latitude: float, longitude: float, search_query: str = None) -> Dict[str, Any]:
-        """위치 기반으로 맛집 정보를 조회합니다."""
+    async def get_restaurants(latitude: float, longitude: float, search_query: str = None, radius: int = None, page_token: str = None) -> Dict[str, Any]:
+        """위치 기반으로 맛집 정보를 조회합니다. page_token이 있으면 다음 페이지를 조회합니다."""
         search_query = search_query or Config.DEFAULT_SEARCH_QUERY
         url = f"{Config.get_google_maps_base_url()}/place/nearbysearch/json"
+        if page_token:
+            params = {
+                "pagetoken": page_token,
+                "key": Config.get_google_api_key()
+            }
+        else:
+            params = {
+                "location": f"{latitude},{longitude}",
+                "radius": radius or Config.SEARCH_RADIUS,
+                "type": "restaurant",
+                "keyword": search_query,
+                "key": Config.get_google_api_key()
+            }
+        logger.debug("맛집 정보 조회 요청: %s (%s, %s) 페이지 토큰: %s", search_query, latitude, longitude, page_token is not None)
+        response = await GoogleMapsApi._get("nearbysearch", url, params)
+        logger.debug("맛집 정보 조회 응답: %s (%d건)", response.get("status"), len(response.get("results", ())))
+        return response
+
+    @staticmethod
+    async def get_place_details(place_id: str) -> Dict[str, Any]:
+        """장소의 상세 정보(Config.DETAILS_FIELDS)를 조회합니다."""
+        url = f"{Config.get_google_maps_base_url()}/place/details/json"
         params = {
-            "location": f"{latitude},{longitude}",
-            "radius": Config.SEARCH_RADIUS,
-            "type": "restaurant",
-            "keyword": search_query,
+            "place_id": place_id,
+            "fields": Config.DETAILS_FIELDS,
             "key": Config.get_google_api_key()
         }
-        logger.debug(f"맛집 정보 조회 요청: {search_query} ({latitude}, {longitude})")
-        response = await HttpClient.get(url, params)
-        logger.debug(f"맛집 정보 조회 응답: {response}")
-        return response 
\ No newline at end of file
+        logger.debug("장소 상세 정보 조회 요청: %s", place_id)
+        response = await GoogleMapsApi._get("details", url, params)
+        logger.debug("장소 상세 정보 조회 응답: %s", response.get("status"))
+        return response
+
+    @staticmethod
+    async def iter_restaurant_pages(latitude: float, longitude: float, search_query: str = None, radius: int = None, max_pages: int = None) -> AsyncIterator[Dict[str, Any]]:
+        """주변 검색 결과를 페이지 단위로 순서대로 반환합니다.
+
+        다음 페이지는 호출자가 이전 페이지를 모두 소비하고 다음 값을 요청할 때만 조회합니다.
+        next_page_token은 발급 직후 잠시 동안 유효하지 않으므로 Config.PAGE_TOKEN_DELAY만큼
+        기다린 뒤 조회하고, INVALID_REQUEST가 오면 한 번 더 기다려 재시도합니다.
+        남은 지연 시간 예산으로 대기와 조회를 마칠 수 없으면 다음 페이지를 조회하지 않습니다.
+
+        Args:
+            latitude (float): 위도
+            longitude (float): 경도
+            search_query (str, optional): 검색어
+            radius (int, optional): 검색 반경 (미터)
+            max_pages (int, optional): 최대 페이지 수, 없으면 Config.MAX_SEARCH_PAGES
+
+        Yields:
+            Dict[str, Any]: nearbysearch 응답 (페이지별)
+        """
+        max_pages = max_pages or Config.MAX_SEARCH_PAGES
+        response = await GoogleMapsApi.get_restaurants(latitude, longitude, search_query, radius)
+        yield response
+
+        for _ in range(max_pages - 1):
+            page_token = response.get("next_page_token")
+            if response.get("status") != "OK" or not page_token:
+                return
+            remaining = remaining_budget()
+            if remaining is not None and remaining <= Config.PAGE_TOKEN_DELAY * 2:
+                logger.info("지연 시간 예산이 부족해 다음 페이지를 조회하지 않습니다 (남은 시간 %.1f초)", remaining)
+                return
+
+            for _ in range(2):
+                await asyncio.sleep(Config.PAGE_TOKEN_DELAY)
+                response = await GoogleMapsApi.get_restaurants(latitude, longitude, search_query, radius, page_token)
+                if response.get("status") != "INVALID_REQUEST":
+                    break
+            yield response
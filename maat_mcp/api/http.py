@@ -1,37 +1,206 @@
+import asyncio
 import logging
 import aiohttp
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Set
+from urllib.parse import urlsplit
 from maat_mcp.config import Config
+from maat_mcp.util.metrics import UPSTREAM_DURATION, UPSTREAM_ERRORS, UPSTREAM_IN_FLIGHT, UPSTREAM_RESPONSES
+from maat_mcp.util.resilience import (
+    BudgetExceededError,
+    CircuitOpenError,
+    backoff_delay,
+    get_circuit_breaker,
+    record_upstream_call,
+    remaining_budget
+)
+from maat_mcp.util.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+class HttpRequestError(Exception):
+    """HTTP 응답 상태 코드가 200이 아닐 때 발생합니다."""
+
+    def __init__(self, status: int):
+        super().__init__(f"HTTP 요청 실패: {status}")
+        self.status = status
+
+    @property
+    def retryable(self) -> bool:
+        """재시도할 만한 오류(5xx, 429)인지 여부"""
+        return self.status >= 500 or self.status == 429
+
 class HttpClient:
-    """HTTP 요청을 처리하는 클라이언트 클래스"""
-    
-    @staticmethod
-    async def get(url: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+    """HTTP 요청을 처리하는 클라이언트 클래스
+
+    프로세스 전체에서 하나의 aiohttp 세션(커넥션 풀)을 공유합니다.
+    서버 lifespan에서 open()/close()로 관리하며, lifespan 밖에서 호출되면
+    첫 요청 시 세션을 생성합니다.
+    """
+
+    _session: Optional[aiohttp.ClientSession] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _users: int = 0
+    _single_flight = SingleFlight()
+    # 다른 이벤트 루프의 세션을 닫는 작업 (끝나기 전에 사라지지 않도록 보관)
+    _closing: Set[Any] = set()
+
+    @classmethod
+    def _create_session(cls) -> aiohttp.ClientSession:
+        """커넥션 풀 설정이 적용된 세션을 생성합니다."""
+        connector = aiohttp.TCPConnector(
+            limit=Config.HTTP_POOL_LIMIT,
+            limit_per_host=Config.HTTP_POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=Config.HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=Config.HTTP_KEEPALIVE_TIMEOUT
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=Config.REQUEST_TIMEOUT,
+            connect=Config.HTTP_CONNECT_TIMEOUT
+        )
+        cls._loop = asyncio.get_running_loop()
+        logger.info("HTTP 커넥션 풀을 생성합니다.")
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    @classmethod
+    def get_session(cls) -> aiohttp.ClientSession:
+        """공유 세션을 반환합니다. 세션이 없거나 닫힌 경우 새로 생성합니다.
+
+        다른 이벤트 루프에서 만든 세션은 이 루프에서 쓸 수 없으므로 닫고 새로 생성합니다.
+        """
+        if cls._session is not None and not cls._session.closed and cls._loop is not asyncio.get_running_loop():
+            cls._discard_session()
+        if cls._session is None or cls._session.closed:
+            cls._session = cls._create_session()
+        return cls._session
+
+    @classmethod
+    def _discard_session(cls) -> Any:
+        """다른 이벤트 루프에서 만든 세션을 닫습니다.
+
+        연결은 세션을 만든 루프에 묶여 있으므로 그 루프가 살아 있으면 그 루프에서 닫고
+        (멈춰 있으면 다시 돌 때 닫힘), 이미 닫힌 루프의 세션은 현재 루프에서 닫습니다.
+        닫는 작업(Future)을 반환합니다.
+        """
+        session, loop = cls._session, cls._loop
+        cls._session = None
+        logger.warning("다른 이벤트 루프에서 만든 HTTP 커넥션 풀을 닫습니다.")
+        if loop is not None and not loop.is_closed():
+            future = asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            future = asyncio.get_running_loop().create_task(session.close())
+        cls._closing.add(future)
+        future.add_done_callback(cls._closing.discard)
+        return future
+
+    @classmethod
+    async def open(cls) -> None:
+        """공유 세션 사용을 시작합니다.
+
+        lifespan은 연결(세션)마다 실행될 수 있으므로 참조 카운트로 관리합니다.
+        """
+        cls._users += 1
+        cls.get_session()
+
+    @classmethod
+    async def close(cls) -> None:
+        """공유 세션 사용을 종료합니다. 마지막 사용자가 종료하면 세션을 닫습니다."""
+        cls._users = max(cls._users - 1, 0)
+        if cls._users == 0 and cls._session is not None:
+            if cls._session.closed:
+                cls._session = None
+            elif cls._loop is not asyncio.get_running_loop():
+                closing = cls._discard_session()
+                if isinstance(closing, asyncio.Task):
+                    await closing
+            else:
+                session, cls._session = cls._session, None
+                await session.close()
+            logger.info("HTTP 커넥션 풀을 종료했습니다.")
+
+    @classmethod
+    async def get(cls, url: str, params: Dict[str, Any] = None, retries: int = None) -> Dict[str, Any]:
         """GET 요청을 수행합니다.
-        
+
+        같은 URL과 파라미터로 동시에 들어온 요청은 하나의 업스트림 요청을 공유합니다.
+        시간 초과, 연결 오류, 5xx/429 응답은 지수 백오프(jitter 포함)로 재시도하며,
+        각 시도의 제한 시간과 재시도 여부는 남은 지연 시간 예산을 넘지 않습니다.
+        호스트(제공자)별 회로 차단기가 열려 있으면 요청 없이 즉시 실패합니다.
+
         Args:
             url (str): 요청 URL
             params (Dict[str, Any], optional): 쿼리 파라미터
-            
+            retries (int, optional): 최대 재시도 횟수, 없으면 Config.MAX_RETRIES
+
         Returns:
             Dict[str, Any]: 응답 데이터
-            
+
         Raises:
             Exception: 요청 실패 시
         """
+        key = (url, tuple(sorted((k, str(v)) for k, v in (params or {}).items())))
+        retries = Config.MAX_RETRIES if retries is None else retries
+        return await cls._single_flight.do(key, lambda: cls._get(url, params, retries))
+
+    @classmethod
+    async def _get(cls, url: str, params: Optional[Dict[str, Any]], retries: int) -> Dict[str, Any]:
+        """재시도와 회로 차단기를 적용해 GET 요청을 수행합니다."""
+        provider = urlsplit(url).netloc
+        breaker = get_circuit_breaker(provider)
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=Config.REQUEST_TIMEOUT
-                ) as response:
-                    if response.status != 200:
-                        raise Exception(f"HTTP 요청 실패: {response.status}")
-                    return await response.json()
+            for attempt in range(retries + 1):
+                if not breaker.allow_request():
+                    UPSTREAM_ERRORS.inc(provider, CircuitOpenError.__name__)
+                    raise CircuitOpenError(f"{provider} 회로 차단기가 열려 있어 요청하지 않았습니다.")
+
+                timeout = Config.REQUEST_TIMEOUT
+                remaining = remaining_budget()
+                if remaining is not None:
+                    if remaining <= 0:
+                        breaker.abandon()
+                        raise BudgetExceededError("요청 지연 시간 예산을 모두 사용했습니다.")
+                    timeout = min(timeout, remaining)
+
+                record_upstream_call()
+                try:
+                    response = await cls._request(url, params, timeout, provider)
+                except asyncio.CancelledError:
+                    breaker.abandon()
+                    raise
+                except (aiohttp.ClientError, asyncio.TimeoutError, HttpRequestError) as e:
+                    UPSTREAM_ERRORS.inc(provider, type(e).__name__)
+                    retryable = not isinstance(e, HttpRequestError) or e.retryable
+                    if retryable:
+                        breaker.record_failure()
+                    else:
+                        # 4xx는 제공자 장애가 아니므로 차단기에는 성공으로 기록합니다.
+                        breaker.record_success()
+
+                    delay = backoff_delay(attempt)
+                    remaining = remaining_budget()
+                    if not retryable or attempt == retries or (remaining is not None and delay >= remaining):
+                        raise
+                    logger.warning(
+                        "HTTP 요청 실패, %.2f초 후 재시도합니다 (%d/%d): %s %r",
+                        delay, attempt + 1, retries, provider, e
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    breaker.record_success()
+                    return response
         except Exception as e:
-            logger.error(f"HTTP 요청 중 에러 발생: {str(e)}")
-            raise 
\ No newline at end of file
+            logger.error(f"HTTP 요청 중 에러 발생: {str(e) or type(e).__name__}")
+            raise
+
+    @classmethod
+    async def _request(cls, url: str, params: Optional[Dict[str, Any]], timeout: float, provider: str) -> Dict[str, Any]:
+        """한 번의 GET 요청을 수행하고 처리 시간과 상태 코드를 기록합니다."""
+        with UPSTREAM_IN_FLIGHT.track(provider), UPSTREAM_DURATION.time(provider):
+            async with cls.get_session().get(
+                url,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=timeout, connect=Config.HTTP_CONNECT_TIMEOUT)
+            ) as response:
+                UPSTREAM_RESPONSES.inc(provider, str(response.status))
+                if response.status != 200:
+                    raise HttpRequestError(response.status)
+                return await response.json()
@@ -2,14 +2,36 @@ import logging
 from typing import Dict, Any, Optional
 from maat_mcp.api.http import HttpClient
 from maat_mcp.config import Config
+from maat_mcp.util.ip_range_db import IpRangeDatabase
+from maat_mcp.util.resilience import first_successful
 
 logger = logging.getLogger(__name__)
 
 class IpLocationApi:
-    """IP 기반 위치 정보를 조회하는 클라이언트"""
+    """IP 기반 위치 정보를 조회하는 클라이언트
+
+    Config.IP_DATABASE_PATH가 설정되면 로컬 IP 대역 데이터베이스를 먼저 조회하고,
+    없는 IP만 원격 API로 조회합니다. 원격 조회는 IP2Location.io에 먼저 요청하고,
+    Config.HEDGE_DELAY 안에 응답이 없거나 실패하면 ip-api.com에도 요청해 먼저 성공한 결과를 사용합니다.
+    """
+
+    _local_db: Optional[IpRangeDatabase] = None
+    _local_db_failed: bool = False
+
+    @classmethod
+    def get_local_database(cls) -> Optional[IpRangeDatabase]:
+        """로컬 IP 대역 데이터베이스를 반환합니다. 설정되지 않았거나 열 수 없으면 None을 반환합니다."""
+        if cls._local_db is None and Config.IP_DATABASE_PATH and not cls._local_db_failed:
+            try:
+                cls._local_db = IpRangeDatabase(Config.IP_DATABASE_PATH)
+                logger.info("로컬 IP 대역 데이터베이스 로드: %d개 대역", len(cls._local_db))
+            except (OSError, ValueError) as e:
+                cls._local_db_failed = True
+                logger.warning(f"로컬 IP 대역 데이터베이스를 열 수 없습니다: {str(e)}")
+        return cls._local_db
     
-    @staticmethod
-    async def get_location_info(client_ip: Optional[str] = None) -> Dict[str, Any]:
+    @classmethod
+    async def get_location_info(cls, client_ip: Optional[str] = None) -> Dict[str, Any]:
         """IP 기반으로 위치 정보를 조회합니다.
         
         Args:
@@ -24,31 +46,47 @@ class IpLocationApi:
         try:
             # IP 주소가 없는 경우 현재 IP 사용
             if not client_ip:
-                client_ip = (await HttpClient.get("https://api.ipify.org?format=json"))["ip"]
+                client_ip = (await HttpClient.get(Config.IPIFY_URL))["ip"]
 
-            # IP2Location.io API 호출
-            response = await HttpClient.get(f"https://api.ip2location.io/?ip={client_ip}")
-            
-            if not response:
-                # IP2Location API 실패 시 ip-api.com으로 폴백
-                location_data = await HttpClient.get(f"http://ip-api.com/json/{client_ip}")
-                
-                if location_data["status"] != "success":
-                    raise Exception("위치 정보를 가져올 수 없습니다.")
-                
-                return {
-                    "latitude": location_data["lat"],
-                    "longitude": location_data["lon"],
-                    "city": location_data["city"],
-                    "country": location_data["country"]
-                }
-            
-            return {
-                "latitude": float(response["latitude"]),
-                "longitude": float(response["longitude"]),
-                "city": response["city_name"],
-                "country": response["country_name"]
-            }
+            # 로컬 데이터베이스 조회 (없는 IP만 원격 API로 폴백)
+            local_db = cls.get_local_database()
+            if local_db is not None:
+                location = local_db.lookup(client_ip)
+                if location is not None:
+                    return location
+
+            # 헤지 요청이 재시도를 대신하므로 제공자별 재시도는 하지 않습니다.
+            return await first_successful([
+                lambda: cls._query_ip2location(client_ip),
+                lambda: cls._query_ip_api(client_ip)
+            ])
         except Exception as e:
             logger.error(f"IP 위치 정보 조회 중 에러 발생: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    @staticmethod
+    async def _query_ip2location(client_ip: str) -> Dict[str, Any]:
+        """IP2Location.io API로 위치 정보를 조회합니다."""
+        params = {"key": Config.IPLOCATION_API_KEY} if Config.IPLOCATION_API_KEY else None
+        response = await HttpClient.get(f"{Config.get_iplocation_base_url()}{client_ip}", params, retries=0)
+        if not response or "latitude" not in response:
+            raise Exception("IP2Location.io에서 위치 정보를 가져올 수 없습니다.")
+        return {
+            "latitude": float(response["latitude"]),
+            "longitude": float(response["longitude"]),
+            "city": response["city_name"],
+            "country": response["country_name"]
+        }
+
+    @staticmethod
+    async def _query_ip_api(client_ip: str) -> Dict[str, Any]:
+        """ip-api.com으로 위치 정보를 조회합니다."""
+        location_data = await HttpClient.get(f"{Config.IP_API_BASE_URL}{client_ip}", retries=0)
+        if location_data.get("status") != "success":
+            raise Exception("위치 정보를 가져올 수 없습니다.")
+        return {
+            "latitude": location_data["lat"],
+            "longitude": location_data["lon"],
+            "city": location_data["city"],
+            "country": location_data["country"]
+        }
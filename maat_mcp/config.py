@@ -15,20 +15,109 @@ class Config:
     
     # 평점 기준
     RATING_THRESHOLDS = [4.5, 4.0, 3.8]
+
+    # 가중 평점 정렬 설정 (리뷰가 적은 곳은 기본 평점 쪽으로 보정)
+    RANKING_PRIOR_RATING = 4.0
+    RANKING_PRIOR_COUNT = 50
+    
+    # 서버 설정
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))  # 워커 프로세스 수
+    # 상태 없는 streamable HTTP (요청마다 독립 처리, 여러 워커 중 아무 워커나 처리 가능)
+    MCP_STATELESS_HTTP = os.getenv("MCP_STATELESS_HTTP", "true" if WEB_CONCURRENCY > 1 else "false").lower() == "true"
+    
+    # X-Forwarded-For를 믿을 프록시 (쉼표로 구분한 IP/CIDR, 이 주소에서 온 요청만 헤더의 클라이언트 IP를 사용)
+    TRUSTED_PROXIES = os.getenv("TRUSTED_PROXIES", "127.0.0.1/32,::1/128")
     
     # API 기본 URL
-    GOOGLE_MAPS_BASE_URL = "https://maps.googleapis.com/maps/api"
-    IPLOCATION_BASE_URL = "https://api.ip2location.io/?ip="
+    GOOGLE_MAPS_BASE_URL = os.getenv("GOOGLE_MAPS_BASE_URL", "https://maps.googleapis.com/maps/api")
+    IPLOCATION_BASE_URL = os.getenv("IPLOCATION_BASE_URL", "https://api.ip2location.io/?ip=")
+    IP_API_BASE_URL = os.getenv("IP_API_BASE_URL", "http://ip-api.com/json/")
+    IPIFY_URL = os.getenv("IPIFY_URL", "https://api.ipify.org?format=json")
+
+    # 로컬 IP 대역 데이터베이스 경로 (python -m maat_mcp.util.ip_range_db 로 생성, 비어 있으면 사용 안 함)
+    IP_DATABASE_PATH = os.getenv("IP_DATABASE_PATH", "")
 
     # 검색 설정
     SEARCH_RADIUS = "1000"  # 미터 단위
+    MAX_SEARCH_RADIUS = 50000  # Places API 최대 반경 (미터)
+    MAX_SEARCH_PAGES = 3  # nearbysearch 최대 페이지 수 (페이지당 최대 20개, API 한도 3페이지)
+    NEARBY_API_MAX_PAGES = 3  # nearbysearch가 반환하는 최대 페이지 수 (마지막 페이지에는 next_page_token이 없음)
+    NEARBY_API_MAX_RESULTS = 60  # nearbysearch가 반환하는 최대 결과 수, 이만큼 받았으면 범위 안의 장소가 더 있을 수 있음
+    PAGE_TOKEN_DELAY = 2  # 초, next_page_token이 유효해질 때까지 대기
+    BATCH_MAX_QUERIES = 10  # 일괄 검색 한 번에 받을 수 있는 검색어 수
+    BATCH_CONCURRENCY = 4  # 일괄 검색에서 동시에 실행할 주변 검색 수
+    TARGET_RESULT_COUNT = 5  # 최고 평점 기준을 넘는 맛집이 이만큼 모이면 다음 페이지를 조회하지 않음
+    SEARCH_FANOUT = os.getenv("SEARCH_FANOUT", "true").lower() == "true"  # "카페 디저트" 같은 검색어를 구체적인 검색어로 나눠 동시에 검색
+    FANOUT_MAX_PLACES = 300  # 나눠 검색한 결과를 합칠 때 보관하는 최대 장소 수
+
+    # 장소 상세 정보 설정 (영업시간, 전화번호, 가격대)
+    DETAILS_FIELDS = "place_id,formatted_phone_number,opening_hours/weekday_text,price_level,website"  # Place Details 요청 필드
+    DETAILS_MAX_RESULTS = 5  # 상세 정보를 붙일 상위 맛집 수
+    DETAILS_CONCURRENCY = 5  # 도구 호출 한 번에서 동시에 실행할 상세 정보 조회 수
+    DETAILS_TIMEOUT = 3  # 초, 상세 정보 조회를 기다리는 최대 시간 (넘으면 받은 것만 응답)
+    DETAILS_CACHE_TTL = 24 * 3600  # 초 (1일), 영업시간과 전화번호는 자주 바뀌지 않음
+
+    # 지역 좌표 설정
+    GAZETTEER_PATH = os.getenv("GAZETTEER_PATH", "")  # 추가 지역 좌표 JSON 파일 (비어 있으면 기본 테이블만 사용)
+    GEOCODE_CACHE_TTL = 7 * 24 * 3600  # 초 (7일), 지오코딩 결과는 거의 바뀌지 않음
+
+    # 검색어 분석 설정
+    QUERY_VOCABULARY_PATH = os.getenv("QUERY_VOCABULARY_PATH", "")  # 추가 검색어 사전 JSON 파일 (비어 있으면 기본 사전만 사용)
     
     # HTTP 설정
     MAX_RETRIES = 3
     RETRY_DELAY = 1  # 초
+    HTTP_CONNECT_TIMEOUT = 3  # 초
+    HTTP_POOL_LIMIT = 100  # 전체 동시 커넥션 수
+    HTTP_POOL_LIMIT_PER_HOST = 20  # 호스트별 동시 커넥션 수
+    HTTP_DNS_CACHE_TTL = 300  # 초
+    HTTP_KEEPALIVE_TIMEOUT = 30  # 초
+    RETRY_MAX_DELAY = 4  # 초, 재시도 대기 시간 상한 (지수 백오프)
+
+    # 장애 대응 설정
+    TOOL_LATENCY_BUDGET = 20  # 초, 도구 호출 한 번이 업스트림 요청에 쓸 수 있는 전체 시간
+    CIRCUIT_FAILURE_THRESHOLD = 5  # 연속 실패가 이만큼 쌓이면 해당 제공자 회로를 엶
+    CIRCUIT_RECOVERY_TIMEOUT = 30  # 초, 회로가 열린 뒤 시험 요청을 보내기까지 대기
+    HEDGE_DELAY = 0.5  # 초, IP 위치 제공자가 이 시간 안에 응답하지 않으면 다음 제공자에도 요청
+
+    # Google API 호출 속도 제한 (엔드포인트별 토큰 버킷)
+    GOOGLE_RATE_LIMITS = {"nearbysearch": 10, "geocode": 20, "details": 10}  # 엔드포인트별 초당 요청 수
+    GOOGLE_RATE_BURST = 5  # 쉬던 엔드포인트가 한 번에 보낼 수 있는 요청 수
+    RATE_LIMIT_MAX_WAIT = 10  # 초, 지연 시간 예산이 없는 호출(백그라운드 갱신 등)이 대기열에서 기다리는 최대 시간
+    OVER_QUERY_LIMIT_BACKOFF = 1  # 초, OVER_QUERY_LIMIT 응답 후 엔드포인트를 멈추는 시간 (연속이면 두 배씩 증가)
+    OVER_QUERY_LIMIT_MAX_BACKOFF = 30  # 초, OVER_QUERY_LIMIT 대기 시간 상한
+    RATE_LIMIT_MIN_FACTOR = 0.1  # OVER_QUERY_LIMIT가 반복될 때 낮출 수 있는 최저 속도 (설정 속도 대비 비율)
     
     # 캐시 설정
     CACHE_TTL = 3600  # 초 (1시간)
+    CACHE_GRID_SIZE = 0.002  # 도 단위 (약 200m), 이 격자 안의 검색은 같은 캐시 키를 사용
+    SPATIAL_INDEX_CELL_SIZE = 250  # 미터, 조회한 장소를 보관하는 격자 크기
+    SPATIAL_INDEX_MAX_COVERAGES = 200  # 검색어별로 보관하는 검색 범위 수
+    SPATIAL_INDEX_MAX_KEYWORDS = 500  # 공간 인덱스에 보관하는 검색어 수
+    IP_LOCATION_CACHE_TTL = 6 * 3600  # 초 (6시간)
+    CACHE_STALE_TTL = 600  # 초, 만료된 검색 결과를 백그라운드 갱신 동안 대신 응답하는 유예 시간
+
+    # 인기 검색 미리 갱신 설정
+    POPULARITY_HALF_LIFE = 1800  # 초, 검색 인기 점수가 절반으로 줄어드는 시간
+    POPULARITY_MAX_KEYS = 5000  # 인기 점수를 추적하는 검색 수
+    REFRESH_INTERVAL = 60  # 초, 인기 검색 갱신 주기
+    REFRESH_TOP_N = 20  # 갱신 대상으로 보는 인기 검색 수
+    REFRESH_AHEAD = 300  # 초, 캐시 만료까지 이 시간보다 적게 남은 인기 검색을 미리 갱신
+    REFRESH_BUDGET = 30  # 갱신 주기마다 미리 갱신에 쓸 업스트림 요청 수 (검색 하나는 페이지 × 나눈 검색어만큼 요청)
+
+    # 리소스 스냅숏 설정
+    RESOURCE_REFRESH_INTERVAL = 300  # 초, maat://restaurant_results 스냅숏을 다시 만드는 주기
+
+    # 랜덤 추천 후보 풀 설정
+    RANDOM_POOL_TTL = 600  # 초, 후보를 받은 지 이만큼 지나면 백그라운드에서 다시 받음
+    RANDOM_POOL_LOW_WATER = 2  # 남은 후보가 이 수 이하가 되면 백그라운드에서 다시 받음
+    RANDOM_POOL_MAX_POOLS = 1000  # 보관하는 (지역, 검색어) 풀 수
+    MAX_RANDOM_RECOMMENDATIONS = 10  # 랜덤 추천 한 번에 고를 수 있는 최대 맛집 수
+
+    # 영구 캐시 설정 (재시작 후에도 지오코딩, IP 위치, 주변 검색 결과를 재사용)
+    PERSISTENT_CACHE_PATH = os.getenv("PERSISTENT_CACHE_PATH", "")  # SQLite 파일 경로 (비어 있으면 사용 안 함)
+    PERSISTENT_CACHE_MAX_BYTES = int(os.getenv("PERSISTENT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))  # 파일 크기 상한 (데이터 파일 + WAL 파일)
+    PERSISTENT_CACHE_BUSY_TIMEOUT = 5  # 초, 다른 프로세스가 쓰는 중일 때 쓰기 잠금을 기다리는 시간
     
     @classmethod
     def get_google_maps_base_url(cls) -> str:
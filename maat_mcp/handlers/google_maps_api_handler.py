@@ -1,17 +1,157 @@
+import asyncio
 import logging
-from typing import Dict, Any, List
+import math
+from typing import Dict, Any, AsyncIterator, List, Optional, Sequence, Set, Tuple
 from maat_mcp.api.google_maps_api import GoogleMapsApi
 from maat_mcp.config import Config
+from maat_mcp.util.cache import TTLCache
+from maat_mcp.util.candidate_pool import CandidatePool
+from maat_mcp.util.metrics import STAGE_DURATION
+from maat_mcp.util.persistent_cache import persistent_namespace
+from maat_mcp.util.popularity import PopularityTracker
+from maat_mcp.util.query_parser import expand_search_query
+from maat_mcp.util.resilience import count_upstream_calls, detached_context, remaining_budget
+from maat_mcp.util.restaurant import Restaurant, rank_restaurants, select_by_rating_tier
+from maat_mcp.util.single_flight import SingleFlight
+from maat_mcp.util.spatial_index import PlaceSpatialIndex
 
 logger = logging.getLogger(__name__)
 
-async def get_restaurants_from_google_maps(latitude: float, longitude: float, search_query: str = None) -> List[Dict[str, Any]]:
+# 주변 검색 결과 캐시 (정규화된 검색어 + 격자에 맞춘 좌표 기준)
+_restaurant_cache = TTLCache(
+    Config.MAX_CACHE_SIZE,
+    Config.CACHE_TTL,
+    persistent_namespace("restaurants", lambda rows: [Restaurant.from_row(row) for row in rows]),
+    Config.CACHE_STALE_TTL
+)
+
+# 검색 키별 인기 점수 (미리 갱신할 검색을 고르는 데 사용)
+_popular_searches = PopularityTracker()
+
+# 백그라운드에서 갱신 중인 검색 키
+_revalidating: Set[Tuple] = set()
+
+# 갱신 통계
+_refresh_stats = {"revalidations": 0, "refreshes": 0, "refresh_errors": 0, "refresh_upstream_calls": 0}
+
+# 같은 캐시 키로 동시에 들어온 검색을 하나의 업스트림 호출로 합칩니다.
+_single_flight = SingleFlight()
+
+# 이전에 빠짐없이 조회한 검색 범위와 장소 (새 검색 범위가 그 안에 있으면 업스트림 호출 없이 계산)
+_place_index = PlaceSpatialIndex()
+
+# 지오코딩 결과 캐시 (지명은 거의 바뀌지 않으므로 TTL을 길게 둡니다)
+_geocode_cache = TTLCache(Config.MAX_CACHE_SIZE, Config.GEOCODE_CACHE_TTL, persistent_namespace("geocode"))
+
+# 장소 상세 정보 캐시 (place_id 기준)
+_details_cache = TTLCache(Config.MAX_CACHE_SIZE, Config.DETAILS_CACHE_TTL, persistent_namespace("details"))
+
+# 랜덤 추천용 (검색어, 격자 좌표, 반경)별 후보 풀
+_candidate_pools: CandidatePool[Restaurant] = CandidatePool()
+
+def _snap_to_grid(value: Optional[float]) -> Optional[int]:
+    """좌표를 캐시 격자 인덱스로 변환합니다."""
+    if value is None:
+        return None
+    return round(value / Config.CACHE_GRID_SIZE)
+
+def _normalize_keyword(search_query: Optional[str]) -> str:
+    """검색어의 대소문자와 공백을 정규화합니다."""
+    return " ".join((search_query or Config.DEFAULT_SEARCH_QUERY).lower().split())
+
+def _restaurant_cache_key(latitude: Optional[float], longitude: Optional[float], search_query: Optional[str], radius: Optional[int] = None) -> Tuple:
+    """검색어, 좌표, 검색 반경으로 캐시 키를 생성합니다."""
+    return (_normalize_keyword(search_query), _snap_to_grid(latitude), _snap_to_grid(longitude), int(radius or Config.SEARCH_RADIUS))
+
+def get_restaurant_cache_stats() -> Dict[str, Any]:
+    """주변 검색 캐시의 적중/미스/축출 통계를 반환합니다."""
+    return _restaurant_cache.stats()
+
+def get_place_index_stats() -> Dict[str, Any]:
+    """조회한 장소 공간 인덱스의 크기와 적중/미스 통계를 반환합니다."""
+    return _place_index.stats()
+
+def get_geocode_cache_stats() -> Dict[str, Any]:
+    """지오코딩 캐시의 적중/미스/축출 통계를 반환합니다."""
+    return _geocode_cache.stats()
+
+def get_details_cache_stats() -> Dict[str, Any]:
+    """장소 상세 정보 캐시의 적중/미스/축출 통계를 반환합니다."""
+    return _details_cache.stats()
+
+def get_refresh_stats() -> Dict[str, Any]:
+    """만료 결과 재검증과 인기 검색 미리 갱신 통계를 반환합니다."""
+    return {**_refresh_stats, "tracked_searches": len(_popular_searches), "revalidating": len(_revalidating)}
+
+def get_candidate_pool_stats() -> Dict[str, Any]:
+    """랜덤 추천 후보 풀의 크기와 적중/미스/채우기 통계를 반환합니다."""
+    return _candidate_pools.stats()
+
+def _viewport_radius(viewport: Dict[str, Any]) -> int:
+    """지오코딩 결과의 viewport 대각선 절반을 검색 반경(m)으로 환산합니다."""
+    northeast, southwest = viewport["northeast"], viewport["southwest"]
+    mean_latitude = math.radians((northeast["lat"] + southwest["lat"]) / 2)
+    dy = (northeast["lat"] - southwest["lat"]) * 111320
+    dx = (northeast["lng"] - southwest["lng"]) * 111320 * math.cos(mean_latitude)
+    radius = int(math.hypot(dx, dy) / 2)
+    return max(int(Config.SEARCH_RADIUS), min(radius, Config.MAX_SEARCH_RADIUS))
+
+async def get_location_from_google_maps(location_name: str) -> Dict[str, Any]:
+    """Google Geocoding API로 지명의 좌표와 검색 반경을 조회합니다.
+
+    Args:
+        location_name (str): 지명
+
+    Returns:
+        Dict[str, Any]: {"latitude", "longitude", "radius"}
+
+    Raises:
+        Exception: API 호출 실패 시
+    """
+    try:
+        cache_key = " ".join(location_name.split())
+        cached = await _geocode_cache.get_async(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        return dict(await _single_flight.do(
+            ("geocode", cache_key),
+            lambda: _fetch_location(cache_key)
+        ))
+    except Exception as e:
+        logger.error(f"지명 좌표 조회 중 에러 발생: {str(e)}")
+        raise
+
+async def _fetch_location(location_name: str) -> Dict[str, Any]:
+    """Geocoding API를 호출하고 결과를 캐시에 저장합니다."""
+    response = await GoogleMapsApi.get_location_by_name(location_name)
+    if response["status"] != "OK" or not response["results"]:
+        raise Exception(f"지명 좌표 조회 실패: {response['status']}")
+
+    geometry = response["results"][0]["geometry"]
+    location = {
+        "latitude": geometry["location"]["lat"],
+        "longitude": geometry["location"]["lng"],
+        "radius": _viewport_radius(geometry["viewport"]) if "viewport" in geometry else int(Config.SEARCH_RADIUS)
+    }
+    _geocode_cache.set(location_name, location)
+    return location
+
+async def get_restaurants_from_google_maps(latitude: float, longitude: float, search_query: str = None, radius: int = None, sort: str = None, limit: int = None, fields: Sequence[str] = None, details: bool = False) -> List[Dict[str, Any]]:
     """Google Maps API를 통해 위치 기반으로 맛집 정보를 조회합니다.
+
+    정렬과 개수 제한을 먼저 적용한 뒤, 남은 맛집만 요청한 필드로 dict를 만듭니다.
     
     Args:
         latitude (float): 위도
         longitude (float): 경도
         search_query (str, optional): 검색어
+        radius (int, optional): 검색 반경 (미터), 없으면 Config.SEARCH_RADIUS
+        sort (str, optional): 정렬 방식 (relevance, rating, weighted)
+        limit (int, optional): 반환할 최대 개수
+        fields (Sequence[str], optional): 응답에 담을 필드 (parse_fields로 검증한 이름), 없으면 모든 필드
+        details (bool, optional): 상위 Config.DETAILS_MAX_RESULTS개에 상세 정보(details)를 붙일지 여부.
+            시간 안에 조회하지 못한 맛집의 details는 None입니다.
         
     Returns:
         List[Dict[str, Any]]: 맛집 정보 목록
@@ -19,39 +159,394 @@ async def get_restaurants_from_google_maps(latitude: float, longitude: float, se
     Raises:
         Exception: API 호출 실패 시
     """
+    restaurants = await search_restaurants(latitude, longitude, search_query, radius)
+    with STAGE_DURATION.time("rank"):
+        ranked = rank_restaurants(restaurants, sort, limit)
+        records = [restaurant.to_dict(fields) for restaurant in ranked]
+    if details:
+        top = ranked[:Config.DETAILS_MAX_RESULTS]
+        with STAGE_DURATION.time("details"):
+            place_details = await get_place_details_batch([restaurant.place_id for restaurant in top])
+        for record, restaurant in zip(records, top):
+            record["details"] = place_details.get(restaurant.place_id)
+    return records
+
+async def get_place_details_batch(place_ids: Sequence[str], timeout: float = None) -> Dict[str, Dict[str, Any]]:
+    """여러 장소의 상세 정보를 동시에 조회합니다.
+
+    캐시에 없는 장소만 Config.DETAILS_CONCURRENCY개씩 동시에 조회하고, timeout(남은 지연 시간 예산을 넘지 않음)
+    안에 끝난 결과만 반환합니다. 조회는 백그라운드 우선순위로 실행하며, 시간 안에 끝나지 않은 조회는
+    계속 진행해 다음 요청을 위해 캐시를 채웁니다.
+
+    Args:
+        place_ids (Sequence[str]): 장소 ID 목록
+        timeout (float, optional): 최대 대기 시간(초), 없으면 Config.DETAILS_TIMEOUT
+
+    Returns:
+        Dict[str, Dict[str, Any]]: 조회에 성공한 장소 ID별 상세 정보
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    missing = []
+    unique_ids = list(dict.fromkeys(place_ids))
+    cached_details = await asyncio.gather(*(_details_cache.get_async(place_id) for place_id in unique_ids))
+    for place_id, cached in zip(unique_ids, cached_details):
+        if cached is not None:
+            results[place_id] = dict(cached)
+        else:
+            missing.append(place_id)
+    if not missing:
+        return results
+
+    timeout = Config.DETAILS_TIMEOUT if timeout is None else timeout
+    remaining = remaining_budget()
+    if remaining is not None:
+        timeout = max(min(timeout, remaining), 0)
+
+    semaphore = asyncio.Semaphore(Config.DETAILS_CONCURRENCY)
+    # 시간 안에 끝나지 않은 조회는 도구 호출이 끝난 뒤에도 이어지므로, 호출의 지연 시간 예산과 우선순위를
+    # 물려받지 않도록 백그라운드 컨텍스트로 실행합니다.
+    loop = asyncio.get_running_loop()
+    tasks = {
+        loop.create_task(_bounded_details(semaphore, place_id), context=detached_context()): place_id
+        for place_id in missing
+    }
+    for task in tasks:
+        task.add_done_callback(_log_details_error)
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in done:
+        if not task.cancelled() and task.exception() is None:
+            results[tasks[task]] = dict(task.result())
+    if pending:
+        logger.info("장소 상세 정보 %d/%d개를 시간 안에 받지 못했습니다.", len(pending), len(missing))
+    return results
+
+async def _bounded_details(semaphore: asyncio.Semaphore, place_id: str) -> Dict[str, Any]:
+    """세마포어 안에서 장소 상세 정보를 조회합니다. 같은 장소의 동시 조회는 하나로 합칩니다."""
+    async with semaphore:
+        return await _single_flight.do(("details", place_id), lambda: _fetch_details(place_id))
+
+def _log_details_error(task: asyncio.Future) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("장소 상세 정보 조회 실패: %s", task.exception())
+
+async def _fetch_details(place_id: str) -> Dict[str, Any]:
+    """Place Details API를 호출하고 응답에 필요한 항목만 캐시에 저장합니다."""
+    response = await GoogleMapsApi.get_place_details(place_id)
+    if response["status"] != "OK":
+        raise Exception(f"장소 상세 정보 조회 실패: {response['status']}")
+
+    result = response.get("result", {})
+    place_details = {
+        "phone": result.get("formatted_phone_number"),
+        "opening_hours": result.get("opening_hours", {}).get("weekday_text"),
+        "price_level": result.get("price_level"),
+        "website": result.get("website")
+    }
+    _details_cache.set(place_id, place_details)
+    return place_details
+
+async def recommend_restaurant(latitude: float, longitude: float, search_query: str = None, radius: int = None) -> Restaurant:
+    """같은 지역과 검색어의 후보 풀에서 아직 추천하지 않은 맛집 하나를 고릅니다.
+
+    첫 추천만 검색 결과를 기다리고, 이후 추천은 풀에서 바로 꺼냅니다.
+    풀은 후보가 줄거나 오래되면 백그라운드에서 다시 채워집니다.
+
+    Raises:
+        Exception: 추천할 맛집이 없거나 API 호출 실패 시
+    """
     try:
-        response = await GoogleMapsApi.get_restaurants(latitude, longitude, search_query)
-        if response["status"] != "OK":
-            raise Exception(f"맛집 정보 조회 실패: {response['status']}")
-            
-        restaurants = []
-        for place in response["results"]:
-            restaurants.append({
-                "name": place["name"],
-                "address": place["vicinity"],
-                "rating": place.get("rating", 0),
-                "total_ratings": place.get("user_ratings_total", 0),
-                "types": place.get("types", []),
-                "place_id": place["place_id"]
-            })
-        
-        # 평점 기준을 순차적으로 하향 조정
-        filtered_restaurants = []
-        
-        for threshold in Config.RATING_THRESHOLDS:
-            filtered_restaurants = [r for r in restaurants if r["rating"] >= threshold]
-            if filtered_restaurants:
-                logger.info(f"평점 {threshold} 이상의 맛집 {len(filtered_restaurants)}개 발견")
-                break
-        
-        if not filtered_restaurants:
-            if search_query == Config.DEFAULT_SEARCH_QUERY:
-                raise Exception("주변에 맛집을 찾을 수 없습니다. 지역명이나 음식 종류를 구체적으로 말씀해 주세요. (예: 강남 한식, 홍대 카페)")
-            
-            food_type = search_query.split()[-2] if len(search_query.split()) > 1 else search_query.split()[0]
-            raise Exception(f"주변에 {search_query}를 찾을 수 없습니다. 다른 지역이나 음식 종류를 시도해보시겠어요?")
-        
-        return filtered_restaurants
+        return await _candidate_pools.draw(
+            _restaurant_cache_key(latitude, longitude, search_query, radius),
+            lambda: search_restaurants(latitude, longitude, search_query, radius),
+            lambda restaurant: restaurant.place_id
+        )
+    except Exception as e:
+        logger.error(f"맛집 추천 후보 조회 중 에러 발생: {str(e)}")
+        raise
+
+async def recommend_restaurants(latitude: float, longitude: float, search_query: str = None, radius: int = None, count: int = 1) -> List[Restaurant]:
+    """같은 후보 풀에서 서로 다른 맛집을 최대 count개 고릅니다.
+
+    풀의 후보를 모두 추천해 같은 맛집이 다시 나오거나, 첫 추천 이후 후보를 받지 못하면 그때까지 고른 맛집만 반환합니다.
+
+    Raises:
+        Exception: 추천할 맛집이 없거나 API 호출 실패 시
+    """
+    restaurants = [await recommend_restaurant(latitude, longitude, search_query, radius)]
+    seen = {restaurants[0].place_id}
+    for _ in range(count - 1):
+        try:
+            restaurant = await recommend_restaurant(latitude, longitude, search_query, radius)
+        except Exception as e:
+            logger.warning("추가 추천 후보 조회 실패, %d개만 추천합니다: %s", len(restaurants), e)
+            break
+        if restaurant.place_id in seen:
+            break
+        seen.add(restaurant.place_id)
+        restaurants.append(restaurant)
+    return restaurants
+
+async def search_restaurants(latitude: float, longitude: float, search_query: str = None, radius: int = None) -> List[Restaurant]:
+    """평점 기준으로 걸러낸 맛집 레코드 목록을 조회합니다.
+
+    캐시, 공간 인덱스, 만료 유예 중인 캐시, 업스트림 호출 순서로 조회합니다.
+    만료 유예 중인 결과를 응답할 때는 백그라운드에서 한 번만 다시 조회합니다.
+
+    Raises:
+        Exception: API 호출 실패 시
+    """
+    try:
+        cache_key = _restaurant_cache_key(latitude, longitude, search_query, radius)
+        _popular_searches.record(cache_key, (latitude, longitude, search_query, radius))
+        cached = await _restaurant_cache.get_async(cache_key)
+        if cached is not None:
+            logger.debug("맛집 검색 캐시 적중: %s", cache_key)
+            return cached
+
+        if latitude is not None and longitude is not None:
+            local_places = _place_index.query(
+                cache_key[0], latitude, longitude, int(radius or Config.SEARCH_RADIUS)
+            )
+            if local_places is not None:
+                logger.debug("이전 검색 범위 안의 검색입니다. 보관된 장소로 계산합니다: %s", cache_key)
+                filtered_restaurants = _filter_by_rating(local_places, search_query)
+                _restaurant_cache.set(cache_key, filtered_restaurants)
+                return filtered_restaurants
+
+        stale = _restaurant_cache.get_stale(cache_key)
+        if stale is not None:
+            logger.debug("만료된 검색 결과로 응답하고 백그라운드에서 갱신합니다: %s", cache_key)
+            _revalidate(cache_key, latitude, longitude, search_query, radius)
+            return stale
+
+        return await _single_flight.do(
+            cache_key,
+            lambda: _fetch_restaurants(latitude, longitude, search_query, radius, cache_key)
+        )
     except Exception as e:
         logger.error(f"맛집 정보 조회 중 에러 발생: {str(e)}")
-        raise 
\ No newline at end of file
+        raise
+
+def _revalidate(cache_key: Tuple, latitude: float, longitude: float, search_query: Optional[str], radius: Optional[int]) -> None:
+    """만료된 검색 결과를 백그라운드에서 다시 조회합니다. 키마다 하나의 작업만 실행합니다."""
+    if cache_key in _revalidating:
+        return
+    _revalidating.add(cache_key)
+    _refresh_stats["revalidations"] += 1
+
+    async def revalidate() -> None:
+        try:
+            await _refresh(cache_key, latitude, longitude, search_query, radius)
+        except Exception as e:
+            _refresh_stats["refresh_errors"] += 1
+            logger.warning("만료된 검색 결과 갱신 실패: %s (%s)", cache_key, e)
+        finally:
+            _revalidating.discard(cache_key)
+
+    # 요청한 도구 호출의 지연 시간 예산과 무관하게 실행합니다.
+    asyncio.get_running_loop().create_task(revalidate(), context=detached_context())
+
+async def _refresh(cache_key: Tuple, latitude: float, longitude: float, search_query: Optional[str], radius: Optional[int]) -> List[Restaurant]:
+    """캐시를 거치지 않고 업스트림에서 다시 조회해 캐시를 갱신합니다."""
+    return await _single_flight.do(
+        cache_key,
+        lambda: _fetch_restaurants(latitude, longitude, search_query, radius, cache_key)
+    )
+
+async def refresh_popular_searches(top_n: int = None, budget: int = None, refresh_ahead: float = None) -> int:
+    """인기 검색 중 곧 만료되거나 만료 유예 중인 결과를 미리 다시 조회합니다.
+
+    예산은 검색 수가 아니라 실제로 보낸 업스트림 요청 수(페이지, 나눈 검색어, 재시도 포함)로 셉니다.
+    검색 하나가 보낼 요청 수는 미리 알 수 없으므로 예산을 다 쓰기 전까지 검색을 시작하며,
+    마지막 검색만큼(검색어 하나당 최대 Config.NEARBY_API_MAX_PAGES페이지) 예산을 넘을 수 있습니다.
+
+    Args:
+        top_n (int, optional): 갱신 대상으로 볼 인기 검색 수, 없으면 Config.REFRESH_TOP_N
+        budget (int, optional): 이번에 보낼 최대 업스트림 요청 수, 없으면 Config.REFRESH_BUDGET
+        refresh_ahead (float, optional): 남은 TTL이 이보다 적으면 갱신, 없으면 Config.REFRESH_AHEAD
+
+    Returns:
+        int: 다시 조회한 검색 수
+    """
+    top_n = top_n or Config.REFRESH_TOP_N
+    budget = Config.REFRESH_BUDGET if budget is None else budget
+    refresh_ahead = Config.REFRESH_AHEAD if refresh_ahead is None else refresh_ahead
+
+    refreshed = 0
+    used = 0
+    for cache_key, args, _ in _popular_searches.top(top_n):
+        if used >= budget:
+            break
+        remaining = _restaurant_cache.remaining_ttl(cache_key)
+        # 캐시에 없는 검색(실패했거나 축출됨)은 사용자 요청이 올 때 조회합니다.
+        if remaining is None or remaining > refresh_ahead or cache_key in _revalidating:
+            continue
+        refreshed += 1
+        with count_upstream_calls() as counter:
+            try:
+                await _refresh(cache_key, *args)
+                _refresh_stats["refreshes"] += 1
+            except Exception as e:
+                _refresh_stats["refresh_errors"] += 1
+                logger.warning("인기 검색 미리 갱신 실패: %s (%s)", cache_key, e)
+        used += counter.calls
+    _refresh_stats["refresh_upstream_calls"] += used
+    return refreshed
+
+async def iter_restaurant_pages_from_google_maps(latitude: float, longitude: float, search_query: str = None, radius: int = None, max_pages: int = None) -> AsyncIterator[Tuple[List[Restaurant], bool]]:
+    """주변 검색 결과를 페이지 단위의 맛집 레코드 목록으로 반환합니다.
+
+    다음 페이지는 호출자가 요청할 때만 조회하므로, 충분한 결과를 얻으면 순회를 멈춰
+    추가 요청을 하지 않을 수 있습니다.
+
+    Args:
+        latitude (float): 위도
+        longitude (float): 경도
+        search_query (str, optional): 검색어
+        radius (int, optional): 검색 반경 (미터)
+        max_pages (int, optional): 최대 페이지 수
+
+    Yields:
+        Tuple[List[Restaurant], bool]: 페이지별 맛집 레코드 목록과 다음 페이지 존재 여부
+
+    Raises:
+        Exception: 첫 페이지 조회 실패 시
+    """
+    pages = GoogleMapsApi.iter_restaurant_pages(latitude, longitude, search_query, radius, max_pages)
+    try:
+        page_number = 0
+        async for response in pages:
+            page_number += 1
+            if response["status"] != "OK":
+                if page_number == 1:
+                    raise Exception(f"맛집 정보 조회 실패: {response['status']}")
+                # 다음 페이지 실패는 이미 받은 결과로 처리합니다.
+                logger.warning("맛집 정보 %d페이지 조회 실패: %s", page_number, response["status"])
+                return
+            yield [Restaurant.from_place(place) for place in response["results"]], "next_page_token" in response
+    finally:
+        await pages.aclose()
+
+async def iter_restaurants_from_google_maps(latitude: float, longitude: float, search_query: str = None, radius: int = None, max_pages: int = None) -> AsyncIterator[Restaurant]:
+    """주변 검색 결과를 도착하는 순서대로 맛집 레코드 하나씩 반환합니다."""
+    pages = iter_restaurant_pages_from_google_maps(latitude, longitude, search_query, radius, max_pages)
+    try:
+        async for page, _ in pages:
+            for restaurant in page:
+                yield restaurant
+    finally:
+        await pages.aclose()
+
+async def _fetch_restaurants(latitude: float, longitude: float, search_query: Optional[str], radius: Optional[int], cache_key: Tuple) -> List[Restaurant]:
+    """Google Maps API를 호출하고 평점 기준으로 걸러낸 결과를 캐시에 저장합니다.
+
+    검색어를 구체적인 검색어 여러 개로 나눌 수 있으면 동시에 검색해 합친 뒤 평점 기준을 한 번만 적용합니다.
+    API의 페이지/결과 수 한도에 닿지 않고 마지막 페이지까지 조회한 경우에만
+    검색 범위와 장소를 공간 인덱스에 기록합니다.
+    """
+    keywords = expand_search_query(search_query) if Config.SEARCH_FANOUT else [search_query]
+    with STAGE_DURATION.time("nearby_search"):
+        if len(keywords) > 1:
+            restaurants, complete = await _collect_fanout(latitude, longitude, keywords, radius)
+        else:
+            restaurants, complete = await _collect_places(latitude, longitude, search_query, radius)
+
+    if complete and latitude is not None and longitude is not None:
+        _place_index.add(cache_key[0], latitude, longitude, int(radius or Config.SEARCH_RADIUS), restaurants)
+
+    filtered_restaurants = _filter_by_rating(restaurants, search_query)
+    _restaurant_cache.set(cache_key, filtered_restaurants)
+    return filtered_restaurants
+
+async def _collect_places(latitude: float, longitude: float, search_query: Optional[str], radius: Optional[int]) -> Tuple[List[Restaurant], bool]:
+    """검색어 하나의 페이지를 차례로 조회합니다.
+
+    최고 평점 기준을 넘는 맛집이 Config.TARGET_RESULT_COUNT개 모이면 다음 페이지를 조회하지 않습니다.
+
+    nearbysearch는 최대 Config.NEARBY_API_MAX_PAGES페이지(Config.NEARBY_API_MAX_RESULTS개)까지만 반환하고
+    마지막 페이지에는 next_page_token을 주지 않으므로, 이 한도에 닿은 결과는 범위 안의 장소를
+    빠짐없이 받았다고 볼 수 없습니다.
+
+    Returns:
+        Tuple[List[Restaurant], bool]: 맛집 목록과 검색 범위 안의 장소를 빠짐없이 조회했는지 여부
+    """
+    restaurants = []
+    top_threshold = Config.RATING_THRESHOLDS[0]
+    top_count = 0
+    page_count = 0
+    complete = False
+    pages = iter_restaurant_pages_from_google_maps(latitude, longitude, search_query, radius)
+    try:
+        async for page, has_next_page in pages:
+            restaurants.extend(page)
+            page_count += 1
+            complete = not has_next_page
+            top_count += sum(1 for r in page if r.rating >= top_threshold)
+            if top_count >= Config.TARGET_RESULT_COUNT:
+                break
+    finally:
+        await pages.aclose()
+    if page_count >= Config.NEARBY_API_MAX_PAGES or len(restaurants) >= Config.NEARBY_API_MAX_RESULTS:
+        complete = False
+    return restaurants, complete
+
+async def _collect_fanout(latitude: float, longitude: float, keywords: List[str], radius: Optional[int]) -> Tuple[List[Restaurant], bool]:
+    """여러 검색어를 동시에 조회하고 끝나는 순서대로 place_id 기준으로 중복을 빼며 합칩니다.
+
+    전체 시간은 가장 느린 검색 하나와 비슷합니다. 일부 검색어가 실패해도 나머지 결과를 사용하며,
+    모두 실패한 경우에만 첫 오류를 다시 발생시킵니다. 합친 장소는 Config.FANOUT_MAX_PLACES개까지만 보관합니다.
+    검색어 하나라도 실패했거나 API 한도에 닿았거나(_collect_places 참고) 합친 장소가 상한을 넘으면
+    빠짐없이 조회하지 않은 것으로 봅니다.
+
+    Returns:
+        Tuple[List[Restaurant], bool]: 합친 맛집 목록과 모든 검색어의 검색 범위를 빠짐없이 조회했는지 여부
+    """
+    tasks = [asyncio.ensure_future(_collect_places(latitude, longitude, keyword, radius)) for keyword in keywords]
+    merged: List[Restaurant] = []
+    seen: Set[str] = set()
+    errors: List[Exception] = []
+    complete = True
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            try:
+                places, keyword_complete = await next_result
+            except Exception as e:
+                logger.warning("나눠 검색한 검색어 중 하나가 실패했습니다: %s", e)
+                errors.append(e)
+                complete = False
+                continue
+            complete = complete and keyword_complete
+            for restaurant in places:
+                if restaurant.place_id in seen:
+                    continue
+                if len(seen) >= Config.FANOUT_MAX_PLACES:
+                    complete = False
+                    break
+                seen.add(restaurant.place_id)
+                merged.append(restaurant)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    if not merged and errors:
+        raise errors[0]
+    logger.debug("검색어 %d개를 나눠 검색해 장소 %d개를 합쳤습니다: %s", len(keywords), len(merged), keywords)
+    return merged, complete
+
+def _filter_by_rating(restaurants: List[Restaurant], search_query: Optional[str]) -> List[Restaurant]:
+    """평점 기준을 순차적으로 낮춰 가며 맛집을 걸러냅니다.
+
+    Raises:
+        Exception: 어떤 기준으로도 맛집이 없을 때
+    """
+    with STAGE_DURATION.time("filter"):
+        threshold, filtered_restaurants = select_by_rating_tier(restaurants)
+    if filtered_restaurants:
+        logger.info("평점 %s 이상의 맛집 %d개 발견", threshold, len(filtered_restaurants))
+    else:
+        if search_query == Config.DEFAULT_SEARCH_QUERY:
+            raise Exception("주변에 맛집을 찾을 수 없습니다. 지역명이나 음식 종류를 구체적으로 말씀해 주세요. (예: 강남 한식, 홍대 카페)")
+        
+        raise Exception(f"주변에 {search_query}를 찾을 수 없습니다. 다른 지역이나 음식 종류를 시도해보시겠어요?")
+    
+    return filtered_restaurants
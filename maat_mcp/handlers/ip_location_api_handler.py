@@ -1,11 +1,52 @@
+import contextvars
 import logging
-from typing import Dict, Any, Optional
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional, Tuple
 from maat_mcp.api.ip_location_api import IpLocationApi
+from maat_mcp.config import Config
+from maat_mcp.util.cache import TTLCache
+from maat_mcp.util.persistent_cache import persistent_namespace
+from maat_mcp.util.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# IP 위치 캐시 (키가 None이면 서버 자신의 IP 위치)
+_ip_location_cache = TTLCache(Config.MAX_CACHE_SIZE, Config.IP_LOCATION_CACHE_TTL, persistent_namespace("ip_location"))
+
+# MCP 세션별로 마지막에 조회한 (클라이언트 IP, 위치, 만료 시각) (세션이 끝나면 함께 사라짐)
+_session_locations: "weakref.WeakKeyDictionary[Any, Tuple[Optional[str], Dict[str, Any], float]]" = weakref.WeakKeyDictionary()
+_session_hits = 0
+
+# 현재 도구 호출의 (클라이언트 IP, MCP 세션)
+_client = contextvars.ContextVar("maat_client", default=(None, None))
+
+# 같은 IP에 대한 동시 조회를 하나로 합칩니다.
+_single_flight = SingleFlight()
+
+def get_ip_location_cache_stats() -> Dict[str, Any]:
+    """IP 위치 캐시의 적중/미스/축출 통계와 세션별 위치 캐시 통계를 반환합니다."""
+    return {**_ip_location_cache.stats(), "sessions": len(_session_locations), "session_hits": _session_hits}
+
+@contextmanager
+def client_context(client_ip: Optional[str], session: Any = None) -> Iterator[None]:
+    """블록 안의 IP 위치 조회가 이 클라이언트의 IP와 MCP 세션을 사용하도록 합니다.
+
+    전송 계층(도구 함수)에서 요청의 클라이언트 IP와 세션으로 감싸 호출합니다.
+    client_ip가 None이면 서버 자신의 공인 IP 위치를 사용합니다.
+    """
+    token = _client.set((client_ip, session))
+    try:
+        yield
+    finally:
+        _client.reset(token)
+
 async def get_ip_location_info(client_ip: Optional[str] = None) -> Dict[str, Any]:
     """IP 기반으로 위치 정보를 조회합니다.
+
+    client_ip가 없으면 client_context로 지정한 클라이언트 IP를 사용합니다.
+    같은 MCP 세션의 같은 IP는 세션 캐시에서, 그 밖에는 IP별 캐시에서 먼저 찾습니다.
     
     Args:
         client_ip (str, optional): 클라이언트 IP 주소
@@ -16,15 +57,41 @@ async def get_ip_location_info(client_ip: Optional[str] = None) -> Dict[str, Any
     Raises:
         Exception: API 호출 실패 시
     """ 
+    global _session_hits
     try:
-        response = await IpLocationApi.get_location_info(client_ip)
-        
-        # 응답이 필요한 필드를 포함하는지 확인
-        required_fields = ["latitude", "longitude", "city", "country"]
-        if not all(field in response for field in required_fields):
-            raise Exception("위치 정보가 올바르지 않습니다.")
-            
-        return response
+        session = None
+        if client_ip is None:
+            client_ip, session = _client.get()
+
+        if session is not None:
+            entry = _session_locations.get(session)
+            if entry is not None and entry[0] == client_ip and entry[2] > time.monotonic():
+                _session_hits += 1
+                return dict(entry[1])
+
+        location = await _lookup_ip_location(client_ip)
+        if session is not None:
+            _session_locations[session] = (client_ip, location, time.monotonic() + Config.IP_LOCATION_CACHE_TTL)
+        return dict(location)
     except Exception as e:
         logger.error(f"IP 위치 정보 조회 중 에러 발생: {str(e)}")
-        raise 
\ No newline at end of file
+        raise
+
+async def _lookup_ip_location(client_ip: Optional[str]) -> Dict[str, Any]:
+    """IP별 캐시에서 위치를 찾고, 없으면 조회해 캐시에 저장합니다 (키가 None이면 서버 자신의 IP)."""
+    cached = await _ip_location_cache.get_async(client_ip)
+    if cached is not None:
+        return cached
+
+    response = await _single_flight.do(
+        client_ip,
+        lambda: IpLocationApi.get_location_info(client_ip)
+    )
+
+    # 응답이 필요한 필드를 포함하는지 확인
+    required_fields = ["latitude", "longitude", "city", "country"]
+    if not all(field in response for field in required_fields):
+        raise Exception("위치 정보가 올바르지 않습니다.")
+
+    _ip_location_cache.set(client_ip, response)
+    return response
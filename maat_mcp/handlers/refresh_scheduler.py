@@ -0,0 +1,45 @@
+import asyncio
+import logging
+from typing import Optional
+from maat_mcp.config import Config
+from maat_mcp.handlers.google_maps_api_handler import refresh_popular_searches
+from maat_mcp.util.resilience import detached_context
+
+logger = logging.getLogger(__name__)
+
+_task: Optional[asyncio.Task] = None
+_users = 0
+
+async def _run() -> None:
+    """Config.REFRESH_INTERVAL마다 인기 검색을 미리 갱신합니다."""
+    while True:
+        await asyncio.sleep(Config.REFRESH_INTERVAL)
+        try:
+            refreshed = await refresh_popular_searches()
+            if refreshed:
+                logger.info("인기 검색 %d개를 미리 갱신했습니다.", refreshed)
+        except Exception as e:
+            logger.warning("인기 검색 미리 갱신 중 에러 발생: %s", e)
+
+def start_refresh_scheduler() -> None:
+    """인기 검색 갱신 작업을 시작합니다.
+
+    lifespan은 세션마다 실행될 수 있으므로 참조 카운트로 관리하며, 프로세스마다 작업은 하나만 실행합니다.
+    """
+    global _task, _users
+    _users += 1
+    if _task is None or _task.done():
+        # 도구 호출보다 낮은 우선순위로 업스트림을 호출합니다.
+        _task = asyncio.get_running_loop().create_task(_run(), context=detached_context())
+
+async def stop_refresh_scheduler() -> None:
+    """인기 검색 갱신 작업 사용을 종료합니다. 마지막 사용자가 종료하면 작업을 멈춥니다."""
+    global _task, _users
+    _users = max(_users - 1, 0)
+    if _users == 0 and _task is not None:
+        task, _task = _task, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
@@ -0,0 +1,32 @@
+import logging
+from typing import Dict, Any
+from maat_mcp.handlers.google_maps_api_handler import get_location_from_google_maps
+from maat_mcp.util.gazetteer import lookup_region
+
+logger = logging.getLogger(__name__)
+
+async def get_region_location(region_name: str) -> Dict[str, Any]:
+    """지역명의 좌표와 검색 반경을 조회합니다.
+
+    내장 지역 좌표 테이블을 먼저 조회하고, 테이블에 없는 지명만 Geocoding API로 조회합니다.
+
+    Args:
+        region_name (str): 지역명 (예: '강남', '홍대')
+
+    Returns:
+        Dict[str, Any]: 위치 정보 (위도, 경도, 검색 반경, 지역명)
+
+    Raises:
+        Exception: 지명 좌표 조회 실패 시
+    """
+    try:
+        location = lookup_region(region_name)
+        if location is None:
+            logger.info("지역 좌표 테이블에 없는 지명입니다. 지오코딩으로 조회합니다: %s", region_name)
+            location = await get_location_from_google_maps(region_name)
+
+        location["region"] = region_name
+        return location
+    except Exception as e:
+        logger.error(f"지역 좌표 조회 중 에러 발생: {str(e)}")
+        raise
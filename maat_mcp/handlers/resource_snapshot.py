@@ -0,0 +1,166 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import weakref
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+from pydantic import AnyUrl
+from maat_mcp.config import Config
+from maat_mcp.handlers.service_implementation import find_restaurants
+from maat_mcp.util.resilience import detached_context
+from maat_mcp.util.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+class ResourceSnapshot:
+    """백그라운드에서 주기적으로 다시 만드는 리소스 스냅숏입니다.
+
+    읽기는 마지막 스냅숏을 그대로 반환하므로 업스트림을 호출하지 않습니다 (스냅숏이 없거나
+    interval의 두 배 넘게 오래되었을 때만 읽는 쪽에서 다시 만듭니다). 다시 만든 내용의 ETag가
+    바뀌었을 때만 version을 올리고 구독한 세션에 resources/updated 알림을 보냅니다.
+
+    Args:
+        uri (str): 리소스 URI
+        build (Callable[[], Awaitable[Dict[str, Any]]]): 리소스 내용을 만드는 함수
+        interval (float, optional): 다시 만드는 주기(초), 없으면 Config.RESOURCE_REFRESH_INTERVAL
+    """
+
+    def __init__(self, uri: str, build: Callable[[], Awaitable[Dict[str, Any]]], interval: float = None):
+        self.uri = uri
+        self.build = build
+        self.interval = interval or Config.RESOURCE_REFRESH_INTERVAL
+        self.version = 0
+        self.etag: Optional[str] = None
+        self.generated_at: Optional[str] = None
+        self.data: Optional[Dict[str, Any]] = None
+        self._built_at = 0.0
+        self._subscribers: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self._single_flight = SingleFlight()
+        self._task: Optional[asyncio.Task] = None
+        self._users = 0
+        self.reads = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.notifications = 0
+
+    async def read(self) -> Dict[str, Any]:
+        """스냅숏을 반환합니다.
+
+        Returns:
+            Dict[str, Any]: {"version", "etag", "generated_at", "data"}
+
+        Raises:
+            Exception: 스냅숏이 없는데 만들지 못한 경우
+        """
+        self.reads += 1
+        if self.data is None or time.monotonic() - self._built_at > self.interval * 2:
+            try:
+                await self.refresh()
+            except Exception:
+                if self.data is None:
+                    raise
+        return {
+            "version": self.version,
+            "etag": self.etag,
+            "generated_at": self.generated_at,
+            "data": self.data
+        }
+
+    async def refresh(self) -> bool:
+        """리소스 내용을 다시 만듭니다. 동시에 호출되면 한 번만 만듭니다.
+
+        Returns:
+            bool: 내용이 바뀌었으면 True
+        """
+        return await self._single_flight.do(self.uri, self._refresh)
+
+    async def _refresh(self) -> bool:
+        try:
+            data = await self.build()
+        except Exception:
+            self.refresh_errors += 1
+            raise
+        self.refreshes += 1
+        self._built_at = time.monotonic()
+        etag = hashlib.sha256(json.dumps(data, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()[:16]
+        if etag == self.etag:
+            return False
+
+        self.data = data
+        self.etag = etag
+        self.version += 1
+        self.generated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        logger.info("리소스 스냅숏 갱신: %s (version %d)", self.uri, self.version)
+        if self.version > 1:
+            await self._notify()
+        return True
+
+    async def _notify(self) -> None:
+        """구독한 세션에 리소스 변경을 알립니다. 알림을 보낼 수 없는 세션은 구독을 해지합니다."""
+        uri = AnyUrl(self.uri)
+        for session in list(self._subscribers):
+            try:
+                await session.send_resource_updated(uri)
+                self.notifications += 1
+            except Exception as e:
+                logger.info("리소스 변경 알림 실패, 구독을 해지합니다: %s (%s)", self.uri, e)
+                self._subscribers.discard(session)
+
+    def subscribe(self, session: Any) -> None:
+        """세션이 리소스 변경 알림을 받도록 등록합니다. 세션이 끝나면 자동으로 해지됩니다."""
+        self._subscribers.add(session)
+
+    def unsubscribe(self, session: Any) -> None:
+        """세션의 리소스 변경 알림 구독을 해지합니다."""
+        self._subscribers.discard(session)
+
+    async def _run(self) -> None:
+        """interval마다 스냅숏을 다시 만듭니다."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning("리소스 스냅숏 갱신 실패: %s (%s)", self.uri, e)
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """백그라운드 갱신을 시작합니다. 참조 카운트로 관리하며, 프로세스마다 작업은 하나만 실행합니다."""
+        self._users += 1
+        if self._task is None or self._task.done():
+            # 도구 호출보다 낮은 우선순위로 업스트림을 호출합니다.
+            self._task = asyncio.get_running_loop().create_task(self._run(), context=detached_context())
+
+    async def stop(self) -> None:
+        """백그라운드 갱신 사용을 종료합니다. 마지막 사용자가 종료하면 작업을 멈춥니다."""
+        self._users = max(self._users - 1, 0)
+        if self._users == 0 and self._task is not None:
+            task, self._task = self._task, None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        """스냅숏 버전과 읽기/갱신/알림 통계를 반환합니다."""
+        return {
+            "version": self.version,
+            "etag": self.etag,
+            "generated_at": self.generated_at,
+            "subscribers": len(self._subscribers),
+            "reads": self.reads,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+            "notifications": self.notifications
+        }
+
+async def _build_restaurant_results() -> Dict[str, Any]:
+    """기본 검색어("맛집")의 검색 결과를 만듭니다. 매번 바뀌는 timestamp는 뺍니다."""
+    response = await find_restaurants("맛집")
+    response.pop("timestamp", None)
+    return response
+
+# maat://restaurant_results 리소스 스냅숏
+restaurant_results_snapshot = ResourceSnapshot("maat://restaurant_results", _build_restaurant_results)
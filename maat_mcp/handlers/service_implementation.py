@@ -1,67 +1,190 @@
 import asyncio
-import random
 import logging
-from typing import Dict, Any, Optional
+from typing import Awaitable, Dict, Any, List, Optional, Tuple, Union
 
 from maat_mcp.handlers.ip_location_api_handler import get_ip_location_info
-from maat_mcp.handlers.google_maps_api_handler import get_restaurants_from_google_maps
-from maat_mcp.util import process_search_query, has_region_info
+from maat_mcp.handlers.google_maps_api_handler import get_restaurants_from_google_maps, recommend_restaurants
+from maat_mcp.handlers.region_location_handler import get_region_location
+from maat_mcp.config import Config
+from maat_mcp.util import latency_budget, process_search_query
+from maat_mcp.util.metrics import STAGE_DURATION
+from maat_mcp.util.response_format import format_response, parse_format
+from maat_mcp.util.restaurant import parse_fields
 
 logger = logging.getLogger(__name__)
 
-async def find_restaurants(query: str, context: str = "") -> Dict[str, Any]:
-    """맛집 검색의 내부 구현 함수입니다."""
+def _search_region(parsed_query: Dict[str, Any]) -> Optional[str]:
+    """검색할 지역명을 반환합니다. 현재 위치로 검색해야 하면 None을 반환합니다."""
+    if parsed_query["location"] and not parsed_query["use_current_location"]:
+        return parsed_query["location"]
+    return None
+
+async def _resolve_region(region: Optional[str]) -> Dict[str, Any]:
+    """지역명의 좌표를, 지역명이 없으면 IP 기반 위치를 조회합니다."""
+    if region:
+        return await get_region_location(region)
+    return await get_ip_location_info()
+
+async def resolve_search_location(parsed_query: Dict[str, Any]) -> Dict[str, Any]:
+    """검색 위치를 결정합니다.
+
+    검색어에 지역명이 있고 현재 위치 검색이 아니면 지역 좌표를, 아니면 IP 기반 위치를 사용합니다.
+    """
+    return await _resolve_region(_search_region(parsed_query))
+
+async def find_restaurants(query: str, context: str = "", sort: Optional[str] = None, limit: Optional[int] = None, fields: Optional[List[str]] = None, format: Optional[str] = None, details: bool = False) -> Union[Dict[str, Any], str]:
+    """맛집 검색의 내부 구현 함수입니다. 업스트림 요청 전체에 Config.TOOL_LATENCY_BUDGET을 적용합니다.
+
+    fields와 format은 업스트림 요청 전에 검증합니다. format이 json이 아니면 문자열을 반환합니다.
+    details가 True이면 상위 맛집에 영업시간, 전화번호, 가격대 등 상세 정보를 붙입니다.
+    """
     try:
-        parsed_query = process_search_query(query, context)
-        location_info = await get_ip_location_info()
-        restaurants = await get_restaurants_from_google_maps(
-            location_info["latitude"],
-            location_info["longitude"],
-            parsed_query["search_query"]
-        )
-        return {
-            "location": location_info,
-            "restaurants": restaurants,
-            "search_query": parsed_query["search_query"],
-            "timestamp": asyncio.get_event_loop().time()
-        }
+        fields = parse_fields(fields)
+        format = parse_format(format)
+        if limit is not None and limit < 1:
+            raise ValueError("반환할 맛집 수는 1 이상이어야 합니다.")
+        with latency_budget():
+            with STAGE_DURATION.time("parse"):
+                parsed_query = process_search_query(query, context)
+            with STAGE_DURATION.time("location"):
+                location_info = await resolve_search_location(parsed_query)
+            restaurants = await get_restaurants_from_google_maps(
+                location_info["latitude"],
+                location_info["longitude"],
+                parsed_query["search_query"],
+                location_info.get("radius"),
+                sort,
+                limit,
+                fields,
+                details
+            )
+            response = {
+                "location": location_info,
+                "restaurants": restaurants,
+                "search_query": parsed_query["search_query"],
+                "timestamp": asyncio.get_event_loop().time()
+            }
+            with STAGE_DURATION.time("format"):
+                return format_response(response, format, "restaurants", fields + ("details",) if fields and details else fields)
     except Exception as e:
         logger.error(f"맛집 검색 중 에러 발생: {str(e)}")
         raise
 
-async def find_random_restaurant(category: Optional[str] = None) -> Dict[str, Any]:
-    """랜덤 맛집 추천의 내부 구현 함수입니다."""
+async def find_restaurants_batch(queries: List[str], context: str = "", sort: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+    """여러 검색어의 맛집 검색을 한 번에 처리하는 내부 구현 함수입니다.
+
+    모든 검색어를 먼저 분석한 뒤, 위치(지역명 또는 현재 위치)는 서로 다른 것만 한 번씩 조회하고,
+    위치와 검색어가 같은 검색은 한 번만 요청합니다. 주변 검색은 Config.BATCH_CONCURRENCY개까지
+    동시에 실행합니다. 한 검색어가 실패해도 나머지 결과는 반환하며, 실패한 검색어에는 error를 담습니다.
+
+    Args:
+        queries (List[str]): 검색어 목록
+        context (str, optional): 이전 대화 내용
+        sort (str, optional): 정렬 방식
+        limit (int, optional): 검색어별 반환할 최대 맛집 수
+
+    Returns:
+        Dict[str, Any]: 검색어 순서대로의 결과 목록(results)과 timestamp
+    """
     try:
-        # 카테고리가 있는 경우와 없는 경우 모두 process_search_query를 통해 처리
-        parsed_query = process_search_query(category if category else "맛집")
-        
-        # 카테고리에 지역 정보가 없는 경우에만 현재 위치 사용
-        if not has_region_info(parsed_query["search_query"]):
-            location_info = await get_ip_location_info()
-            restaurants = await get_restaurants_from_google_maps(
+        if not queries:
+            raise Exception("검색어가 없습니다.")
+        if len(queries) > Config.BATCH_MAX_QUERIES:
+            raise Exception(f"한 번에 검색할 수 있는 검색어는 최대 {Config.BATCH_MAX_QUERIES}개입니다.")
+        if limit is not None and limit < 1:
+            raise ValueError("검색어별 반환할 맛집 수는 1 이상이어야 합니다.")
+
+        with latency_budget():
+            with STAGE_DURATION.time("parse"):
+                parsed_queries = [process_search_query(query, context) for query in queries]
+
+            # 서로 다른 위치만 한 번씩 조회합니다 (현재 위치는 IP 조회 한 번).
+            regions = [_search_region(parsed_query) for parsed_query in parsed_queries]
+            unique_regions = list(dict.fromkeys(regions))
+            with STAGE_DURATION.time("location"):
+                resolved = await asyncio.gather(*(_resolve_region(region) for region in unique_regions), return_exceptions=True)
+            locations = dict(zip(unique_regions, resolved))
+
+            # 위치와 검색어가 같은 검색은 한 번만 요청합니다.
+            semaphore = asyncio.Semaphore(Config.BATCH_CONCURRENCY)
+            searches: Dict[Tuple[Optional[str], str], Awaitable[List[Dict[str, Any]]]] = {}
+            for region, parsed_query in zip(regions, parsed_queries):
+                key = (region, parsed_query["search_query"])
+                location_info = locations[region]
+                if key in searches or isinstance(location_info, BaseException):
+                    continue
+                searches[key] = _bounded(semaphore, get_restaurants_from_google_maps(
+                    location_info["latitude"],
+                    location_info["longitude"],
+                    parsed_query["search_query"],
+                    location_info.get("radius"),
+                    sort,
+                    limit
+                ))
+            search_results = dict(zip(searches, await asyncio.gather(*searches.values(), return_exceptions=True)))
+
+            results = []
+            for query, region, parsed_query in zip(queries, regions, parsed_queries):
+                location_info = locations[region]
+                restaurants = search_results.get((region, parsed_query["search_query"]), location_info)
+                result = {"query": query, "search_query": parsed_query["search_query"]}
+                if isinstance(restaurants, BaseException):
+                    logger.warning("일괄 검색 중 검색어 실패: %s (%s)", query, restaurants)
+                    result["error"] = str(restaurants) or type(restaurants).__name__
+                else:
+                    result["location"] = location_info
+                    result["restaurants"] = restaurants
+                results.append(result)
+
+            return {
+                "results": results,
+                "timestamp": asyncio.get_event_loop().time()
+            }
+    except Exception as e:
+        logger.error(f"맛집 일괄 검색 중 에러 발생: {str(e)}")
+        raise
+
+async def _bounded(semaphore: asyncio.Semaphore, awaitable: Awaitable[Any]) -> Any:
+    """세마포어 안에서 awaitable을 실행합니다."""
+    async with semaphore:
+        return await awaitable
+
+async def find_random_restaurant(category: Optional[str] = None, limit: Optional[int] = None, fields: Optional[List[str]] = None, format: Optional[str] = None) -> Union[Dict[str, Any], str]:
+    """랜덤 맛집 추천의 내부 구현 함수입니다. 업스트림 요청 전체에 Config.TOOL_LATENCY_BUDGET을 적용합니다.
+
+    같은 지역과 음식 종류의 후보 풀에서 중복 없이 뽑으므로, 두 번째 추천부터는 업스트림 호출 없이 응답합니다.
+    limit이 없으면 맛집 하나(restaurant)를, 있으면 서로 다른 맛집 최대 limit개(restaurants)를 반환합니다.
+    """
+    try:
+        fields = parse_fields(fields)
+        format = parse_format(format)
+        if limit is not None and not 1 <= limit <= Config.MAX_RANDOM_RECOMMENDATIONS:
+            raise ValueError(f"추천 개수는 1~{Config.MAX_RANDOM_RECOMMENDATIONS} 사이여야 합니다.")
+        with latency_budget():
+            # 카테고리가 있는 경우와 없는 경우 모두 process_search_query를 통해 처리
+            with STAGE_DURATION.time("parse"):
+                parsed_query = process_search_query(category if category else "맛집")
+
+            # 카테고리에 지역 정보가 있으면 지역 좌표를, 없으면 현재 위치를 사용
+            with STAGE_DURATION.time("location"):
+                location_info = await resolve_search_location(parsed_query)
+            restaurants = await recommend_restaurants(
                 location_info["latitude"],
                 location_info["longitude"],
-                parsed_query["search_query"]
+                parsed_query["search_query"],
+                location_info.get("radius"),
+                limit or 1
             )
-        else:
-            # 지역 정보가 있는 경우 위치 정보 없이 검색
-            location_info = {"latitude": None, "longitude": None}
-            restaurants = await get_restaurants_from_google_maps(
-                None,
-                None,
-                parsed_query["search_query"]
-            )
-        
-        if not restaurants:
-            raise Exception("추천할 맛집이 없습니다.")
-            
-        restaurant = random.choice(restaurants)
-        return {
-            "location": location_info,
-            "restaurant": restaurant,
-            "search_query": parsed_query["search_query"],
-            "timestamp": asyncio.get_event_loop().time()
-        }
+            records_key = "restaurant" if limit is None else "restaurants"
+            records = [restaurant.to_dict(fields) for restaurant in restaurants]
+            response = {
+                "location": location_info,
+                records_key: records[0] if limit is None else records,
+                "search_query": parsed_query["search_query"],
+                "timestamp": asyncio.get_event_loop().time()
+            }
+            with STAGE_DURATION.time("format"):
+                return format_response(response, format, records_key, fields)
     except Exception as e:
         logger.error(f"랜덤 맛집 추천 중 에러 발생: {str(e)}")
-        raise 
\ No newline at end of file
+        raise
@@ -1,6 +1,59 @@
-from maat_mcp.util.query_parser import process_search_query, has_region_info
+from maat_mcp.util.query_parser import expand_search_query, process_search_query, has_region_info
+from maat_mcp.util.cache import TTLCache
+from maat_mcp.util.client_ip import client_ip_from_request
+from maat_mcp.util.single_flight import SingleFlight
+from maat_mcp.util.persistent_cache import PersistentStore, close_persistent_store, get_persistent_store, open_persistent_store
+from maat_mcp.util.metrics import MetricsRegistry
+from maat_mcp.util.ip_range_db import IpRangeDatabase, build_database
+from maat_mcp.util.keyword_matcher import KeywordMatcher
+from maat_mcp.util.spatial_index import PlaceSpatialIndex
+from maat_mcp.util.candidate_pool import CandidatePool
+from maat_mcp.util.popularity import PopularityTracker
+from maat_mcp.util.rate_limiter import RateLimitTimeoutError, TokenBucketScheduler, get_rate_limiter_stats
+from maat_mcp.util.restaurant import Restaurant, parse_fields, rank_restaurants, select_by_rating_tier
+from maat_mcp.util.response_format import FORMAT_OPTIONS, format_response
+from maat_mcp.util.resilience import (
+    BudgetExceededError,
+    CircuitBreaker,
+    CircuitOpenError,
+    first_successful,
+    get_circuit_breaker_stats,
+    latency_budget,
+    request_priority
+)
 
 __all__ = [
+    'expand_search_query',
     'process_search_query',
-    'has_region_info'
+    'has_region_info',
+    'TTLCache',
+    'client_ip_from_request',
+    'SingleFlight',
+    'PersistentStore',
+    'close_persistent_store',
+    'get_persistent_store',
+    'open_persistent_store',
+    'MetricsRegistry',
+    'IpRangeDatabase',
+    'build_database',
+    'KeywordMatcher',
+    'PlaceSpatialIndex',
+    'CandidatePool',
+    'PopularityTracker',
+    'RateLimitTimeoutError',
+    'TokenBucketScheduler',
+    'get_rate_limiter_stats',
+    'Restaurant',
+    'parse_fields',
+    'FORMAT_OPTIONS',
+    'format_response',
+    'rank_restaurants',
+    'select_by_rating_tier',
+    'BudgetExceededError',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'first_successful',
+    'get_circuit_breaker_stats',
+    'latency_budget',
+    'request_priority'
 ] 
\ No newline at end of file
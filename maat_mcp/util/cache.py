@@ -0,0 +1,119 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+from maat_mcp.config import Config
+
+class TTLCache:
+    """TTL 만료와 LRU 축출을 지원하는 메모리 캐시입니다.
+
+    항목 수가 max_size를 넘으면 가장 오래 사용되지 않은 항목부터 축출하고,
+    TTL이 지난 항목은 조회 시점에 제거합니다.
+    store(영구 캐시 구역)가 있으면 저장한 값을 함께 기록하고, 메모리에 없는 키는 store에서 읽어 옵니다.
+    store 읽기는 호출한 스레드를 막으므로 이벤트 루프에서는 get_async()를 사용합니다.
+    stale_ttl이 있으면 만료된 항목을 그 시간만큼 더 보관해 get_stale()로 읽을 수 있습니다.
+    """
+
+    def __init__(self, max_size: int = None, ttl: float = None, store: Any = None, stale_ttl: float = 0):
+        self.max_size = max_size or Config.MAX_CACHE_SIZE
+        self.ttl = ttl or Config.CACHE_TTL
+        self.store = store
+        self.stale_ttl = stale_ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.store_hits = 0
+        self.stale_hits = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 값을 반환합니다. 없거나 만료된 경우 None을 반환합니다."""
+        value = self._get_memory(key)
+        if value is not None:
+            return value
+        return self._accept(key, self.store.get(key) if self.store is not None else None)
+
+    async def get_async(self, key: Hashable) -> Optional[Any]:
+        """get()과 같지만 메모리에 없는 키의 store 읽기를 스레드에서 실행합니다."""
+        value = self._get_memory(key)
+        if value is not None:
+            return value
+        loaded = await asyncio.to_thread(self.store.get, key) if self.store is not None else None
+        return self._accept(key, loaded)
+
+    def _get_memory(self, key: Hashable) -> Optional[Any]:
+        """메모리에 있는 만료되지 않은 값을 반환합니다. 유예 시간까지 지난 항목은 제거합니다."""
+        entry = self._data.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            now = time.monotonic()
+            if expires_at > now:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            if expires_at + self.stale_ttl <= now:
+                del self._data[key]
+                self.expirations += 1
+        return None
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """만료되었지만 유예 시간(stale_ttl) 안에 있는 값을 반환합니다. 없으면 None을 반환합니다."""
+        entry = self._data.get(key)
+        if entry is None or entry[0] + self.stale_ttl <= time.monotonic():
+            return None
+        self.stale_hits += 1
+        return entry[1]
+
+    def remaining_ttl(self, key: Hashable) -> Optional[float]:
+        """메모리에 있는 항목의 남은 TTL(초)을 반환합니다. 만료된 항목은 음수, 없으면 None을 반환합니다."""
+        entry = self._data.get(key)
+        return None if entry is None else entry[0] - time.monotonic()
+
+    def _accept(self, key: Hashable, loaded: Optional[Tuple[Any, float]]) -> Optional[Any]:
+        """store에서 읽은 (값, 남은 TTL)을 메모리에 올립니다. 없으면 미스로 셉니다."""
+        if loaded is None:
+            self.misses += 1
+            return None
+        value, ttl = loaded
+        self._put(key, value, ttl)
+        self.hits += 1
+        self.store_hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float = None) -> None:
+        """값을 저장합니다. 용량을 넘으면 가장 오래된 항목을 축출합니다."""
+        ttl = ttl or self.ttl
+        self._put(key, value, ttl)
+        if self.store is not None:
+            self.store.set(key, value, ttl)
+
+    def _put(self, key: Hashable, value: Any, ttl: float) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다. 통계는 유지됩니다."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/미스/축출 통계를 반환합니다."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "store_hits": self.store_hits,
+            "stale_hits": self.stale_hits,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Set, TypeVar
+from maat_mcp.config import Config
+from maat_mcp.util.resilience import detached_context
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class _Pool:
+    """키 하나의 후보 목록과 이미 뽑은 후보"""
+
+    __slots__ = ("candidates", "served", "fetched_at", "refill", "low_water_armed")
+
+    def __init__(self):
+        self.candidates: List[Any] = []
+        self.served: Set[Hashable] = set()
+        self.fetched_at = 0.0
+        self.refill: Optional[asyncio.Future] = None
+        # 마지막으로 채울 때 후보가 넉넉했으면 True (후보가 원래 적으면 줄어도 다시 채우지 않음)
+        self.low_water_armed = False
+
+class CandidatePool(Generic[T]):
+    """키(지역, 검색어)별 후보를 미리 받아 두고 중복 없이 하나씩 뽑아 주는 풀입니다.
+
+    후보는 섞은 뒤 하나씩 꺼내므로 같은 풀에서 같은 후보가 다시 나오지 않습니다.
+    남은 후보가 low_water개 이하가 되거나 받은 지 ttl이 지나면 백그라운드에서 다시 채웁니다.
+    이때 이미 뽑은 후보는 빼고, 모든 후보를 한 번씩 뽑았으면 처음부터 다시 뽑습니다.
+    후보가 하나도 없을 때만 호출자가 채우기를 기다립니다.
+    """
+
+    def __init__(self, ttl: float = None, low_water: int = None, max_pools: int = None):
+        self.ttl = ttl or Config.RANDOM_POOL_TTL
+        self.low_water = Config.RANDOM_POOL_LOW_WATER if low_water is None else low_water
+        self.max_pools = max_pools or Config.RANDOM_POOL_MAX_POOLS
+        self._pools: "OrderedDict[Hashable, _Pool]" = OrderedDict()
+        self._rng = random.Random()
+        self.hits = 0
+        self.misses = 0
+        self.refills = 0
+        self.refill_errors = 0
+
+    async def draw(self, key: Hashable, fetch: Callable[[], Awaitable[List[T]]], identity: Callable[[T], Hashable]) -> T:
+        """아직 뽑지 않은 후보 하나를 반환합니다.
+
+        Args:
+            key (Hashable): 풀 키
+            fetch (Callable[[], Awaitable[List[T]]]): 후보 목록을 가져오는 함수
+            identity (Callable[[T], Hashable]): 후보의 고유 식별자를 반환하는 함수
+
+        Raises:
+            Exception: 후보가 없거나 가져오기에 실패한 경우
+        """
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _Pool()
+            while len(self._pools) > self.max_pools:
+                self._pools.popitem(last=False)
+        self._pools.move_to_end(key)
+
+        if pool.candidates:
+            self.hits += 1
+        else:
+            self.misses += 1
+        while not pool.candidates:
+            if pool.refill is None:
+                pool.refill = asyncio.ensure_future(self._refill(pool, fetch, identity))
+                pool.refill.add_done_callback(self._log_refill_error)
+            refill = pool.refill
+            await asyncio.shield(refill)
+            # 함께 기다린 다른 호출자가 후보를 모두 가져갔으면 다시 채웁니다.
+            if not refill.result():
+                raise Exception("추천할 후보가 없습니다.")
+
+        candidate = pool.candidates.pop()
+        pool.served.add(identity(candidate))
+
+        stale = time.monotonic() - pool.fetched_at >= self.ttl
+        low = pool.low_water_armed and len(pool.candidates) <= self.low_water
+        if pool.refill is None and (low or stale):
+            # 도구 호출의 지연 시간 예산과 무관하게 백그라운드에서 채웁니다.
+            pool.refill = asyncio.get_running_loop().create_task(
+                self._refill(pool, fetch, identity),
+                context=detached_context()
+            )
+            pool.refill.add_done_callback(self._log_refill_error)
+        return candidate
+
+    async def _refill(self, pool: _Pool, fetch: Callable[[], Awaitable[List[T]]], identity: Callable[[T], Hashable]) -> int:
+        """후보를 새로 받아 이미 뽑은 후보를 빼고 섞어 둡니다. 채운 후보 수를 반환합니다."""
+        try:
+            fresh = await fetch()
+            candidates = [candidate for candidate in fresh if identity(candidate) not in pool.served]
+            if not candidates and fresh:
+                # 모든 후보를 한 번씩 뽑았으면 처음부터 다시 뽑습니다.
+                pool.served.clear()
+                candidates = list(fresh)
+            self._rng.shuffle(candidates)
+            pool.candidates = candidates
+            pool.low_water_armed = len(candidates) > self.low_water
+            pool.fetched_at = time.monotonic()
+            self.refills += 1
+            return len(candidates)
+        except Exception:
+            self.refill_errors += 1
+            raise
+        finally:
+            pool.refill = None
+
+    @staticmethod
+    def _log_refill_error(task: asyncio.Future) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("후보 풀 채우기 실패: %s", task.exception())
+
+    def clear(self) -> None:
+        """모든 풀을 제거합니다."""
+        self._pools.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 수와 적중/미스/채우기 통계를 반환합니다."""
+        return {
+            "size": len(self._pools),
+            "candidates": sum(len(pool.candidates) for pool in self._pools.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "refills": self.refills,
+            "refill_errors": self.refill_errors
+        }
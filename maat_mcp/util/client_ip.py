@@ -0,0 +1,66 @@
+import ipaddress
+import logging
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Union
+from maat_mcp.config import Config
+
+logger = logging.getLogger(__name__)
+
+IpNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+@lru_cache(maxsize=8)
+def _parse_networks(spec: str) -> Tuple[IpNetwork, ...]:
+    """쉼표로 구분한 IP/CIDR 목록을 네트워크 목록으로 변환합니다. 잘못된 항목은 건너뜁니다."""
+    networks = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            networks.append(ipaddress.ip_network(item, strict=False))
+        except ValueError:
+            logger.warning("TRUSTED_PROXIES의 잘못된 항목을 무시합니다: %s", item)
+    return tuple(networks)
+
+def _parse_ip(value: Optional[str]) -> Optional[Union[ipaddress.IPv4Address, ipaddress.IPv6Address]]:
+    if not value:
+        return None
+    try:
+        return ipaddress.ip_address(value.strip())
+    except ValueError:
+        return None
+
+def _is_trusted(ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address], trusted: Tuple[IpNetwork, ...]) -> bool:
+    return any(ip in network for network in trusted)
+
+def client_ip_from_request(request: Any, trusted_proxies: str = None) -> Optional[str]:
+    """HTTP 요청을 보낸 클라이언트의 공인 IP를 반환합니다.
+
+    직접 연결한 상대가 신뢰하는 프록시(Config.TRUSTED_PROXIES)일 때만 X-Forwarded-For를 따르며,
+    오른쪽(가장 가까운 프록시)부터 신뢰하는 프록시를 건너뛴 첫 주소를 클라이언트로 봅니다.
+    요청이 없거나(stdio) 클라이언트 주소가 사설/루프백 대역이면 None을 반환합니다
+    (이 경우 서버 자신의 공인 IP 위치를 사용합니다).
+
+    Args:
+        request (Any): Starlette Request (request.client, request.headers)
+        trusted_proxies (str, optional): 쉼표로 구분한 IP/CIDR 목록, 없으면 Config.TRUSTED_PROXIES
+    """
+    if request is None or request.client is None:
+        return None
+    trusted = _parse_networks(Config.TRUSTED_PROXIES if trusted_proxies is None else trusted_proxies)
+
+    ip = _parse_ip(request.client.host)
+    if ip is not None and _is_trusted(ip, trusted):
+        forwarded = request.headers.get("x-forwarded-for", "")
+        for hop in reversed(forwarded.split(",")):
+            hop_ip = _parse_ip(hop)
+            if hop_ip is None:
+                # 알 수 없는 형식의 주소 뒤로는 따라가지 않습니다.
+                break
+            ip = hop_ip
+            if not _is_trusted(hop_ip, trusted):
+                break
+
+    if ip is None or not ip.is_global:
+        return None
+    return str(ip)
@@ -0,0 +1,57 @@
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+from maat_mcp.config import Config
+
+logger = logging.getLogger(__name__)
+
+# 기본 지역 좌표 테이블 (query_parser.DETAILED_REGIONS 전체 포함)
+BUILTIN_REGIONS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "regions.json")
+
+def _load_regions(path: str) -> Dict[str, Dict[str, Any]]:
+    """지역 좌표 파일을 읽습니다.
+
+    파일 형식: {"지역명": {"latitude": 위도, "longitude": 경도, "radius": 검색 반경(m)}}
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    regions = {}
+    for name, entry in data.items():
+        regions[name] = {
+            "latitude": float(entry["latitude"]),
+            "longitude": float(entry["longitude"]),
+            "radius": int(entry.get("radius", Config.SEARCH_RADIUS))
+        }
+    return regions
+
+def _build_gazetteer() -> Dict[str, Dict[str, Any]]:
+    """기본 테이블과 추가 지역 파일(Config.GAZETTEER_PATH)을 합칩니다."""
+    regions = _load_regions(BUILTIN_REGIONS_PATH)
+    if Config.GAZETTEER_PATH:
+        try:
+            extra = _load_regions(Config.GAZETTEER_PATH)
+            regions.update(extra)
+            logger.info("추가 지역 좌표 %d개 로드: %s", len(extra), Config.GAZETTEER_PATH)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"추가 지역 좌표 파일을 읽을 수 없습니다: {str(e)}")
+    return regions
+
+_GAZETTEER = _build_gazetteer()
+
+def lookup_region(name: str) -> Optional[Dict[str, Any]]:
+    """지역명의 좌표와 검색 반경을 반환합니다.
+
+    Args:
+        name (str): 지역명
+
+    Returns:
+        Optional[Dict[str, Any]]: {"latitude", "longitude", "radius"}, 없으면 None
+    """
+    entry = _GAZETTEER.get(name.strip())
+    return dict(entry) if entry else None
+
+def region_names() -> List[str]:
+    """좌표 테이블에 있는 모든 지역명을 반환합니다."""
+    return list(_GAZETTEER)
@@ -0,0 +1,213 @@
+"""IP 대역 기반 오프라인 위치 조회 데이터베이스
+
+IP2Location LITE(DB5) 형식의 CSV를 정렬된 컬럼형 바이너리 파일로 변환하고,
+메모리 맵(mmap)으로 연 파일에서 이진 탐색으로 위치를 조회합니다.
+
+바이너리 형식 (리틀 엔디언):
+    헤더 16바이트: magic(8) + 대역 수(uint32) + 문자열 수(uint32)
+    starts[n] uint32, ends[n] uint32, latitudes[n] float32, longitudes[n] float32,
+    city_ids[n] uint32, country_ids[n] uint32,
+    string_offsets[m + 1] uint32, UTF-8 문자열 데이터
+
+사용법:
+    python -m maat_mcp.util.ip_range_db input.csv output.bin
+"""
+import csv
+import ipaddress
+import logging
+import mmap
+import socket
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"MAATIP1\x00"
+HEADER = struct.Struct("<8sII")
+
+def _ip_to_int(value: str) -> int:
+    """정수 또는 점 표기 IPv4 문자열을 정수로 변환합니다."""
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    return int(ipaddress.IPv4Address(value))
+
+def build_database(csv_path: str, output_path: str) -> int:
+    """IP2Location LITE(DB5) 형식 CSV를 바이너리 데이터베이스로 변환합니다.
+
+    CSV 컬럼: ip_from, ip_to, country_code, country_name, region_name,
+    city_name, latitude, longitude
+
+    Args:
+        csv_path (str): 입력 CSV 경로
+        output_path (str): 출력 바이너리 경로
+
+    Returns:
+        int: 저장된 IP 대역 수
+    """
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    rows: List[Tuple[int, int, float, float, int, int]] = []
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if not row or row[0].startswith("#") or not row[0].strip()[:1].isdigit():
+                continue
+            ip_from, ip_to = _ip_to_int(row[0]), _ip_to_int(row[1])
+            # IPv6 대역과 예약 대역("-")은 건너뜁니다.
+            if ip_from > 0xFFFFFFFF or ip_to > 0xFFFFFFFF or row[2].strip() == "-":
+                continue
+            rows.append((
+                ip_from,
+                ip_to,
+                float(row[6]),
+                float(row[7]),
+                intern(row[5].strip()),
+                intern(row[3].strip())
+            ))
+
+    rows.sort()
+    for previous, current in zip(rows, rows[1:]):
+        if current[0] <= previous[1]:
+            raise ValueError(f"IP 대역이 겹칩니다: {previous[:2]} / {current[:2]}")
+
+    columns = [array("I"), array("I"), array("f"), array("f"), array("I"), array("I")]
+    for row in rows:
+        for column, value in zip(columns, row):
+            column.append(value)
+
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = array("I", [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+
+    if sys.byteorder != "little":
+        for column in columns + [offsets]:
+            column.byteswap()
+
+    with open(output_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(rows), len(strings)))
+        for column in columns:
+            column.tofile(f)
+        offsets.tofile(f)
+        f.write(b"".join(encoded))
+
+    logger.info("IP 대역 데이터베이스 생성 완료: %d개 대역, %d개 문자열", len(rows), len(strings))
+    return len(rows)
+
+class IpRangeDatabase:
+    """메모리 맵 파일에서 IPv4 대역을 이진 탐색하는 위치 조회기입니다.
+
+    도시/국가 문자열은 로드 시 한 번만 디코딩하며, 조회 시에는 파일을 복사하거나
+    파싱하지 않고 메모리 맵 위의 컬럼을 직접 탐색합니다.
+    위치 정보 딕셔너리는 대역마다 처음 조회할 때 한 번만 만들고 이후 조회에서는 같은 객체를 반환하므로,
+    호출자는 반환값을 수정하지 않습니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count, string_count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"IP 대역 데이터베이스 형식이 올바르지 않습니다: {path}")
+        self._count = count
+        self._locations: Dict[int, Dict[str, Any]] = {}
+
+        offset = HEADER.size
+        self._starts = self._column(offset, "I", count)
+        offset += 4 * count
+        self._ends = self._column(offset, "I", count)
+        offset += 4 * count
+        self._latitudes = self._column(offset, "f", count)
+        offset += 4 * count
+        self._longitudes = self._column(offset, "f", count)
+        offset += 4 * count
+        self._city_ids = self._column(offset, "I", count)
+        offset += 4 * count
+        self._country_ids = self._column(offset, "I", count)
+        offset += 4 * count
+
+        string_offsets = self._column(offset, "I", string_count + 1)
+        offset += 4 * (string_count + 1)
+        self._strings = [
+            self._mmap[offset + string_offsets[i]:offset + string_offsets[i + 1]].decode("utf-8")
+            for i in range(string_count)
+        ]
+
+    def _column(self, offset: int, typecode: str, count: int):
+        """파일의 한 컬럼을 복사 없이 가리키는 뷰를 반환합니다."""
+        if sys.byteorder == "little":
+            return memoryview(self._mmap)[offset:offset + 4 * count].cast(typecode)
+        # 빅 엔디언 환경에서는 로드 시 한 번만 변환합니다.
+        column = array(typecode, self._mmap[offset:offset + 4 * count])
+        column.byteswap()
+        return column
+
+    def __len__(self) -> int:
+        return self._count
+
+    def lookup(self, ip: str) -> Optional[Dict[str, Any]]:
+        """IP 주소의 위치 정보를 조회합니다.
+
+        Args:
+            ip (str): IPv4 주소 (IPv4-mapped IPv6 포함)
+
+        Returns:
+            Optional[Dict[str, Any]]: 위치 정보 (대역별로 공유하므로 수정하지 않음), 데이터베이스에 없으면 None
+        """
+        try:
+            return self.lookup_int(int.from_bytes(socket.inet_pton(socket.AF_INET, ip), "big"))
+        except OSError:
+            pass
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return None
+        if address.version == 6:
+            address = address.ipv4_mapped
+            if address is None:
+                return None
+        return self.lookup_int(int(address))
+
+    def lookup_int(self, value: int) -> Optional[Dict[str, Any]]:
+        """정수형 IPv4 주소의 위치 정보를 조회합니다."""
+        index = bisect_right(self._starts, value) - 1
+        if index < 0 or value > self._ends[index]:
+            return None
+        location = self._locations.get(index)
+        if location is None:
+            location = self._locations[index] = {
+                "latitude": round(self._latitudes[index], 6),
+                "longitude": round(self._longitudes[index], 6),
+                "city": self._strings[self._city_ids[index]],
+                "country": self._strings[self._country_ids[index]]
+            }
+        return location
+
+    def close(self) -> None:
+        """메모리 맵과 파일을 닫습니다."""
+        for name in ("_starts", "_ends", "_latitudes", "_longitudes", "_city_ids", "_country_ids"):
+            view = getattr(self, name, None)
+            if isinstance(view, memoryview):
+                view.release()
+        self._mmap.close()
+        self._file.close()
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("사용법: python -m maat_mcp.util.ip_range_db input.csv output.bin")
+        sys.exit(1)
+    logging.basicConfig(level=logging.INFO)
+    build_database(sys.argv[1], sys.argv[2])
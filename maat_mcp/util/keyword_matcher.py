@@ -0,0 +1,179 @@
+import re
+from collections import deque
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Sequence, Tuple
+
+# 키워드가 이 수 이하인 종류는 우선순위 순서대로 부분 문자열 검사(`in`)로 찾고, 더 많은 종류는 자동자로 찾습니다.
+# 검사는 C로 실행되고 앞쪽 키워드를 찾으면 바로 멈추므로 기본 사전 크기에서는 자동자 순회보다 빠르며,
+# 검사 비용은 키워드 수에 비례하므로 수천 개로 늘어난 종류는 자동자 순회 한 번이 더 빠릅니다.
+PROBE_MAX_KEYWORDS = 100
+# 이 길이 이하의 텍스트는 글자마다 그 글자로 시작하는 키워드만 검사합니다 (글자 조회 수가 키워드 검사 수보다 적음).
+SHORT_TEXT_MAX_LENGTH = 12
+
+class KeywordMatcher:
+    """키워드 사전에서 종류별로 우선순위가 가장 높은 키워드를 찾습니다.
+
+    payload는 (종류, 우선순위, 값)이며 우선순위는 작을수록 높습니다. find_best()는 키워드가
+    PROBE_MAX_KEYWORDS개 이하인 종류는 우선순위 순서대로 부분 문자열 검사를 하다가 처음 찾은
+    키워드에서 멈추고, 그보다 큰 종류는 Aho-Corasick 자동자로 텍스트를 한 번 훑어 찾습니다.
+    자동자는 루트 상태에서 키워드의 첫 글자가 나올 때까지 정규식으로 건너뛰며,
+    더 높은 우선순위가 남지 않으면 순회를 멈춥니다.
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, Tuple[Hashable, int, Any]]], probe_max_keywords: int = None):
+        """
+        Args:
+            keywords (Iterable[Tuple[str, Tuple[Hashable, int, Any]]]): (키워드, (종류, 우선순위, 값)) 목록
+            probe_max_keywords (int, optional): 부분 문자열 검사로 찾을 종류의 최대 키워드 수,
+                없으면 PROBE_MAX_KEYWORDS
+        """
+        keywords = [(keyword, payload) for keyword, payload in keywords if keyword]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._output: List[List[Tuple[int, Any]]] = [[]]
+
+        for keyword, payload in keywords:
+            state = 0
+            for ch in keyword:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((len(keyword), payload))
+
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+        first_chars = "".join(sorted(self._goto[0]))
+        self._skip = re.compile(f"[{re.escape(first_chars)}]") if first_chars else None
+        self.max_length = max((len(keyword) for keyword, _ in keywords), default=0)
+        self._build_probes(keywords, PROBE_MAX_KEYWORDS if probe_max_keywords is None else probe_max_keywords)
+
+    def _build_probes(self, keywords: List[Tuple[str, Tuple[Hashable, int, Any]]], probe_max_keywords: int) -> None:
+        """종류별로 우선순위 순서의 검사 목록을 만듭니다. 키워드가 많은 종류는 자동자로 찾습니다.
+
+        같은 종류에서 우선순위가 같거나 높은 키워드를 포함하는 키워드는 빼도 결과가 같으므로
+        (그 키워드가 있으면 포함된 키워드도 있음) 검사하지 않습니다. 예: "주변"이 있으면 "내 주변"은 검사하지 않음.
+        """
+        by_kind: Dict[Hashable, List[Tuple[int, int, str, Any]]] = {}
+        for keyword, (kind, priority, value) in keywords:
+            by_kind.setdefault(kind, []).append((priority, len(keyword), keyword, value))
+
+        # 종류별 (검사 목록, 키워드별 (우선순위, 값))
+        self._probes: Dict[Hashable, Tuple[List[str], Dict[str, Tuple[int, Any]]]] = {}
+        # 첫 글자별 검사할 (키워드, 종류, (우선순위, 값)), 짧은 텍스트에 사용
+        self._first_chars: Dict[str, List[Tuple[str, Hashable, Tuple[int, Any]]]] = {}
+        # 자동자로 찾는 종류별 가장 높은 우선순위 (찾으면 순회를 멈춤)
+        self._scan_floors: Dict[Hashable, int] = {}
+        for kind, ranked in by_kind.items():
+            ranked.sort(key=lambda entry: entry[:2])
+            if len(ranked) > probe_max_keywords:
+                self._scan_floors[kind] = ranked[0][0]
+                continue
+            words: List[str] = []
+            entries: Dict[str, Tuple[int, Any]] = {}
+            for priority, _, keyword, value in ranked:
+                if any(word in keyword for word in words):
+                    continue
+                words.append(keyword)
+                entries[keyword] = (priority, value)
+            self._probes[kind] = (words, entries)
+            for keyword in words:
+                self._first_chars.setdefault(keyword[0], []).append((keyword, kind, entries[keyword]))
+
+    def find_all(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """텍스트에 나타나는 모든 키워드를 끝 위치 순서로 하나씩 반환합니다.
+
+        Args:
+            text (str): 검색할 텍스트
+
+        Yields:
+            Tuple[int, int, Any]: (시작 위치, 끝 위치, payload)
+        """
+        if self._skip is None:
+            return
+
+        goto, fail, output = self._goto, self._fail, self._output
+        n = len(text)
+        position = 0
+        # 키워드의 첫 글자가 나오는 위치에서만 자동자를 진행하고,
+        # 루트 상태로 돌아오면 다음 후보 위치로 건너뜁니다.
+        for candidate in self._skip.finditer(text):
+            i = candidate.start()
+            if i < position:
+                continue
+            state = 0
+            while i < n:
+                ch = text[i]
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(ch, 0)
+                i += 1
+                if state == 0:
+                    break
+                for length, payload in output[state]:
+                    yield i - length, i, payload
+            position = i
+
+    def find_best(self, text: str, kinds: Sequence[Hashable]) -> Dict[Hashable, Tuple[int, Any]]:
+        """종류마다 텍스트에 나타나는 키워드 중 우선순위가 가장 높은 것을 찾습니다.
+
+        Args:
+            text (str): 검색할 텍스트
+            kinds (Sequence[Hashable]): 찾을 종류
+
+        Returns:
+            Dict[Hashable, Tuple[int, Any]]: 찾은 종류별 (우선순위, 값)
+        """
+        best: Dict[Hashable, Tuple[int, Any]] = {}
+        if len(text) <= SHORT_TEXT_MAX_LENGTH:
+            # 텍스트에 나오는 글자로 시작하는 키워드만 검사합니다.
+            first_chars = self._first_chars
+            for ch in text:
+                candidates = first_chars.get(ch)
+                if candidates is None:
+                    continue
+                for keyword, kind, entry in candidates:
+                    if keyword in text and kind in kinds:
+                        current = best.get(kind)
+                        if current is None or entry[0] < current[0]:
+                            best[kind] = entry
+        else:
+            for kind in kinds:
+                probe = self._probes.get(kind)
+                if probe is None:
+                    continue
+                words, entries = probe
+                for keyword in words:
+                    if keyword in text:
+                        best[kind] = entries[keyword]
+                        break
+
+        if not self._scan_floors:
+            return best
+        # 자동자로 찾을 종류별 가장 높은 우선순위
+        pending = {kind: self._scan_floors[kind] for kind in kinds if kind in self._scan_floors}
+        if pending:
+            for _, _, (kind, priority, value) in self.find_all(text):
+                floor = pending.get(kind)
+                if floor is None:
+                    continue
+                current = best.get(kind)
+                if current is None or priority < current[0]:
+                    best[kind] = (priority, value)
+                    # 더 높은 우선순위의 키워드가 없으면 이 종류는 더 찾지 않습니다.
+                    if priority <= floor:
+                        del pending[kind]
+                        if not pending:
+                            break
+        return best
@@ -0,0 +1,248 @@
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# 기본 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+class _Metric:
+    """레이블 조합별 값을 보관하는 지표의 공통 부분입니다."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], Any] = {}
+
+    def _labels(self, labels: Tuple[str, ...], extra_names: Tuple[str, ...] = ()) -> str:
+        if not labels:
+            return ""
+        names = self.labelnames + extra_names
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, labels)) + "}"
+
+class Counter(_Metric):
+    """증가만 하는 카운터입니다."""
+
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        for labels, value in self._values.items():
+            yield self.name, self._labels(labels), value
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {",".join(labels): value for labels, value in self._values.items()}
+
+class Gauge(Counter):
+    """증가와 감소가 가능한 게이지입니다."""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) - amount
+
+    def set(self, *labels: str, value: float) -> None:
+        self._values[labels] = value
+
+    @contextmanager
+    def track(self, *labels: str) -> Iterator[None]:
+        """블록이 실행되는 동안 값을 1 올립니다."""
+        self.inc(*labels)
+        try:
+            yield
+        finally:
+            self.dec(*labels)
+
+class Histogram(_Metric):
+    """구간별 누적 개수와 합계를 보관하는 히스토그램입니다."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, *labels: str) -> None:
+        entry = self._values.get(labels)
+        if entry is None:
+            # [구간별 개수..., +Inf 개수], 합계, 개수
+            entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        """블록의 실행 시간을 기록합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        for labels, (counts, total, count) in self._values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                yield f"{self.name}_bucket", self._labels(labels + (le,), ("le",)), cumulative
+            yield f"{self.name}_sum", self._labels(labels), total
+            yield f"{self.name}_count", self._labels(labels), count
+
+    def snapshot(self) -> Dict[str, Any]:
+        result = {}
+        for labels, (counts, total, count) in self._values.items():
+            result[",".join(labels)] = {
+                "count": count,
+                "sum": round(total, 6),
+                "avg": round(total / count, 6) if count else 0.0,
+                "p50": self._quantile(counts, count, 0.5),
+                "p95": self._quantile(counts, count, 0.95),
+                "p99": self._quantile(counts, count, 0.99)
+            }
+        return result
+
+    def _quantile(self, counts: List[int], count: int, q: float) -> float:
+        """분위수가 속한 구간의 상한을 반환합니다. 마지막 구간이면 가장 큰 상한을 반환합니다."""
+        if not count:
+            return 0.0
+        rank = q * count
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return bound
+        return self.buckets[-1]
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+# 렌더링 시점에 수집하는 지표 (이름, 종류, 설명, {레이블: 값}, 값)
+CollectedSample = Tuple[str, str, str, Dict[str, str], float]
+
+class MetricsRegistry:
+    """지표와 수집 함수를 모아 Prometheus 텍스트 또는 dict로 내보냅니다."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[CollectedSample]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[CollectedSample]]) -> None:
+        """렌더링할 때마다 호출해 값을 읽어 올 수집 함수를 등록합니다 (예: 캐시 통계)."""
+        self._collectors.append(collector)
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식(0.0.4)으로 모든 지표를 반환합니다."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {value}")
+
+        described = set()
+        for name, kind, documentation, labels, value in self._collect():
+            if name not in described:
+                described.add(name)
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+            label_text = ",".join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+            lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """모든 지표를 dict로 반환합니다. 히스토그램은 개수, 합계, 평균, 분위수 추정치를 담습니다."""
+        result: Dict[str, Any] = {name: metric.snapshot() for name, metric in self._metrics.items()}
+        for name, _, _, labels, value in self._collect():
+            result.setdefault(name, {})[",".join(labels.values())] = value
+        return result
+
+    def _collect(self) -> Iterator[CollectedSample]:
+        for collector in self._collectors:
+            yield from collector()
+
+# 전역 지표
+registry = MetricsRegistry()
+
+STAGE_DURATION = registry.histogram(
+    "maat_stage_duration_seconds", "맛집 검색 단계별 처리 시간", ("stage",)
+)
+TOOL_DURATION = registry.histogram(
+    "maat_tool_duration_seconds", "도구 호출 처리 시간", ("tool", "outcome")
+)
+TOOL_IN_FLIGHT = registry.gauge(
+    "maat_tool_calls_in_flight", "처리 중인 도구 호출 수", ("tool",)
+)
+UPSTREAM_DURATION = registry.histogram(
+    "maat_upstream_request_duration_seconds", "업스트림 요청 한 번의 처리 시간", ("provider",)
+)
+UPSTREAM_RESPONSES = registry.counter(
+    "maat_upstream_responses_total", "업스트림 응답 수 (HTTP 상태 코드별)", ("provider", "status")
+)
+UPSTREAM_ERRORS = registry.counter(
+    "maat_upstream_errors_total", "업스트림 요청 오류 수 (오류 종류별)", ("provider", "error")
+)
+UPSTREAM_IN_FLIGHT = registry.gauge(
+    "maat_upstream_requests_in_flight", "처리 중인 업스트림 요청 수", ("provider",)
+)
+RATE_LIMIT_QUEUE_DEPTH = registry.gauge(
+    "maat_rate_limit_queue_depth", "업스트림 호출 대기열에서 기다리는 요청 수", ("endpoint",)
+)
+RATE_LIMIT_WAIT = registry.histogram(
+    "maat_rate_limit_wait_seconds", "업스트림 호출 대기열에서 기다린 시간", ("endpoint", "priority")
+)
+RATE_LIMIT_BACKOFFS = registry.counter(
+    "maat_rate_limit_backoffs_total", "OVER_QUERY_LIMIT 응답으로 호출 속도를 낮춘 횟수", ("endpoint",)
+)
+RATE_LIMIT_TIMEOUTS = registry.counter(
+    "maat_rate_limit_timeouts_total", "마감 시각까지 차례가 오지 않은 요청 수", ("endpoint", "priority")
+)
+
+@contextmanager
+def track_tool(tool: str) -> Iterator[None]:
+    """도구 호출의 처리 중 개수와 성공/실패별 처리 시간을 기록합니다."""
+    start = time.perf_counter()
+    outcome = "error"
+    TOOL_IN_FLIGHT.inc(tool)
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        TOOL_IN_FLIGHT.dec(tool)
+        TOOL_DURATION.observe(time.perf_counter() - start, tool, outcome)
+
+def cache_stats_collector(caches: Dict[str, Callable[[], Dict[str, Any]]]) -> Callable[[], Iterable[CollectedSample]]:
+    """캐시 이름별 stats() 함수로 캐시 적중/미스/크기 지표를 만드는 수집 함수를 반환합니다."""
+    fields = (
+        ("hits", "maat_cache_hits_total", "counter", "캐시 적중 수"),
+        ("misses", "maat_cache_misses_total", "counter", "캐시 미스 수"),
+        ("evictions", "maat_cache_evictions_total", "counter", "캐시 축출 수"),
+        ("size", "maat_cache_entries", "gauge", "캐시 항목 수")
+    )
+
+    def collect() -> Iterator[CollectedSample]:
+        stats = {name: get_stats() for name, get_stats in caches.items()}
+        for field, metric_name, kind, documentation in fields:
+            for cache, cache_stats in stats.items():
+                if field in cache_stats:
+                    yield metric_name, kind, documentation, {"cache": cache}, cache_stats[field]
+    return collect
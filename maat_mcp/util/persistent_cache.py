@@ -0,0 +1,271 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from maat_mcp.config import Config
+
+logger = logging.getLogger(__name__)
+
+# 이 횟수만큼 쓸 때마다 만료 항목 정리와 용량 확인을 합니다.
+_PRUNE_EVERY = 200
+
+# 읽기는 요청 처리 중에 하므로 잠금을 오래 기다리지 않고 캐시 미스로 처리합니다.
+_READ_TIMEOUT = 0.1
+
+# auto_vacuum은 파일이 만들어지기 전에 정해야 하므로 journal_mode=WAL보다 먼저 실행합니다.
+_PRAGMAS = (
+    "PRAGMA auto_vacuum=INCREMENTAL",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL"
+)
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS cache_entries (
+        namespace TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value TEXT NOT NULL,
+        expires_at REAL NOT NULL,
+        stored_at REAL NOT NULL,
+        PRIMARY KEY (namespace, key)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS cache_entries_stored_at ON cache_entries (stored_at)"
+)
+
+class PersistentStore:
+    """여러 프로세스가 함께 쓰는 SQLite(WAL) 기반 캐시 저장소입니다.
+
+    시작 시 아무것도 미리 읽지 않고, 메모리 캐시에 없는 키만 디스크에서 읽습니다.
+    get()은 호출한 스레드에서 바로 읽으므로 이벤트 루프에서는 TTLCache.get_async()처럼 스레드로 넘겨 호출합니다.
+    쓰기는 전용 스레드 하나에서 처리해 이벤트 루프를 막지 않으며(첫 쓰기 때 시작하고, close() 뒤에 쓰면 다시 시작),
+    주기적으로 만료 항목을 지우고 파일 크기(데이터 파일과 WAL 파일)가 max_bytes를 넘으면 오래 저장된 항목부터 축출합니다.
+    같은 호스트의 여러 프로세스는 WAL 모드와 잠금 대기 시간으로 안전하게 같은 파일을 공유합니다.
+    """
+
+    def __init__(self, path: str, max_bytes: int = None):
+        self.path = path
+        self.max_bytes = max_bytes or Config.PERSISTENT_CACHE_MAX_BYTES
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._writes_since_prune = _PRUNE_EVERY
+        self.reads = 0
+        self.hits = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def _connect(self, timeout: float) -> sqlite3.Connection:
+        """현재 스레드의 연결을 반환합니다. 없으면 열고 스키마를 준비합니다.
+
+        준비 작업은 다른 프로세스와 겹칠 수 있으므로 쓰기와 같은 시간만큼 잠금을 기다리고,
+        끝나면 연결의 잠금 대기 시간을 timeout으로 바꿉니다.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=Config.PERSISTENT_CACHE_BUSY_TIMEOUT, isolation_level=None, check_same_thread=False
+            )
+            try:
+                for statement in _PRAGMAS + _SCHEMA:
+                    conn.execute(statement)
+                if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                    # auto_vacuum 없이 만들어진 기존 파일은 한 번만 VACUUM으로 전환합니다.
+                    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                    conn.execute("VACUUM")
+                conn.execute(f"PRAGMA busy_timeout={int(timeout * 1000)}")
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """저장된 값을 읽습니다. 호출한 스레드를 막으므로 이벤트 루프에서 직접 호출하지 않습니다.
+
+        Returns:
+            Optional[Tuple[Any, float]]: (값, 남은 TTL(초)), 없거나 만료되었거나 읽을 수 없으면 None
+        """
+        self.reads += 1
+        try:
+            now = time.time()
+            row = self._connect(_READ_TIMEOUT).execute(
+                "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ? AND expires_at > ?",
+                (namespace, _encode_key(key), now)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning("영구 캐시 읽기 실패: %s", e)
+            return None
+        if row is None:
+            return None
+        self.hits += 1
+        return json.loads(row[0]), row[1] - now
+
+    def set(self, namespace: str, key: Hashable, value: Any, ttl: float) -> None:
+        """값을 저장합니다. 직렬화만 호출한 스레드에서 하고, 쓰기는 백그라운드에서 합니다."""
+        try:
+            encoded = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.warning("영구 캐시에 저장할 수 없는 값입니다: %s", e)
+            return
+        with self._lock:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="maat-cache-writer")
+            self._writer.submit(self._write, namespace, _encode_key(key), encoded, ttl)
+
+    def _write(self, namespace: str, key: str, value: str, ttl: float) -> None:
+        try:
+            conn = self._connect(Config.PERSISTENT_CACHE_BUSY_TIMEOUT)
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, value, now + ttl, now)
+            )
+            self.writes += 1
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= _PRUNE_EVERY:
+                self._writes_since_prune = 0
+                self._prune(conn, now)
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning("영구 캐시 쓰기 실패: %s", e)
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        """만료 항목을 지우고, 파일 크기가 용량을 넘으면 오래 저장된 항목부터 축출합니다."""
+        removed = conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,)).rowcount
+        self._compact(conn)
+        size = self._disk_size(conn)
+        if size > self.max_bytes:
+            # 파일 크기 중 항목이 차지하는 비율로 용량의 90%에 해당하는 양만큼 최근 항목을 남기고,
+            # 그보다 오래된 항목을 지웁니다.
+            total = conn.execute("SELECT COALESCE(SUM(LENGTH(key) + LENGTH(value)), 0) FROM cache_entries").fetchone()[0]
+            budget = total * self.max_bytes * 0.9 / size
+            kept = 0
+            cutoff = None
+            for stored_at, entry_size in conn.execute(
+                "SELECT stored_at, LENGTH(key) + LENGTH(value) FROM cache_entries ORDER BY stored_at DESC"
+            ):
+                kept += entry_size
+                if kept > budget:
+                    cutoff = stored_at
+                    break
+            if cutoff is not None:
+                evicted = conn.execute("DELETE FROM cache_entries WHERE stored_at <= ?", (cutoff,)).rowcount
+                self.evictions += evicted
+                removed += evicted
+                self._compact(conn)
+        if removed:
+            logger.info("영구 캐시 정리: %d개 항목 제거", removed)
+
+    @staticmethod
+    def _compact(conn: sqlite3.Connection) -> None:
+        """빈 페이지를 파일에서 돌려주고 WAL 내용을 데이터 파일에 반영한 뒤 WAL 파일을 잘라냅니다.
+
+        PRAGMA incremental_vacuum은 페이지 하나마다 한 단계씩 진행하는데, execute()는 결과 열이 없는 문장을
+        한 단계만 실행하므로 끝까지 실행하는 executescript()를 사용합니다.
+        다른 프로세스가 읽는 중이라 WAL을 자르지 못하면 다음 정리에서 다시 합니다.
+        """
+        conn.executescript("PRAGMA incremental_vacuum;")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+
+    def _disk_size(self, conn: sqlite3.Connection) -> int:
+        """데이터 파일(page_count * page_size)과 WAL 파일을 합친 크기(바이트)를 반환합니다."""
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        try:
+            wal_size = os.path.getsize(self.path + "-wal")
+        except OSError:
+            wal_size = 0
+        return page_count * page_size + wal_size
+
+    def flush(self) -> None:
+        """대기 중인 쓰기가 끝날 때까지 기다립니다."""
+        with self._lock:
+            writer = self._writer
+        if writer is not None:
+            writer.submit(lambda: None).result()
+
+    def close(self) -> None:
+        """대기 중인 쓰기를 마치고 연결을 닫습니다."""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.shutdown(wait=True)
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def stats(self) -> Dict[str, Any]:
+        """읽기/적중/쓰기/축출 통계를 반환합니다."""
+        return {
+            "path": self.path,
+            "max_bytes": self.max_bytes,
+            "reads": self.reads,
+            "hits": self.hits,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "errors": self.errors
+        }
+
+class PersistentNamespace:
+    """PersistentStore의 한 구역입니다. TTLCache의 2차 저장소로 사용합니다."""
+
+    def __init__(self, store: PersistentStore, name: str, decode: Callable[[Any], Any] = None):
+        self.store = store
+        self.name = name
+        self.decode = decode
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """(값, 남은 TTL) 또는 None을 반환합니다. decode가 있으면 JSON 값을 변환합니다."""
+        entry = self.store.get(self.name, key)
+        if entry is None or self.decode is None:
+            return entry
+        value, ttl = entry
+        return self.decode(value), ttl
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        self.store.set(self.name, key, value, ttl)
+
+def _encode_key(key: Hashable) -> str:
+    """캐시 키(문자열, 숫자, 튜플)를 저장용 문자열로 변환합니다."""
+    return key if isinstance(key, str) else json.dumps(key, ensure_ascii=False)
+
+_store: Optional[PersistentStore] = None
+_users = 0
+
+def get_persistent_store() -> Optional[PersistentStore]:
+    """Config.PERSISTENT_CACHE_PATH의 저장소를 반환합니다. 설정되지 않았으면 None을 반환합니다."""
+    global _store
+    if _store is None and Config.PERSISTENT_CACHE_PATH:
+        _store = PersistentStore(Config.PERSISTENT_CACHE_PATH)
+    return _store
+
+def open_persistent_store() -> None:
+    """영구 캐시 사용을 시작합니다.
+
+    lifespan은 연결(세션)마다 실행될 수 있으므로 참조 카운트로 관리합니다.
+    """
+    global _users
+    _users += 1
+
+async def close_persistent_store() -> None:
+    """영구 캐시 사용을 종료합니다. 마지막 사용자가 종료하면 대기 중인 쓰기를 마치고 저장소를 닫습니다."""
+    global _users
+    _users = max(_users - 1, 0)
+    if _users == 0 and _store is not None:
+        await asyncio.to_thread(_store.close)
+
+def persistent_namespace(name: str, decode: Callable[[Any], Any] = None) -> Optional[PersistentNamespace]:
+    """영구 캐시의 구역을 반환합니다. 영구 캐시를 사용하지 않으면 None을 반환합니다."""
+    store = get_persistent_store()
+    return PersistentNamespace(store, name, decode) if store is not None else None
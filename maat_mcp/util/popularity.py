@@ -0,0 +1,50 @@
+import heapq
+import time
+from typing import Any, Dict, Hashable, List, Tuple
+from maat_mcp.config import Config
+
+class PopularityTracker:
+    """키별 요청 빈도를 시간에 따라 감쇠하는 점수로 추적합니다.
+
+    요청마다 점수에 1을 더하고, 점수는 half_life마다 절반으로 줄어듭니다.
+    키마다 다시 조회할 때 필요한 값(payload)을 함께 보관합니다.
+    키가 max_keys를 넘으면 점수가 낮은 절반을 버립니다.
+    """
+
+    def __init__(self, half_life: float = None, max_keys: int = None):
+        self.half_life = half_life or Config.POPULARITY_HALF_LIFE
+        self.max_keys = max_keys or Config.POPULARITY_MAX_KEYS
+        # 키 -> [점수, 점수를 갱신한 시각, payload]
+        self._entries: Dict[Hashable, List[Any]] = {}
+
+    def _score(self, entry: List[Any], now: float) -> float:
+        return entry[0] * 0.5 ** ((now - entry[1]) / self.half_life)
+
+    def record(self, key: Hashable, payload: Any = None) -> None:
+        """키의 요청 한 번을 기록합니다."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is None:
+            if len(self._entries) >= self.max_keys:
+                self._trim(now)
+            self._entries[key] = [1.0, now, payload]
+        else:
+            entry[0] = self._score(entry, now) + 1.0
+            entry[1] = now
+            entry[2] = payload
+
+    def top(self, n: int) -> List[Tuple[Hashable, Any, float]]:
+        """점수가 높은 키 n개를 (키, payload, 점수) 목록으로 반환합니다."""
+        now = time.monotonic()
+        return heapq.nlargest(
+            n,
+            ((key, entry[2], self._score(entry, now)) for key, entry in self._entries.items()),
+            key=lambda item: item[2]
+        )
+
+    def _trim(self, now: float) -> None:
+        keep = heapq.nlargest(self.max_keys // 2, self._entries.items(), key=lambda item: self._score(item[1], now))
+        self._entries = dict(keep)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,4 +1,11 @@
-from typing import Dict, Optional
+import json
+import logging
+from typing import Any, Dict, List, Optional
+from maat_mcp.config import Config
+from maat_mcp.util.gazetteer import region_names
+from maat_mcp.util.keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
 
 # 지역 정보 관련 상수
 DETAILED_REGIONS = [
@@ -10,6 +17,9 @@ DETAILED_REGIONS = [
     "송파", "마포", "용산", "종로", "중구", "서초", "강동", "강서"
 ]
 
+# 추가 지역 좌표 파일(Config.GAZETTEER_PATH)의 지역명까지 포함한 검색 대상 지역 목록
+SEARCH_REGIONS = DETAILED_REGIONS + [name for name in region_names() if name not in DETAILED_REGIONS]
+
 # 기본 검색어
 DEFAULT_SEARCH_SUFFIX = " 맛집"
 
@@ -28,6 +38,96 @@ DEFAULT_FOOD_TYPES = [
     "분식", "떡볶이", "순대", "김밥", "샌드위치", "호프", "펍"
 ]
 
+# 기본 검색어가 아닌 특수한 경우만 정의 (DEFAULT_FOOD_TYPES보다 우선)
+FOOD_TYPE_ALIASES = {
+    # 중식 관련
+    "중국음식": "중식",
+    
+    # 일식 관련
+    "일본음식": "일식",
+    "스시": "초밥",
+    
+    # 양식 관련
+    "서양음식": "양식",
+    
+    # 카페/디저트
+    "카페": "카페 디저트",
+    "커피": "카페 디저트",
+    "디저트": "카페 디저트",
+    "빵집": "카페 디저트",
+    "베이커리": "카페 디저트",
+    "아이스크림": "카페 디저트",
+    
+    # 술집/바
+    "술집": "술집 바",
+    "바": "술집 바",
+    "이자카야": "술집 바",
+    "포차": "술집 바"
+}
+
+# 여러 의도를 합친 검색어를 구체적인 검색어로 나눕니다 (각각 동시에 검색한 뒤 합침)
+FOOD_TYPE_EXPANSIONS = {
+    "카페 디저트": ["카페", "디저트", "베이커리"],
+    "술집 바": ["술집", "바", "이자카야"]
+}
+
+# 현재 위치 검색 키워드
+NEARBY_KEYWORDS = ["내 주변", "근처", "주변", "여기", "현재 위치"]
+
+# 키워드 종류 (_KINDS는 검사 순서)
+_NEARBY, _REGION, _FOOD = 0, 1, 2
+_KINDS = (_REGION, _FOOD, _NEARBY)
+
+def _load_vocabulary(path: str) -> Dict[str, Any]:
+    """추가 검색어 사전 파일을 읽습니다.
+
+    파일 형식: {"regions": [...], "food_aliases": {"별칭": "검색어"}, "food_types": [...], "nearby_keywords": [...],
+               "food_expansions": {"검색어": ["구체적인 검색어", ...]}}
+    추가 항목은 기본 사전 뒤에 붙으므로 우선순위가 기본 사전보다 낮습니다.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"추가 검색어 사전 파일을 읽을 수 없습니다: {str(e)}")
+        return {}
+
+_VOCABULARY = _load_vocabulary(Config.QUERY_VOCABULARY_PATH) if Config.QUERY_VOCABULARY_PATH else {}
+
+def _build_matcher(vocabulary: Dict[str, Any]) -> KeywordMatcher:
+    """지역/음식/현재 위치 사전을 하나의 자동자로 컴파일합니다.
+
+    payload는 (종류, 우선순위, 값)이며, 우선순위는 기존 목록 순서와 같습니다.
+    음식 종류는 FOOD_TYPE_ALIASES 전체가 DEFAULT_FOOD_TYPES보다 우선합니다.
+    """
+
+    regions: List[str] = SEARCH_REGIONS + [r for r in vocabulary.get("regions", []) if r not in SEARCH_REGIONS]
+    aliases = dict(FOOD_TYPE_ALIASES)
+    for alias, search_term in vocabulary.get("food_aliases", {}).items():
+        aliases.setdefault(alias, search_term)
+    food_types = DEFAULT_FOOD_TYPES + [f for f in vocabulary.get("food_types", []) if f not in DEFAULT_FOOD_TYPES]
+    nearby = NEARBY_KEYWORDS + [k for k in vocabulary.get("nearby_keywords", []) if k not in NEARBY_KEYWORDS]
+
+    keywords = []
+    keywords.extend((keyword, (_NEARBY, 0, None)) for keyword in nearby)
+    keywords.extend((region, (_REGION, i, region)) for i, region in enumerate(regions))
+    keywords.extend((alias, (_FOOD, i, search_term)) for i, (alias, search_term) in enumerate(aliases.items()))
+    keywords.extend((food, (_FOOD, len(aliases) + i, food)) for i, food in enumerate(food_types))
+    return KeywordMatcher(keywords)
+
+_MATCHER = _build_matcher(_VOCABULARY)
+
+_EXPANSIONS: Dict[str, List[str]] = {**FOOD_TYPE_EXPANSIONS, **_VOCABULARY.get("food_expansions", {})}
+
+def expand_search_query(search_query: Optional[str]) -> List[str]:
+    """검색어를 동시에 검색할 구체적인 검색어 목록으로 나눕니다.
+
+    예: "카페 디저트 맛집" -> ["카페", "디저트", "베이커리"]. 나눌 수 없으면 [search_query]를 반환합니다.
+    """
+    search_query = search_query or Config.DEFAULT_SEARCH_QUERY
+    intent = search_query[:-len(DEFAULT_SEARCH_SUFFIX)] if search_query.endswith(DEFAULT_SEARCH_SUFFIX) else search_query
+    return list(_EXPANSIONS.get(intent, [search_query]))
+
 def has_region_info(query: str) -> bool:
     """검색어에 지역 정보가 포함되어 있는지 확인합니다.
     
@@ -37,10 +137,14 @@ def has_region_info(query: str) -> bool:
     Returns:
         bool: 지역 정보 포함 여부
     """
-    return any(region in query for region in DETAILED_REGIONS)
+    return _REGION in _MATCHER.find_best(query, (_REGION,))
 
 def process_search_query(query: str, context: str = "") -> Dict[str, str]:
     """검색어를 처리하여 지역명과 검색어를 반환합니다.
+
+    검색어에서 지역명, 음식 종류, 현재 위치 키워드를 찾고, 검색어에 없는 종류만 맥락에서 찾습니다.
+    같은 종류의 키워드가 여러 개면 사전 순서가 앞선 것을, 검색어와 맥락에 모두 있으면
+    검색어의 것을 사용합니다.
     
     Args:
         query: 원본 검색어
@@ -53,78 +157,21 @@ def process_search_query(query: str, context: str = "") -> Dict[str, str]:
             "use_current_location": bool
         }
     """
-    # 기본 검색어가 아닌 특수한 경우만 정의
-    food_types = {
-        # 중식 관련
-        "중국음식": "중식",
-        
-        # 일식 관련
-        "일본음식": "일식",
-        "스시": "초밥",
-        
-        # 양식 관련
-        "서양음식": "양식",
-        
-        # 카페/디저트
-        "카페": "카페 디저트",
-        "커피": "카페 디저트",
-        "디저트": "카페 디저트",
-        "빵집": "카페 디저트",
-        "베이커리": "카페 디저트",
-        "아이스크림": "카페 디저트",
-        
-        # 술집/바
-        "술집": "술집 바",
-        "바": "술집 바",
-        "이자카야": "술집 바",
-        "포차": "술집 바"
-    }
-    
-    result = {
-        "location": "",
-        "search_query": "맛집",
-        "use_current_location": False
-    }
-    
-    nearby_keywords = ["내 주변", "근처", "주변", "여기", "현재 위치"]
-    search_text = f"{query} {context}" if context else query
-    
-    for keyword in nearby_keywords:
-        if keyword in search_text:
-            result["use_current_location"] = True
-            break
-    
+    found = _MATCHER.find_best(query, _KINDS)
     if context:
-        for location in DETAILED_REGIONS:
-            if location in context:
-                result["location"] = location
-                break
-        
-        for food_type, search_term in food_types.items():
-            if food_type in context:
-                result["search_query"] = search_term + DEFAULT_SEARCH_SUFFIX
-                break
-        else:
-            # 기본 음식 종류 확인
-            for food_type in DEFAULT_FOOD_TYPES:
-                if food_type in context:
-                    result["search_query"] = food_type + DEFAULT_SEARCH_SUFFIX
-                    break
-    
-    for location in DETAILED_REGIONS:
-        if location in query:
-            result["location"] = location
-            break
-    
-    for food_type, search_term in food_types.items():
-        if food_type in query:
-            result["search_query"] = search_term + DEFAULT_SEARCH_SUFFIX
-            break
-    else:
-        # 기본 음식 종류 확인
-        for food_type in DEFAULT_FOOD_TYPES:
-            if food_type in query:
-                result["search_query"] = food_type + DEFAULT_SEARCH_SUFFIX
-                break
-    
-    return result 
\ No newline at end of file
+        # 검색어에서 찾지 못한 종류만 맥락에서 찾습니다.
+        missing = [kind for kind in _KINDS if kind not in found]
+        if missing:
+            found.update(_MATCHER.find_best(context, missing))
+        overlap = _MATCHER.max_length - 1
+        if _NEARBY not in found and overlap > 0:
+            # 검색어와 맥락 사이에 걸친 현재 위치 키워드 (예: "현재" + "위치")
+            found.update(_MATCHER.find_best(f"{query[-overlap:]} {context[:overlap]}", (_NEARBY,)))
+
+    region = found.get(_REGION)
+    food = found.get(_FOOD)
+    return {
+        "location": region[1] if region else "",
+        "search_query": food[1] + DEFAULT_SEARCH_SUFFIX if food else "맛집",
+        "use_current_location": _NEARBY in found
+    }
@@ -0,0 +1,163 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from maat_mcp.config import Config
+from maat_mcp.util.metrics import RATE_LIMIT_BACKOFFS, RATE_LIMIT_QUEUE_DEPTH, RATE_LIMIT_TIMEOUTS, RATE_LIMIT_WAIT
+from maat_mcp.util.resilience import PRIORITY_BACKGROUND, BudgetExceededError, current_priority, remaining_budget
+
+logger = logging.getLogger(__name__)
+
+_PRIORITY_NAMES = {PRIORITY_BACKGROUND: "background"}
+
+class RateLimitTimeoutError(BudgetExceededError):
+    """마감 시각까지 호출 차례가 오지 않았을 때 발생합니다."""
+
+class TokenBucketScheduler:
+    """엔드포인트 하나의 호출 속도를 제한하는 토큰 버킷과 우선순위 대기열입니다.
+
+    토큰이 없으면 요청을 거절하지 않고 우선순위(같으면 도착 순서) 순서로 대기열에 넣어
+    토큰이 생길 때마다 하나씩 내보냅니다. 마감 시각까지 차례가 오지 않은 요청만 실패합니다.
+    OVER_QUERY_LIMIT 응답을 받으면 penalize()로 잠시 멈추고 속도를 절반으로 낮추며,
+    이후 성공할 때마다 설정 속도까지 조금씩 되돌립니다.
+
+    Args:
+        name (str): 엔드포인트 이름 (지표 레이블)
+        rate (float): 초당 요청 수
+        burst (int): 버킷 크기 (한 번에 보낼 수 있는 요청 수)
+    """
+
+    def __init__(self, name: str, rate: float, burst: int = None):
+        self.name = name
+        self.base_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = burst or Config.GOOGLE_RATE_BURST
+        self.tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._consecutive_limits = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self.queued = 0
+        self.granted = 0
+        self.timeouts = 0
+        self.backoffs = 0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _wait_time(self, now: float) -> float:
+        """다음 토큰을 쓸 수 있을 때까지 남은 시간(초)을 반환합니다."""
+        if now < self._paused_until:
+            return self._paused_until - now
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    async def acquire(self, priority: int = None, deadline: float = None) -> None:
+        """호출 차례가 올 때까지 기다립니다.
+
+        Args:
+            priority (int, optional): 우선순위 (작을수록 먼저), 없으면 현재 컨텍스트의 우선순위
+            deadline (float, optional): 마감 시각 (time.monotonic 기준),
+                없으면 남은 지연 시간 예산 또는 Config.RATE_LIMIT_MAX_WAIT
+
+        Raises:
+            RateLimitTimeoutError: 마감 시각까지 차례가 오지 않은 경우
+        """
+        priority = current_priority() if priority is None else priority
+        priority_name = _PRIORITY_NAMES.get(priority, "interactive")
+        now = time.monotonic()
+        if deadline is None:
+            remaining = remaining_budget()
+            deadline = now + (Config.RATE_LIMIT_MAX_WAIT if remaining is None else remaining)
+
+        if not self._waiters and self._wait_time(now) == 0:
+            self.tokens -= 1
+            self.granted += 1
+            RATE_LIMIT_WAIT.observe(0.0, self.name, priority_name)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self.queued += 1
+        RATE_LIMIT_QUEUE_DEPTH.inc(self.name)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+        try:
+            await asyncio.wait_for(future, max(deadline - now, 0))
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            RATE_LIMIT_TIMEOUTS.inc(self.name, priority_name)
+            raise RateLimitTimeoutError(f"{self.name} 호출 대기열에서 마감 시각까지 차례가 오지 않았습니다.") from None
+        finally:
+            self.queued -= 1
+            RATE_LIMIT_QUEUE_DEPTH.dec(self.name)
+            RATE_LIMIT_WAIT.observe(time.monotonic() - now, self.name, priority_name)
+
+    async def _dispatch(self) -> None:
+        """토큰이 생길 때마다 대기열의 첫 요청을 내보냅니다."""
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():
+                # 마감 시각이 지나 취소된 요청
+                heapq.heappop(self._waiters)
+                continue
+            delay = self._wait_time(time.monotonic())
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            heapq.heappop(self._waiters)
+            self.tokens -= 1
+            self.granted += 1
+            future.set_result(None)
+
+    def penalize(self) -> None:
+        """OVER_QUERY_LIMIT 응답을 기록합니다. 잠시 호출을 멈추고 속도를 절반으로 낮춥니다."""
+        backoff = min(
+            Config.OVER_QUERY_LIMIT_MAX_BACKOFF,
+            Config.OVER_QUERY_LIMIT_BACKOFF * (2 ** self._consecutive_limits)
+        )
+        self._consecutive_limits += 1
+        self.backoffs += 1
+        self.rate = max(self.base_rate * Config.RATE_LIMIT_MIN_FACTOR, self.rate / 2)
+        self.tokens = 0.0
+        now = time.monotonic()
+        self._updated = max(self._updated, now + backoff)
+        self._paused_until = max(self._paused_until, now + backoff)
+        RATE_LIMIT_BACKOFFS.inc(self.name)
+        logger.warning("%s 호출 한도 초과, %.1f초 멈추고 초당 %.2f회로 낮춥니다.", self.name, backoff, self.rate)
+
+    def record_success(self) -> None:
+        """정상 응답을 기록합니다. 낮춘 속도를 설정 속도까지 조금씩 되돌립니다."""
+        self._consecutive_limits = 0
+        if self.rate < self.base_rate:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * 0.1)
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 속도와 대기열 통계를 반환합니다."""
+        return {
+            "rate": round(self.rate, 3),
+            "base_rate": self.base_rate,
+            "queued": self.queued,
+            "paused_for": round(max(self._paused_until - time.monotonic(), 0), 3),
+            "granted": self.granted,
+            "timeouts": self.timeouts,
+            "backoffs": self.backoffs
+        }
+
+_rate_limiters: Dict[str, TokenBucketScheduler] = {}
+
+def get_rate_limiter(endpoint: str) -> TokenBucketScheduler:
+    """Google API 엔드포인트의 스케줄러를 반환합니다. 없으면 Config.GOOGLE_RATE_LIMITS로 생성합니다."""
+    limiter = _rate_limiters.get(endpoint)
+    if limiter is None:
+        limiter = _rate_limiters[endpoint] = TokenBucketScheduler(endpoint, Config.GOOGLE_RATE_LIMITS[endpoint])
+    return limiter
+
+def get_rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """모든 엔드포인트 스케줄러의 상태를 반환합니다."""
+    return {name: limiter.stats() for name, limiter in _rate_limiters.items()}
@@ -0,0 +1,238 @@
+import asyncio
+import contextvars
+import logging
+import random
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Sequence, TypeVar
+from maat_mcp.config import Config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class CircuitOpenError(Exception):
+    """회로 차단기가 열려 있어 요청을 보내지 않았을 때 발생합니다."""
+
+class BudgetExceededError(Exception):
+    """도구 호출의 지연 시간 예산을 모두 사용했을 때 발생합니다."""
+
+# 현재 도구 호출의 마감 시각 (time.monotonic 기준)
+_deadline = contextvars.ContextVar("maat_deadline", default=None)
+
+# 업스트림 호출 우선순위 (값이 작을수록 먼저 처리)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+_priority = contextvars.ContextVar("maat_priority", default=PRIORITY_INTERACTIVE)
+
+class UpstreamCallCounter:
+    """count_upstream_calls() 블록 안에서 보낸 업스트림 요청 수입니다."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = 0
+
+# 현재 작업의 업스트림 요청을 셀 카운터 (없으면 세지 않음)
+_call_counter = contextvars.ContextVar("maat_call_counter", default=None)
+
+@contextmanager
+def latency_budget(seconds: float = None) -> Iterator[None]:
+    """블록 안에서 시작한 업스트림 호출 전체에 지연 시간 예산을 적용합니다.
+
+    이미 더 짧은 예산이 적용되어 있으면 그 예산을 유지합니다.
+    """
+    deadline = time.monotonic() + (seconds or Config.TOOL_LATENCY_BUDGET)
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+def remaining_budget() -> Optional[float]:
+    """남은 지연 시간 예산(초)을 반환합니다. 예산이 없으면 None을 반환합니다."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """블록 안에서 시작한 업스트림 호출의 우선순위를 지정합니다."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+def current_priority() -> int:
+    """현재 업스트림 호출 우선순위를 반환합니다. 지정하지 않았으면 PRIORITY_INTERACTIVE입니다."""
+    return _priority.get()
+
+@contextmanager
+def count_upstream_calls() -> Iterator[UpstreamCallCounter]:
+    """블록 안에서 시작한 작업(그 작업이 만든 하위 작업 포함)이 실제로 보낸 업스트림 요청 수를 셉니다.
+
+    재시도와 다음 페이지 요청도 각각 셉니다. 진행 중인 같은 요청에 합쳐진 호출은 요청을 보내지 않으므로 세지 않습니다.
+    """
+    counter = UpstreamCallCounter()
+    token = _call_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _call_counter.reset(token)
+
+def record_upstream_call() -> None:
+    """업스트림 요청 하나를 현재 카운터에 기록합니다."""
+    counter = _call_counter.get()
+    if counter is not None:
+        counter.calls += 1
+
+def detached_context() -> contextvars.Context:
+    """현재 컨텍스트에서 지연 시간 예산을 빼고 우선순위를 백그라운드로 낮춘 복사본을 반환합니다.
+
+    도구 호출이 끝난 뒤에도 이어지는 백그라운드 작업을 만들 때 사용합니다
+    (예: loop.create_task(coro, context=detached_context())).
+    """
+    context = contextvars.copy_context()
+    context.run(_deadline.set, None)
+    context.run(_priority.set, PRIORITY_BACKGROUND)
+    return context
+
+def backoff_delay(attempt: int) -> float:
+    """재시도 대기 시간을 계산합니다 (지수 백오프 + full jitter).
+
+    Args:
+        attempt (int): 0부터 시작하는 재시도 횟수
+    """
+    ceiling = min(Config.RETRY_MAX_DELAY, Config.RETRY_DELAY * (2 ** attempt))
+    return random.uniform(0, ceiling)
+
+class CircuitBreaker:
+    """업스트림 제공자별 회로 차단기입니다.
+
+    연속 실패가 failure_threshold에 이르면 열림 상태가 되어 recovery_timeout 동안
+    요청을 즉시 거절합니다. 그 뒤 한 번의 시험 요청(half-open)이 성공하면 닫힙니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = None, recovery_timeout: float = None):
+        self.name = name
+        self.failure_threshold = failure_threshold or Config.CIRCUIT_FAILURE_THRESHOLD
+        self.recovery_timeout = recovery_timeout or Config.CIRCUIT_RECOVERY_TIMEOUT
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._trial_in_flight = False
+
+    def allow_request(self) -> bool:
+        """요청을 보내도 되는지 확인합니다."""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.recovery_timeout:
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        if self.state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """요청 성공을 기록합니다."""
+        if self.state != self.CLOSED:
+            logger.info("회로 차단기 닫힘: %s", self.name)
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def abandon(self) -> None:
+        """결과 없이 끝난 요청(취소 등)을 기록합니다. 시험 요청 자리를 비웁니다."""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """요청 실패를 기록합니다."""
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning("회로 차단기 열림: %s (연속 실패 %d회)", self.name, self.failures)
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        """차단기 상태를 반환합니다."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "rejected": self.rejected
+        }
+
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """제공자 이름에 해당하는 회로 차단기를 반환합니다. 없으면 생성합니다."""
+    breaker = _circuit_breakers.get(name)
+    if breaker is None:
+        breaker = _circuit_breakers[name] = CircuitBreaker(name)
+    return breaker
+
+def get_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """모든 회로 차단기의 상태를 반환합니다."""
+    return {name: breaker.stats() for name, breaker in _circuit_breakers.items()}
+
+async def first_successful(factories: Sequence[Callable[[], Awaitable[T]]], hedge_delay: float = None) -> T:
+    """여러 제공자에 헤지 요청을 보내고 가장 먼저 성공한 결과를 반환합니다.
+
+    첫 번째 제공자를 호출하고, hedge_delay 안에 응답이 없거나 실패하면 다음 제공자를
+    추가로 호출합니다. 하나가 성공하면 나머지 요청은 취소합니다.
+
+    Args:
+        factories (Sequence[Callable[[], Awaitable[T]]]): 우선순위 순서의 제공자 호출 함수
+        hedge_delay (float, optional): 다음 제공자를 추가로 호출하기까지 기다릴 시간(초)
+
+    Returns:
+        T: 가장 먼저 성공한 결과
+
+    Raises:
+        Exception: 모든 제공자가 실패한 경우 마지막 예외
+    """
+    if not factories:
+        raise ValueError("호출할 제공자가 없습니다.")
+    hedge_delay = Config.HEDGE_DELAY if hedge_delay is None else hedge_delay
+
+    pending = set()
+    next_index = 0
+    last_error: Optional[BaseException] = None
+
+    def launch() -> None:
+        nonlocal next_index
+        pending.add(asyncio.ensure_future(factories[next_index]()))
+        next_index += 1
+
+    launch()
+    try:
+        while pending:
+            timeout = hedge_delay if next_index < len(factories) else None
+            done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                # 응답이 늦으면 다음 제공자에도 요청합니다.
+                launch()
+                continue
+            for task in done:
+                pending.discard(task)
+                if not task.cancelled() and task.exception() is None:
+                    return task.result()
+                last_error = task.exception() if not task.cancelled() else asyncio.CancelledError()
+            if next_index < len(factories):
+                # 실패하면 기다리지 않고 다음 제공자를 호출합니다.
+                launch()
+        raise last_error
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,72 @@
+import json
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성, 없으면 표준 json 모듈을 사용합니다.
+    orjson = None
+
+# 응답 형식
+FORMAT_JSON = "json"  # 구조화된 dict (기본값)
+FORMAT_COMPACT = "compact"  # 공백 없는 JSON 문자열
+FORMAT_TABLE = "table"  # 맛집 목록을 탭으로 구분한 표 (머리글 한 줄 + 맛집당 한 줄)
+FORMAT_OPTIONS = (FORMAT_JSON, FORMAT_COMPACT, FORMAT_TABLE)
+
+def parse_format(format: Optional[str]) -> str:
+    """응답 형식을 검증합니다. 지정하지 않았으면 FORMAT_JSON을 반환합니다."""
+    format = format or FORMAT_JSON
+    if format not in FORMAT_OPTIONS:
+        raise ValueError(f"지원하지 않는 응답 형식입니다: {format} (가능한 값: {', '.join(FORMAT_OPTIONS)})")
+    return format
+
+def dumps_compact(value: Any) -> str:
+    """공백 없는 JSON 문자열로 직렬화합니다. orjson이 설치되어 있으면 orjson을 사용합니다."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+def render_table(records: List[Dict[str, Any]], fields: Sequence[str] = None) -> str:
+    """레코드 목록을 탭으로 구분한 표로 만듭니다. 목록 값은 쉼표로 잇습니다."""
+    if fields is None:
+        fields = list(records[0]) if records else []
+    lines = ["\t".join(fields)]
+    for record in records:
+        lines.append("\t".join(_cell(record.get(field)) for field in fields))
+    return "\n".join(lines)
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        value = ",".join(map(str, value))
+    elif isinstance(value, dict):
+        value = dumps_compact(value)
+    return str(value).replace("\t", " ").replace("\n", " ")
+
+def format_response(response: Dict[str, Any], format: str, records_key: str, fields: Sequence[str] = None) -> Union[Dict[str, Any], str]:
+    """도구 응답을 요청한 형식으로 변환합니다.
+
+    table 형식은 records_key의 레코드(목록 또는 하나)를 표로 만들고,
+    나머지 항목은 표 앞에 "# 이름: 값" 줄로 붙입니다 (timestamp 제외).
+
+    Args:
+        response (Dict[str, Any]): 도구 응답
+        format (str): parse_format으로 검증한 응답 형식
+        records_key (str): 맛집 레코드가 담긴 항목 이름
+        fields (Sequence[str], optional): 표의 열 순서, 없으면 첫 레코드의 필드 순서
+    """
+    if format == FORMAT_JSON:
+        return response
+    if format == FORMAT_COMPACT:
+        return dumps_compact(response)
+
+    records = response.get(records_key) or []
+    if isinstance(records, dict):
+        records = [records]
+    lines = [
+        f"# {key}: {value if isinstance(value, str) else dumps_compact(value)}"
+        for key, value in response.items()
+        if key not in (records_key, "timestamp")
+    ]
+    lines.append(render_table(records, fields))
+    return "\n".join(lines)
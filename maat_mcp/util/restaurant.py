@@ -0,0 +1,149 @@
+import heapq
+import sys
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+from maat_mcp.config import Config
+
+class Restaurant(NamedTuple):
+    """맛집 정보를 담는 간결한 레코드입니다.
+
+    dict 대신 튜플 기반 레코드로 보관해, 페이지 조회와 캐시로 수천 개의 장소를
+    메모리에 두어도 부담이 적도록 합니다. 응답으로 보낼 때만 to_dict()로 변환합니다.
+    """
+
+    name: str
+    address: str
+    rating: float
+    total_ratings: int
+    types: Tuple[str, ...]
+    place_id: str
+    latitude: float
+    longitude: float
+
+    @classmethod
+    def from_place(cls, place: Dict[str, Any]) -> "Restaurant":
+        """Places API 결과 항목으로 레코드를 생성합니다. 장소 종류 문자열은 공유(intern)합니다."""
+        location = place["geometry"]["location"]
+        return cls(
+            place["name"],
+            place["vicinity"],
+            place.get("rating", 0),
+            place.get("user_ratings_total", 0),
+            tuple(map(sys.intern, place.get("types", ()))),
+            place["place_id"],
+            location["lat"],
+            location["lng"]
+        )
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "Restaurant":
+        """영구 캐시에 JSON 배열로 저장된 레코드를 복원합니다."""
+        name, address, rating, total_ratings, types, place_id, latitude, longitude = row
+        return cls(name, address, rating, total_ratings, tuple(map(sys.intern, types)), place_id, latitude, longitude)
+
+    def to_dict(self, fields: Sequence[str] = None) -> Dict[str, Any]:
+        """응답용 dict로 변환합니다. fields가 있으면 해당 필드만 담습니다 (parse_fields로 검증한 이름)."""
+        if fields is not None:
+            return {field: list(self.types) if field == "types" else getattr(self, field) for field in fields}
+        return {
+            "name": self.name,
+            "address": self.address,
+            "rating": self.rating,
+            "total_ratings": self.total_ratings,
+            "types": list(self.types),
+            "place_id": self.place_id,
+            "latitude": self.latitude,
+            "longitude": self.longitude
+        }
+
+def parse_fields(fields: Union[str, Sequence[str], None]) -> Optional[Tuple[str, ...]]:
+    """응답에 담을 필드 이름을 검증합니다.
+
+    Args:
+        fields (Union[str, Sequence[str], None]): 필드 이름 목록 또는 쉼표로 구분한 문자열
+
+    Returns:
+        Optional[Tuple[str, ...]]: 중복을 뺀 필드 이름, 지정하지 않았으면 None (모든 필드)
+    """
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    names = tuple(dict.fromkeys(field.strip() for field in fields if field.strip()))
+    unknown = [name for name in names if name not in Restaurant._fields]
+    if unknown:
+        raise ValueError(f"지원하지 않는 필드입니다: {', '.join(unknown)} (가능한 값: {', '.join(Restaurant._fields)})")
+    return names or None
+
+# 정렬 방식
+SORT_RELEVANCE = "relevance"  # Places API 순서 유지
+SORT_RATING = "rating"  # 평점 높은 순
+SORT_WEIGHTED = "weighted"  # 리뷰 수를 반영한 가중 평점 높은 순
+SORT_OPTIONS = (SORT_RELEVANCE, SORT_RATING, SORT_WEIGHTED)
+
+def select_by_rating_tier(restaurants: Iterable[Restaurant], thresholds: Sequence[float] = None) -> Tuple[Optional[float], List[Restaurant]]:
+    """평점 기준(내림차순) 중 맛집이 있는 가장 높은 기준을 한 번의 순회로 고릅니다.
+
+    각 맛집을 통과하는 가장 높은 기준 단계로 분류하고, 지금까지 본 가장 높은 단계의
+    맛집만 원래 순서대로 남깁니다. 기준을 하나씩 낮춰 가며 목록을 다시 훑는 것과 결과가 같습니다.
+
+    Args:
+        restaurants (Iterable[Restaurant]): 맛집 목록
+        thresholds (Sequence[float], optional): 평점 기준, 없으면 Config.RATING_THRESHOLDS
+
+    Returns:
+        Tuple[Optional[float], List[Restaurant]]: 선택된 기준과 그 기준을 넘는 맛집 목록 (없으면 None, [])
+    """
+    thresholds = thresholds or Config.RATING_THRESHOLDS
+    best_tier = len(thresholds)
+    selected: List[Restaurant] = []
+    for restaurant in restaurants:
+        rating = restaurant.rating
+        # 현재 가장 높은 단계보다 낮은 단계는 확인할 필요가 없습니다.
+        for tier in range(min(best_tier + 1, len(thresholds))):
+            if rating >= thresholds[tier]:
+                if tier < best_tier:
+                    best_tier = tier
+                    selected = [restaurant]
+                else:
+                    selected.append(restaurant)
+                break
+    if not selected:
+        return None, []
+    return thresholds[best_tier], selected
+
+def weighted_rating(restaurant: Restaurant) -> float:
+    """리뷰 수를 반영한 가중 평점(베이지안 평균)을 계산합니다.
+
+    리뷰가 적은 곳은 Config.RANKING_PRIOR_RATING 쪽으로 당겨지므로,
+    리뷰 3개짜리 5.0점이 리뷰 수천 개짜리 4.6점보다 앞서지 않습니다.
+    """
+    votes = restaurant.total_ratings
+    prior = Config.RANKING_PRIOR_COUNT
+    return (votes * restaurant.rating + prior * Config.RANKING_PRIOR_RATING) / (votes + prior)
+
+def rank_restaurants(restaurants: List[Restaurant], sort: str = None, limit: int = None) -> List[Restaurant]:
+    """맛집을 정렬하고 상위 limit개를 반환합니다.
+
+    limit이 있으면 전체를 정렬하지 않고 힙으로 상위 항목만 고릅니다.
+
+    Args:
+        restaurants (List[Restaurant]): 맛집 목록
+        sort (str, optional): 정렬 방식 (relevance, rating, weighted), 없으면 relevance
+        limit (int, optional): 반환할 최대 개수
+
+    Returns:
+        List[Restaurant]: 정렬된 맛집 목록
+    """
+    sort = sort or SORT_RELEVANCE
+    if sort not in SORT_OPTIONS:
+        raise ValueError(f"지원하지 않는 정렬 방식입니다: {sort} (가능한 값: {', '.join(SORT_OPTIONS)})")
+    if limit is not None and limit < 1:
+        raise ValueError(f"반환할 개수는 1 이상이어야 합니다: {limit}")
+
+    if sort == SORT_RELEVANCE:
+        return restaurants[:limit] if limit is not None else list(restaurants)
+
+    key = weighted_rating if sort == SORT_WEIGHTED else (lambda r: (r.rating, r.total_ratings))
+    if limit is not None and limit < len(restaurants):
+        return heapq.nlargest(limit, restaurants, key=key)
+    return sorted(restaurants, key=key, reverse=True)
@@ -0,0 +1,49 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+from maat_mcp.util.resilience import current_priority
+
+T = TypeVar("T")
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 비동기 호출을 하나의 업스트림 호출로 합칩니다.
+
+    첫 호출자가 작업(Task)을 시작하고, 작업이 끝나기 전에 같은 키로 들어온
+    호출자는 같은 작업의 결과를 기다립니다. 예외는 모든 대기자에게 전달되며,
+    대기자 한 명이 취소되어도 공유 작업은 취소되지 않습니다.
+
+    작업은 첫 호출자의 컨텍스트(우선순위, 지연 시간 예산)로 실행되므로, 우선순위가 다른 호출은
+    합치지 않습니다. 도구 호출이 백그라운드 갱신 작업에 합쳐져 백그라운드 우선순위와 대기 한도로
+    기다리는 일이 없도록 합니다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Tuple[int, Hashable], "asyncio.Task[Any]"] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """키에 해당하는 작업이 진행 중이면 그 결과를, 아니면 새 작업의 결과를 반환합니다.
+
+        Args:
+            key (Hashable): 논리적으로 같은 요청을 식별하는 키 (현재 우선순위별로 따로 합침)
+            func (Callable[[], Awaitable[T]]): 실제 업스트림 호출
+
+        Returns:
+            T: 공유 작업의 결과
+        """
+        key = (current_priority(), key)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Tuple[int, Hashable], task: "asyncio.Task[Any]") -> None:
+        """완료된 작업을 진행 중 목록에서 제거합니다."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 모든 대기자가 취소된 경우에도 예외가 처리되지 않은 채 남지 않도록 합니다.
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
@@ -0,0 +1,145 @@
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Hashable, List, Optional, Tuple
+from maat_mcp.config import Config
+
+EARTH_RADIUS_M = 6371000.0
+METERS_PER_DEGREE = 111320.0
+
+def distance_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이의 거리(미터)를 하버사인 공식으로 계산합니다."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+class _Coverage:
+    """한 번의 주변 검색이 빠짐없이 조회한 원형 범위"""
+
+    __slots__ = ("latitude", "longitude", "radius", "fetched_at")
+
+    def __init__(self, latitude: float, longitude: float, radius: float, fetched_at: float):
+        self.latitude = latitude
+        self.longitude = longitude
+        self.radius = radius
+        self.fetched_at = fetched_at
+
+class _KeywordIndex:
+    """검색어 하나에 대한 커버리지 목록과 장소 격자"""
+
+    def __init__(self, max_coverages: int):
+        self.coverages: Deque[_Coverage] = deque(maxlen=max_coverages)
+        # (격자 x, 격자 y) -> {place_id: (위도, 경도, 조회 시각, 검색 결과 순위, 장소 레코드)}
+        self.cells: Dict[Tuple[int, int], Dict[str, Tuple[float, float, float, int, Any]]] = {}
+
+class PlaceSpatialIndex:
+    """이전에 조회한 장소를 격자 버킷으로 보관하는 공간 인덱스입니다.
+
+    검색어별로 검색 범위(커버리지 원)와 조회 시각을 기록하고, 새 검색 범위가
+    아직 유효한 커버리지 원 안에 완전히 들어가면 보관된 장소만으로 결과를 계산합니다.
+    장소마다 원래 검색 결과에서의 순위를 함께 보관해, 결과를 API의 관련도 순서로 반환합니다.
+    """
+
+    def __init__(self, cell_size_m: float = None, ttl: float = None, max_coverages: int = None, max_keywords: int = None):
+        self.cell_size = (cell_size_m or Config.SPATIAL_INDEX_CELL_SIZE) / METERS_PER_DEGREE
+        self.ttl = ttl or Config.CACHE_TTL
+        self.max_coverages = max_coverages or Config.SPATIAL_INDEX_MAX_COVERAGES
+        self.max_keywords = max_keywords or Config.SPATIAL_INDEX_MAX_KEYWORDS
+        self._keywords: "OrderedDict[Hashable, _KeywordIndex]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _cell(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        return (math.floor(longitude / self.cell_size), math.floor(latitude / self.cell_size))
+
+    def add(self, keyword: Hashable, latitude: float, longitude: float, radius: float, places: List[Any]) -> None:
+        """빠짐없이 조회한 검색 범위와 그 안의 장소를 기록합니다.
+
+        Args:
+            keyword (Hashable): 정규화된 검색어
+            latitude (float): 검색 중심 위도
+            longitude (float): 검색 중심 경도
+            radius (float): 검색 반경 (미터)
+            places (List[Any]): latitude, longitude, place_id 속성을 가진 장소 레코드 목록 (검색 결과 순서)
+        """
+        now = time.monotonic()
+        index = self._keywords.get(keyword)
+        if index is None:
+            index = self._keywords[keyword] = _KeywordIndex(self.max_coverages)
+            # 가장 오래 사용되지 않은 검색어부터 제거합니다.
+            while len(self._keywords) > self.max_keywords:
+                self._keywords.popitem(last=False)
+        self._keywords.move_to_end(keyword)
+        self._prune(index, now)
+
+        index.coverages.append(_Coverage(latitude, longitude, float(radius), now))
+        for rank, place in enumerate(places):
+            place_lat, place_lng = place.latitude, place.longitude
+            cell = index.cells.setdefault(self._cell(place_lat, place_lng), {})
+            cell[place.place_id] = (place_lat, place_lng, now, rank, place)
+
+    def query(self, keyword: Hashable, latitude: float, longitude: float, radius: float) -> Optional[List[Any]]:
+        """검색 범위가 유효한 커버리지 안에 있으면 범위 안의 장소를 반환합니다.
+
+        Returns:
+            Optional[List[Any]]: 범위 안의 장소 레코드 목록 (검색 결과 순위 순), 커버되지 않으면 None
+        """
+        index = self._keywords.get(keyword)
+        if index is None:
+            self.misses += 1
+            return None
+
+        now = time.monotonic()
+        expires_before = now - self.ttl
+        covered = any(
+            coverage.fetched_at > expires_before
+            and distance_m(latitude, longitude, coverage.latitude, coverage.longitude) + radius <= coverage.radius
+            for coverage in index.coverages
+        )
+        if not covered:
+            self.misses += 1
+            return None
+        self._keywords.move_to_end(keyword)
+
+        span = radius / METERS_PER_DEGREE
+        lng_span = span / max(math.cos(math.radians(latitude)), 0.01)
+        min_x, min_y = self._cell(latitude - span, longitude - lng_span)
+        max_x, max_y = self._cell(latitude + span, longitude + lng_span)
+
+        ranked = []
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                cell = index.cells.get((x, y))
+                if not cell:
+                    continue
+                for place_lat, place_lng, fetched_at, rank, place in cell.values():
+                    if fetched_at > expires_before and distance_m(latitude, longitude, place_lat, place_lng) <= radius:
+                        ranked.append((rank, place))
+        # 격자 순서가 아니라 원래 검색 결과 순서로 돌려줍니다 (relevance 정렬).
+        ranked.sort(key=lambda entry: entry[0])
+        self.hits += 1
+        return [place for _, place in ranked]
+
+    def _prune(self, index: _KeywordIndex, now: float) -> None:
+        """만료된 커버리지와 장소를 제거합니다."""
+        expires_before = now - self.ttl
+        while index.coverages and index.coverages[0].fetched_at <= expires_before:
+            index.coverages.popleft()
+        for key in [key for key, cell in index.cells.items() if all(entry[2] <= expires_before for entry in cell.values())]:
+            del index.cells[key]
+
+    def clear(self) -> None:
+        """모든 기록을 제거합니다."""
+        self._keywords.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """인덱스 크기와 적중/미스 통계를 반환합니다."""
+        return {
+            "keywords": len(self._keywords),
+            "coverages": sum(len(index.coverages) for index in self._keywords.values()),
+            "places": sum(len(cell) for index in self._keywords.values() for cell in index.cells.values()),
+            "hits": self.hits,
+            "misses": self.misses
+        }
@@ -1,10 +1,39 @@
 import logging
 import os
-from mcp.server.fastmcp import FastMCP
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+import uvicorn
+from mcp.server.fastmcp import Context, FastMCP
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from maat_mcp.api.http import HttpClient
+from maat_mcp.config import Config
 from maat_mcp.handlers.service_implementation import (
     find_restaurants,
+    find_restaurants_batch,
     find_random_restaurant
 )
+from maat_mcp.handlers.google_maps_api_handler import (
+    get_restaurant_cache_stats,
+    get_place_index_stats,
+    get_geocode_cache_stats,
+    get_candidate_pool_stats,
+    get_refresh_stats,
+    get_details_cache_stats
+)
+from maat_mcp.handlers.ip_location_api_handler import client_context, get_ip_location_cache_stats
+from maat_mcp.handlers.refresh_scheduler import start_refresh_scheduler, stop_refresh_scheduler
+from maat_mcp.handlers.resource_snapshot import restaurant_results_snapshot
+from maat_mcp.util import (
+    close_persistent_store,
+    get_circuit_breaker_stats,
+    get_persistent_store,
+    get_rate_limiter_stats,
+    open_persistent_store
+)
+from maat_mcp.util.client_ip import client_ip_from_request
+from maat_mcp.util.metrics import cache_stats_collector, registry, track_tool
 
 # 로깅 설정
 logging.basicConfig(
@@ -12,21 +41,116 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """서버 수명 주기 동안 공유 HTTP 커넥션 풀과 인기 검색/리소스 스냅숏 갱신 작업을 시작하고 종료합니다. 종료 시 영구 캐시도 닫습니다."""
+    await HttpClient.open()
+    open_persistent_store()
+    start_refresh_scheduler()
+    restaurant_results_snapshot.start()
+    try:
+        yield
+    finally:
+        await restaurant_results_snapshot.stop()
+        await stop_refresh_scheduler()
+        await HttpClient.close()
+        await close_persistent_store()
+
 # MCP 서버 생성
 mcp = FastMCP(
     name="Restaurant Finder",
-    instructions="You are a restaurant finder. You can find restaurants around the user's location and recommend random restaurants based on their preferences."
+    instructions="You are a restaurant finder. You can find restaurants around the user's location and recommend random restaurants based on their preferences.",
+    lifespan=lifespan,
+    stateless_http=Config.MCP_STATELESS_HTTP
 )
 
+# 캐시 통계를 지표로 내보냅니다.
+registry.register_collector(cache_stats_collector({
+    "restaurants": get_restaurant_cache_stats,
+    "place_index": get_place_index_stats,
+    "geocode": get_geocode_cache_stats,
+    "details": get_details_cache_stats,
+    "ip_location": get_ip_location_cache_stats,
+    "candidate_pools": get_candidate_pool_stats
+}))
+
 # 리소스 등록
 @mcp.resource("maat://restaurant_results")
 async def get_restaurant_results_resource():
-    """맛집 검색 결과를 리소스로 제공합니다."""
-    return await find_restaurants("맛집")  # 기본 검색어 명시
+    """기본 검색어("맛집")의 검색 결과를 리소스로 제공합니다.
+
+    백그라운드에서 주기적으로 갱신하는 스냅숏(version, etag, generated_at, data)을 반환하므로 읽기는 업스트림을 호출하지 않습니다.
+    """
+    return await restaurant_results_snapshot.read()
+
+# 리소스 구독 (내용이 바뀔 때만 notifications/resources/updated 전송)
+_snapshots = {restaurant_results_snapshot.uri: restaurant_results_snapshot}
+
+@mcp._mcp_server.subscribe_resource()
+async def subscribe_resource(uri) -> None:
+    snapshot = _snapshots.get(str(uri))
+    if snapshot is not None:
+        snapshot.subscribe(mcp._mcp_server.request_context.session)
+
+@mcp._mcp_server.unsubscribe_resource()
+async def unsubscribe_resource(uri) -> None:
+    snapshot = _snapshots.get(str(uri))
+    if snapshot is not None:
+        snapshot.unsubscribe(mcp._mcp_server.request_context.session)
+
+_get_capabilities = mcp._mcp_server.get_capabilities
+
+def _get_capabilities_with_subscribe(*args, **kwargs):
+    """FastMCP는 resources.subscribe를 항상 false로 알리므로, 구독 핸들러가 있음을 알리도록 고칩니다."""
+    capabilities = _get_capabilities(*args, **kwargs)
+    if capabilities.resources is not None:
+        capabilities.resources.subscribe = True
+    return capabilities
+
+mcp._mcp_server.get_capabilities = _get_capabilities_with_subscribe
+
+@mcp.resource("maat://cache_stats")
+async def get_cache_stats_resource():
+    """맛집 검색 캐시의 적중/미스/축출 통계와 업스트림 회로 차단기 상태를 리소스로 제공합니다."""
+    store = get_persistent_store()
+    return {
+        "restaurants": get_restaurant_cache_stats(),
+        "place_index": get_place_index_stats(),
+        "geocode": get_geocode_cache_stats(),
+        "details": get_details_cache_stats(),
+        "ip_location": get_ip_location_cache_stats(),
+        "candidate_pools": get_candidate_pool_stats(),
+        "refresh": get_refresh_stats(),
+        "restaurant_results_snapshot": restaurant_results_snapshot.stats(),
+        "persistent": store.stats() if store is not None else None,
+        "circuit_breakers": get_circuit_breaker_stats(),
+        "rate_limits": get_rate_limiter_stats()
+    }
+
+@mcp.resource("maat://metrics")
+async def get_metrics_resource():
+    """단계별/업스트림 처리 시간, 응답 상태 코드, 오류 수, 처리 중인 요청 수, 캐시 지표를 리소스로 제공합니다."""
+    return registry.snapshot()
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> PlainTextResponse:
+    """Prometheus 텍스트 형식으로 지표를 제공합니다."""
+    return PlainTextResponse(registry.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+def _client(ctx: Context):
+    """도구나 프롬프트 호출을 보낸 클라이언트의 IP(HTTP/SSE 요청 기준)와 MCP 세션으로 위치를 조회하도록 합니다.
+
+    요청 밖에서 호출되면(예: 부하 테스트의 mcp.call_tool) 서버 자신의 IP 위치를 사용합니다.
+    """
+    try:
+        request_context = ctx.request_context
+    except ValueError:
+        return client_context(None)
+    return client_context(client_ip_from_request(request_context.request), request_context.session)
 
 # 프롬프트 등록
 @mcp.prompt("맛집 검색")
-async def search_restaurants_prompt(query: str, context: str = None):
+async def search_restaurants_prompt(ctx: Context, query: str, context: str = None):
     """맛집을 검색합니다.
     
     Args:
@@ -36,37 +160,105 @@ async def search_restaurants_prompt(query: str, context: str = None):
     Returns:
         Dict[str, Any]: 검색된 맛집 정보
     """
-    return await find_restaurants(query, context)
+    with _client(ctx):
+        return await find_restaurants(query, context)
 
 # 도구 등록
 @mcp.tool("find_restaurants")
-async def find_restaurants_tool(query: str, context: str = ""):
+async def find_restaurants_tool(ctx: Context, query: str, context: str = "", sort: str = None, limit: int = None, fields: List[str] = None, format: str = None, details: bool = False):
     """맛집을 검색합니다.
     
     Args:
         query (str): 검색어 (예: '맛집', '한식 맛집', '강남 맛집', '내 주변 맛집')
         context (str, optional): 이전 대화 내용
+        sort (str, optional): 정렬 방식 ('relevance': 검색 순, 'rating': 평점 순, 'weighted': 리뷰 수를 반영한 평점 순)
+        limit (int, optional): 반환할 최대 맛집 수 (1 이상)
+        fields (List[str], optional): 맛집마다 담을 필드 (name, address, rating, total_ratings, types, place_id, latitude, longitude), 없으면 전부
+        format (str, optional): 응답 형식 ('json': 기본, 'compact': 공백 없는 JSON 문자열, 'table': 탭으로 구분한 표)
+        details (bool, optional): 상위 맛집에 영업시간, 전화번호, 가격대, 웹사이트를 붙일지 여부
     
     Returns:
-        Dict[str, Any]: 검색된 맛집 정보
+        Dict[str, Any]: 검색된 맛집 정보 (format이 compact/table이면 문자열)
+    """
+    with track_tool("find_restaurants"), _client(ctx):
+        return await find_restaurants(query, context, sort, limit, fields, format, details)
+
+@mcp.tool("find_restaurants_batch")
+async def find_restaurants_batch_tool(ctx: Context, queries: List[str], context: str = "", sort: str = None, limit: int = None):
+    """여러 검색어로 맛집을 한 번에 검색합니다.
+    
+    Args:
+        queries (List[str]): 검색어 목록 (예: ['강남 한식', '홍대 카페', '내 주변 일식'])
+        context (str, optional): 이전 대화 내용
+        sort (str, optional): 정렬 방식 ('relevance': 검색 순, 'rating': 평점 순, 'weighted': 리뷰 수를 반영한 평점 순)
+        limit (int, optional): 검색어별 반환할 최대 맛집 수 (1 이상)
+    
+    Returns:
+        Dict[str, Any]: 검색어별 맛집 정보 (실패한 검색어는 error 포함)
     """
-    return await find_restaurants(query, context)
+    with track_tool("find_restaurants_batch"), _client(ctx):
+        return await find_restaurants_batch(queries, context, sort, limit)
 
 @mcp.tool("recommend_random_restaurant")
-async def recommend_random_restaurant_tool(category: str = None):
+async def recommend_random_restaurant_tool(ctx: Context, category: str = None, limit: int = None, fields: List[str] = None, format: str = None):
     """현재 위치 기반으로 랜덤 맛집을 추천합니다.
     
     Args:
         category (str, optional): 음식 종류 (예: '한식', '중식', '일식', '양식')
+        limit (int, optional): 추천할 맛집 수 (서로 다른 맛집, 지정하면 restaurants 목록으로 반환)
+        fields (List[str], optional): 맛집마다 담을 필드 (name, address, rating, total_ratings, types, place_id, latitude, longitude), 없으면 전부
+        format (str, optional): 응답 형식 ('json': 기본, 'compact': 공백 없는 JSON 문자열, 'table': 탭으로 구분한 표)
     
     Returns:
-        Dict[str, Any]: 추천된 맛집 정보
+        Dict[str, Any]: 추천된 맛집 정보 (format이 compact/table이면 문자열)
     """
-    return await find_random_restaurant(category)
+    with track_tool("recommend_random_restaurant"), _client(ctx):
+        return await find_random_restaurant(category, limit, fields, format)
+
+@asynccontextmanager
+async def app_lifespan(app: Starlette) -> AsyncIterator[None]:
+    """워커 프로세스마다 한 번 실행됩니다.
+
+    워커의 HTTP 커넥션 풀과 인기 검색/리소스 스냅숏 갱신 작업을 워커가 끝날 때까지 유지하고(세션별 lifespan이 멈추지 않도록),
+    streamable HTTP 세션 관리자를 실행합니다. 캐시는 모듈 수준 객체이므로 워커마다 따로 만들어집니다.
+    """
+    if Config.WEB_CONCURRENCY > 1:
+        logging.info(
+            "워커 %d개로 실행 중입니다. SSE(/sse)는 제공하지 않으므로 클라이언트는 /mcp로 접속해야 하며, "
+            "상태 없는 모드에서는 세션별 위치 캐시와 리소스 구독 알림을 사용할 수 없습니다.",
+            Config.WEB_CONCURRENCY
+        )
+    await HttpClient.open()
+    open_persistent_store()
+    start_refresh_scheduler()
+    restaurant_results_snapshot.start()
+    try:
+        async with mcp.session_manager.run():
+            yield
+    finally:
+        await restaurant_results_snapshot.stop()
+        await stop_refresh_scheduler()
+        await HttpClient.close()
+        await close_persistent_store()
+
+def create_app() -> Starlette:
+    """SSE(/sse, /messages/)와 streamable HTTP(/mcp) 전송, /metrics를 함께 제공하는 ASGI 앱을 만듭니다.
+
+    SSE 세션은 연결을 받은 워커의 메모리에만 있어 POST /messages/가 다른 워커로 가면 404가 되므로,
+    Config.WEB_CONCURRENCY가 2 이상이면 SSE 경로를 제공하지 않습니다.
+    """
+    streamable_http_app = mcp.streamable_http_app()
+    routes = list(streamable_http_app.routes)
+    if Config.WEB_CONCURRENCY <= 1:
+        routes += [route for route in mcp.sse_app().routes if route not in routes]
+    return Starlette(routes=routes, lifespan=app_lifespan)
+
+# uvicorn/gunicorn에서 사용하는 ASGI 앱 (예: uvicorn main:app --workers 4)
+app = create_app()
 
 if __name__ == "__main__":
     try:
-        mcp.run(transport="sse")
+        uvicorn.run(app, host=mcp.settings.host, port=mcp.settings.port)
     except Exception as e:
         logging.error(f"서버 실행 중 에러 발생: {str(e)}")
         raise
\ No newline at end of file
@@ -0,0 +1,65 @@
+import asyncio
+
+from maat_mcp.util.candidate_pool import CandidatePool
+
+class _Source:
+    """호출 횟수를 세며 같은 후보 목록을 돌려주는 후보 공급자입니다."""
+
+    def __init__(self, candidates):
+        self.candidates = list(candidates)
+        self.fetches = 0
+
+    async def __call__(self):
+        self.fetches += 1
+        return list(self.candidates)
+
+def _identity(candidate):
+    return candidate
+
+def test_draws_do_not_repeat_until_pool_is_exhausted():
+    async def scenario():
+        pool = CandidatePool(ttl=3600, low_water=0)
+        source = _Source(range(10))
+        drawn = [await pool.draw("key", source, _identity) for _ in range(10)]
+        assert sorted(drawn) == list(range(10))
+
+        # 모두 한 번씩 뽑은 뒤에는 처음부터 다시 뽑습니다.
+        await asyncio.sleep(0)
+        again = [await pool.draw("key", source, _identity) for _ in range(10)]
+        assert sorted(again) == list(range(10))
+
+    asyncio.run(scenario())
+
+def test_background_refill_skips_served_candidates():
+    async def scenario():
+        pool = CandidatePool(ttl=3600, low_water=3)
+        source = _Source(range(10))
+        drawn = []
+        for _ in range(10):
+            drawn.append(await pool.draw("key", source, _identity))
+            # 남은 후보가 low_water개 이하가 되면 시작하는 백그라운드 채우기가 끝나도록 합니다.
+            await asyncio.sleep(0)
+        assert sorted(drawn) == list(range(10))
+        assert source.fetches > 1
+
+    asyncio.run(scenario())
+
+def test_concurrent_draws_do_not_repeat():
+    async def scenario():
+        pool = CandidatePool(ttl=3600, low_water=0)
+        source = _Source(range(21))
+        drawn = await asyncio.gather(*(pool.draw("key", source, _identity) for _ in range(20)))
+        assert len(set(drawn)) == 20
+        # 처음 채우기는 함께 기다린 호출자가 모두 공유합니다.
+        assert source.fetches == 1
+
+    asyncio.run(scenario())
+
+def test_pools_are_separate_per_key():
+    async def scenario():
+        pool = CandidatePool(ttl=3600, low_water=0)
+        first = await pool.draw("a", _Source([1]), _identity)
+        second = await pool.draw("b", _Source([1]), _identity)
+        assert first == second == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,176 @@
+import asyncio
+import time
+from typing import List
+
+import pytest
+from aiohttp import web
+
+from benchmarks.stub_upstreams import StubUpstreams
+from maat_mcp.api.http import HttpClient, HttpRequestError
+from maat_mcp.api.ip_location_api import IpLocationApi
+from maat_mcp.config import Config
+from maat_mcp.util.resilience import CircuitBreaker, CircuitOpenError, first_successful
+
+class _ScriptedServer:
+    """요청마다 정해진 상태 코드로 차례대로 응답하는 로컬 서버입니다. 목록이 끝나면 200으로 응답합니다."""
+
+    def __init__(self, statuses: List[int] = ()):
+        self.statuses = list(statuses)
+        self.calls = 0
+        self.url = ""
+        self._runner = None
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/"
+        return self.url
+
+    async def stop(self) -> None:
+        await self._runner.cleanup()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.calls += 1
+        status = self.statuses.pop(0) if self.statuses else 200
+        if status != 200:
+            return web.Response(status=status)
+        return web.json_response({"calls": self.calls})
+
+def _run(statuses: List[int], scenario):
+    """스크립트 서버와 공유 HTTP 세션을 연 상태로 scenario(server)를 실행합니다."""
+    async def main():
+        server = _ScriptedServer(statuses)
+        await server.start()
+        await HttpClient.open()
+        try:
+            return await scenario(server)
+        finally:
+            await HttpClient.close()
+            await server.stop()
+
+    return asyncio.run(main())
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(Config, "RETRY_DELAY", 0.01)
+    monkeypatch.setattr(Config, "RETRY_MAX_DELAY", 0.01)
+
+@pytest.mark.parametrize("status", [500, 503, 429])
+def test_get_retries_server_errors_and_rate_limits(status):
+    async def scenario(server):
+        response = await HttpClient.get(server.url, retries=2)
+        assert response == {"calls": 3}
+        assert server.calls == 3
+
+    _run([status, status], scenario)
+
+@pytest.mark.parametrize("status", [400, 403, 404])
+def test_get_does_not_retry_other_client_errors(status):
+    async def scenario(server):
+        with pytest.raises(HttpRequestError) as error:
+            await HttpClient.get(server.url, retries=2)
+        assert error.value.status == status
+        assert not error.value.retryable
+        assert server.calls == 1
+
+    _run([status], scenario)
+
+def test_get_gives_up_after_retries():
+    async def scenario(server):
+        with pytest.raises(HttpRequestError):
+            await HttpClient.get(server.url, retries=1)
+        assert server.calls == 2
+
+    _run([500, 500, 500], scenario)
+
+def test_circuit_opens_and_half_opens(monkeypatch):
+    monkeypatch.setattr(Config, "CIRCUIT_FAILURE_THRESHOLD", 2)
+    monkeypatch.setattr(Config, "CIRCUIT_RECOVERY_TIMEOUT", 0.1)
+
+    async def scenario(server):
+        for _ in range(2):
+            with pytest.raises(HttpRequestError):
+                await HttpClient.get(server.url, retries=0)
+        # 열린 동안에는 요청을 보내지 않습니다.
+        with pytest.raises(CircuitOpenError):
+            await HttpClient.get(server.url, retries=0)
+        assert server.calls == 2
+
+        # 복구 대기 후 시험 요청이 실패하면 바로 다시 열립니다.
+        await asyncio.sleep(0.1)
+        with pytest.raises(HttpRequestError):
+            await HttpClient.get(server.url, retries=0)
+        with pytest.raises(CircuitOpenError):
+            await HttpClient.get(server.url, retries=0)
+        assert server.calls == 3
+
+        # 시험 요청이 성공하면 닫힙니다.
+        await asyncio.sleep(0.1)
+        assert await HttpClient.get(server.url, retries=0) == {"calls": 4}
+        assert await HttpClient.get(server.url, retries=0) == {"calls": 5}
+
+    _run([500, 500, 500], scenario)
+
+def test_half_open_allows_one_trial_request():
+    breaker = CircuitBreaker("trial", failure_threshold=1, recovery_timeout=0.01)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+    breaker.opened_at -= 1
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()
+    breaker.abandon()
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_first_successful_falls_back_when_first_provider_fails(monkeypatch):
+    async def scenario():
+        failing = StubUpstreams(latency_ms=0, jitter_ms=0, error_rate=1.0)
+        working = StubUpstreams(latency_ms=0, jitter_ms=0)
+        monkeypatch.setattr(Config, "IPLOCATION_BASE_URL", f"{await failing.start()}/ip2location?ip=")
+        monkeypatch.setattr(Config, "IP_API_BASE_URL", f"{await working.start()}/ip-api/")
+        await HttpClient.open()
+        try:
+            # 실패 응답을 받으면 hedge_delay를 기다리지 않고 다음 제공자를 호출합니다.
+            location = await asyncio.wait_for(IpLocationApi.get_location_info("203.0.113.10"), Config.HEDGE_DELAY / 2)
+        finally:
+            await HttpClient.close()
+            await failing.stop()
+            await working.stop()
+        assert location["country"] == "South Korea"
+        assert failing.calls["ip2location"] == 1
+        assert working.calls["ip_api"] == 1
+
+    asyncio.run(scenario())
+
+def test_first_successful_hedges_slow_provider():
+    async def scenario():
+        slow = StubUpstreams(latency_ms=500, jitter_ms=0)
+        fast = StubUpstreams(latency_ms=0, jitter_ms=0)
+        slow_url, fast_url = await slow.start(), await fast.start()
+        await HttpClient.open()
+        try:
+            started = time.monotonic()
+            result = await first_successful([
+                lambda: HttpClient.get(f"{slow_url}/ip-api/198.51.100.1", retries=0),
+                lambda: HttpClient.get(f"{fast_url}/ip-api/198.51.100.1", retries=0)
+            ], hedge_delay=0.05)
+            elapsed = time.monotonic() - started
+            # 취소된 대기자와 달리 공유 요청은 끝까지 진행되므로 응답을 받은 뒤 정리합니다.
+            await asyncio.sleep(0.6)
+        finally:
+            await HttpClient.close()
+            await slow.stop()
+            await fast.stop()
+        assert result["status"] == "success"
+        assert elapsed < 0.4
+        assert slow.calls["ip_api"] == 1
+        assert fast.calls["ip_api"] == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,45 @@
+import asyncio
+
+from maat_mcp.api.http import HttpClient
+
+async def _session():
+    return HttpClient.get_session()
+
+def test_session_from_closed_loop_is_closed_and_replaced():
+    old = asyncio.run(_session())
+
+    async def scenario():
+        new = HttpClient.get_session()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert new is not old
+        assert old.closed
+        await HttpClient.close()
+        assert new.closed
+
+    asyncio.run(scenario())
+
+def test_session_from_idle_loop_is_closed_on_that_loop():
+    loop = asyncio.new_event_loop()
+    try:
+        old = loop.run_until_complete(_session())
+        new = asyncio.run(_session())
+        assert new is not old
+        # 세션을 만든 루프가 다시 돌 때 그 루프에서 닫습니다.
+        assert not old.closed
+        loop.run_until_complete(asyncio.sleep(0.01))
+        assert old.closed
+        asyncio.run(HttpClient.close())
+        assert new.closed
+    finally:
+        loop.close()
+
+def test_same_loop_reuses_session():
+    async def scenario():
+        await HttpClient.open()
+        try:
+            assert HttpClient.get_session() is HttpClient.get_session()
+        finally:
+            await HttpClient.close()
+
+    asyncio.run(scenario())
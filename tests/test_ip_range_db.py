@@ -0,0 +1,60 @@
+import ipaddress
+import os
+
+import pytest
+
+from maat_mcp.util.ip_range_db import IpRangeDatabase, build_database
+
+SAMPLE_CSV = os.path.join(os.path.dirname(__file__), os.pardir, "maat_mcp", "data", "ip_ranges_sample.csv")
+
+def _ip(value: int) -> str:
+    return str(ipaddress.IPv4Address(value))
+
+@pytest.fixture(scope="module")
+def database(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("ip_range_db") / "ip_ranges.bin")
+    # 예약 대역("-") 한 줄은 건너뜁니다.
+    assert build_database(SAMPLE_CSV, path) == 8
+    db = IpRangeDatabase(path)
+    yield db
+    db.close()
+
+def test_lookup_returns_location(database):
+    location = database.lookup(_ip(30408704 + 100))
+    assert location["city"] == "Seoul"
+    assert location["country"] == "Korea (Republic of)"
+    # 좌표는 float32로 저장합니다.
+    assert location["latitude"] == pytest.approx(37.566, abs=1e-5)
+    assert location["longitude"] == pytest.approx(126.9784, abs=1e-5)
+
+@pytest.mark.parametrize("value, city", [
+    (16777216, "Brisbane"),
+    (16777471, "Brisbane"),
+    (3542384640, "Gangnam-gu"),
+    (3542392831, "Gangnam-gu")
+])
+def test_lookup_includes_range_boundaries(database, value, city):
+    assert database.lookup(_ip(value))["city"] == city
+    assert database.lookup_int(value)["city"] == city
+
+@pytest.mark.parametrize("value", [
+    16777215,    # 첫 대역 바로 앞
+    16777472,    # 첫 대역 바로 뒤
+    30539776,    # 두 대역 사이
+    3232235521,  # 예약 대역
+    3542392832,  # 마지막 대역 바로 뒤
+    0xFFFFFFFF
+])
+def test_lookup_misses_outside_ranges(database, value):
+    assert database.lookup(_ip(value)) is None
+
+def test_lookup_ipv4_mapped_ipv6(database):
+    assert database.lookup("::ffff:" + _ip(236978176))["city"] == "Busan"
+
+@pytest.mark.parametrize("ip", ["2001:db8::1", "not-an-ip", ""])
+def test_lookup_rejects_other_addresses(database, ip):
+    assert database.lookup(ip) is None
+
+def test_lookup_reuses_location_per_range(database):
+    first = database.lookup(_ip(989855744))
+    assert database.lookup(_ip(989855744 + 1)) is first
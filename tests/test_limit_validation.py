@@ -0,0 +1,32 @@
+import asyncio
+
+import pytest
+
+from maat_mcp.handlers.service_implementation import find_restaurants, find_restaurants_batch
+from maat_mcp.util.restaurant import Restaurant, rank_restaurants
+
+def _restaurant(name: str, rating: float, total_ratings: int) -> Restaurant:
+    return Restaurant(name, "서울", rating, total_ratings, ("restaurant",), name, 37.5, 127.0)
+
+RESTAURANTS = [_restaurant("a", 4.1, 10), _restaurant("b", 4.7, 300), _restaurant("c", 3.9, 50)]
+
+@pytest.mark.parametrize("limit", [0, -2])
+def test_find_restaurants_rejects_limit_below_one(limit):
+    with pytest.raises(ValueError, match="1 이상"):
+        asyncio.run(find_restaurants("강남 맛집", limit=limit))
+
+@pytest.mark.parametrize("limit", [0, -2])
+def test_find_restaurants_batch_rejects_limit_below_one(limit):
+    with pytest.raises(ValueError, match="1 이상"):
+        asyncio.run(find_restaurants_batch(["강남 맛집", "홍대 카페"], limit=limit))
+
+@pytest.mark.parametrize("sort", ["relevance", "rating", "weighted"])
+@pytest.mark.parametrize("limit", [0, -2])
+def test_rank_restaurants_rejects_limit_below_one(sort, limit):
+    with pytest.raises(ValueError, match="1 이상"):
+        rank_restaurants(RESTAURANTS, sort, limit)
+
+@pytest.mark.parametrize("sort", ["relevance", "rating", "weighted"])
+def test_rank_restaurants_limit(sort):
+    assert len(rank_restaurants(RESTAURANTS, sort, 1)) == 1
+    assert len(rank_restaurants(RESTAURANTS, sort, None)) == len(RESTAURANTS)
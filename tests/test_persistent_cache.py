@@ -0,0 +1,97 @@
+import asyncio
+import os
+import sqlite3
+
+from maat_mcp.config import Config
+from maat_mcp.util import persistent_cache
+from maat_mcp.util.cache import TTLCache
+from maat_mcp.util.persistent_cache import PersistentNamespace, PersistentStore
+
+def _auto_vacuum(path: str) -> int:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+    finally:
+        conn.close()
+
+def _disk_size(path: str) -> int:
+    wal = path + "-wal"
+    return os.path.getsize(path) + (os.path.getsize(wal) if os.path.exists(wal) else 0)
+
+def test_new_file_uses_incremental_auto_vacuum(tmp_path):
+    path = str(tmp_path / "cache.db")
+    store = PersistentStore(path)
+    store.set("ns", "key", {"value": 1}, 60)
+    store.flush()
+    assert store.get("ns", "key")[0] == {"value": 1}
+    store.close()
+    assert _auto_vacuum(path) == 2
+
+def test_existing_file_is_converted_to_incremental_auto_vacuum(tmp_path):
+    path = str(tmp_path / "cache.db")
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE unrelated (x)")
+    conn.close()
+    assert _auto_vacuum(path) == 0
+
+    store = PersistentStore(path)
+    assert store.get("ns", "key") is None
+    store.close()
+    assert _auto_vacuum(path) == 2
+
+def test_prune_keeps_file_size_under_bound(tmp_path):
+    path = str(tmp_path / "cache.db")
+    max_bytes = 256 * 1024
+    store = PersistentStore(path, max_bytes=max_bytes)
+    for i in range(2000):
+        store.set("ns", i, "x" * 1000, 60)
+    store.flush()
+    assert store.evictions > 0
+    # 마지막 정리 이후의 쓰기(최대 200개)만큼은 상한을 넘을 수 있습니다.
+    assert store.get("ns", 1999) is not None
+    assert store.get("ns", 0) is None
+    store._prune(store._connect(1), 0)
+    store.close()
+    assert _disk_size(path) <= max_bytes
+
+def test_ttl_cache_get_async_loads_from_store(tmp_path):
+    store = PersistentStore(str(tmp_path / "cache.db"))
+    store.set("ns", "key", [1, 2], 60)
+    store.flush()
+    cache = TTLCache(10, 60, PersistentNamespace(store, "ns"))
+
+    assert asyncio.run(cache.get_async("key")) == [1, 2]
+    assert asyncio.run(cache.get_async("missing")) is None
+    assert cache.store_hits == 1
+    assert cache.misses == 1
+    store.close()
+
+def test_store_accepts_writes_after_close(tmp_path):
+    store = PersistentStore(str(tmp_path / "cache.db"))
+    store.set("ns", "before", 1, 60)
+    store.close()
+    # 세션별 lifespan이 끝난 뒤에도 늦게 끝난 작업이 쓸 수 있습니다.
+    store.set("ns", "after", 2, 60)
+    store.flush()
+    assert store.get("ns", "before")[0] == 1
+    assert store.get("ns", "after")[0] == 2
+    store.close()
+
+def test_store_is_closed_by_last_user(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "PERSISTENT_CACHE_PATH", str(tmp_path / "cache.db"))
+    monkeypatch.setattr(persistent_cache, "_store", None)
+    monkeypatch.setattr(persistent_cache, "_users", 0)
+    store = persistent_cache.get_persistent_store()
+    closed = []
+    monkeypatch.setattr(store, "close", lambda: closed.append(True))
+
+    async def scenario():
+        persistent_cache.open_persistent_store()
+        persistent_cache.open_persistent_store()
+        await persistent_cache.close_persistent_store()
+        assert not closed
+        await persistent_cache.close_persistent_store()
+        assert closed == [True]
+
+    asyncio.run(scenario())
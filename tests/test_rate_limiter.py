@@ -0,0 +1,140 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from maat_mcp.api.google_maps_api import GoogleMapsApi
+from maat_mcp.api.http import HttpClient, HttpRequestError
+from maat_mcp.config import Config
+from maat_mcp.util import rate_limiter
+from maat_mcp.util.rate_limiter import RateLimitTimeoutError, TokenBucketScheduler
+from maat_mcp.util.resilience import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, latency_budget
+
+def test_waiters_are_served_by_priority_then_arrival():
+    async def scenario():
+        limiter = TokenBucketScheduler("test", rate=50, burst=1)
+        await limiter.acquire(PRIORITY_INTERACTIVE)
+        order = []
+
+        async def wait(name, priority):
+            await limiter.acquire(priority)
+            order.append(name)
+
+        tasks = []
+        for name, priority in [("bg1", PRIORITY_BACKGROUND), ("bg2", PRIORITY_BACKGROUND),
+                               ("fg1", PRIORITY_INTERACTIVE), ("fg2", PRIORITY_INTERACTIVE)]:
+            tasks.append(asyncio.create_task(wait(name, priority)))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        assert order == ["fg1", "fg2", "bg1", "bg2"]
+        assert limiter.granted == 5
+
+    asyncio.run(scenario())
+
+def test_acquire_times_out_at_deadline():
+    async def scenario():
+        limiter = TokenBucketScheduler("test", rate=1, burst=1)
+        await limiter.acquire()
+        with pytest.raises(RateLimitTimeoutError):
+            await limiter.acquire(deadline=time.monotonic() + 0.05)
+        # 지연 시간 예산이 마감 시각이 됩니다.
+        with latency_budget(0.05):
+            with pytest.raises(RateLimitTimeoutError):
+                await limiter.acquire()
+        assert limiter.timeouts == 2
+        assert limiter.queued == 0
+
+    asyncio.run(scenario())
+
+def test_penalize_pauses_and_halves_rate(monkeypatch):
+    monkeypatch.setattr(Config, "OVER_QUERY_LIMIT_BACKOFF", 0.1)
+
+    async def scenario():
+        limiter = TokenBucketScheduler("test", rate=100, burst=5)
+        limiter.penalize()
+        assert limiter.rate == 50
+        assert limiter.tokens == 0
+
+        started = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - started >= 0.09
+
+        # 연속으로 초과하면 멈추는 시간이 두 배가 되고, 속도는 최저 비율 아래로 내려가지 않습니다.
+        for _ in range(10):
+            limiter.penalize()
+        assert limiter.rate == 100 * Config.RATE_LIMIT_MIN_FACTOR
+        assert limiter.backoffs == 11
+
+        limiter.record_success()
+        assert limiter.rate == pytest.approx(20)
+
+    asyncio.run(scenario())
+
+class _GoogleStub:
+    """요청마다 정해진 응답(HTTP 상태 코드 또는 API status)을 차례대로 돌려주는 Google API 스텁입니다."""
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.calls = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.calls += 1
+        step = self.script.pop(0) if self.script else "OK"
+        if isinstance(step, int):
+            return web.Response(status=step)
+        return web.json_response({"status": step, "results": []})
+
+def _run_google(script, scenario, monkeypatch):
+    monkeypatch.setattr(rate_limiter, "_rate_limiters", {})
+    monkeypatch.setattr(Config, "RETRY_DELAY", 0.01)
+    monkeypatch.setattr(Config, "RETRY_MAX_DELAY", 0.01)
+    monkeypatch.setattr(Config, "OVER_QUERY_LIMIT_BACKOFF", 0.01)
+
+    async def main():
+        stub = _GoogleStub(script)
+        app = web.Application()
+        app.router.add_get("/maps/api/geocode/json", stub.handle)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        monkeypatch.setattr(Config, "GOOGLE_MAPS_BASE_URL", f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/maps/api")
+        monkeypatch.setattr(Config, "GOOGLE_MAPS_API_KEY", "stub-key")
+        await HttpClient.open()
+        try:
+            await scenario(stub, rate_limiter.get_rate_limiter("geocode"))
+        finally:
+            await HttpClient.close()
+            await runner.cleanup()
+
+    asyncio.run(main())
+
+def test_every_http_attempt_takes_a_token(monkeypatch):
+    async def scenario(stub, limiter):
+        response = await GoogleMapsApi.get_location_by_name("강남역")
+        assert response["status"] == "OK"
+        assert stub.calls == 3
+        assert limiter.granted == 3
+        assert limiter.backoffs == 1
+
+    _run_google([503, 429], scenario, monkeypatch)
+
+def test_over_query_limit_is_retried_through_the_limiter(monkeypatch):
+    async def scenario(stub, limiter):
+        response = await GoogleMapsApi.get_location_by_name("홍대입구역")
+        assert response["status"] == "OK"
+        assert stub.calls == 2
+        assert limiter.granted == 2
+        assert limiter.backoffs == 1
+
+    _run_google(["OVER_QUERY_LIMIT"], scenario, monkeypatch)
+
+def test_client_errors_are_not_retried(monkeypatch):
+    async def scenario(stub, limiter):
+        with pytest.raises(HttpRequestError):
+            await GoogleMapsApi.get_location_by_name("서울역")
+        assert stub.calls == 1
+        assert limiter.granted == 1
+
+    _run_google([403], scenario, monkeypatch)
@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+from maat_mcp.handlers import google_maps_api_handler as handler
+from maat_mcp.util.resilience import record_upstream_call
+
+SEARCHES = [(("key", i), (37.5, 127.0, f"검색 {i}", None), 1.0) for i in range(5)]
+
+@pytest.fixture
+def refreshed_keys(monkeypatch):
+    """인기 검색 5개가 모두 곧 만료되고, 갱신 한 번이 하위 작업에서 요청 9개(3페이지 × 검색어 3개)를 보내도록 합니다."""
+    keys = []
+
+    async def fake_refresh(cache_key, *args):
+        async def page():
+            record_upstream_call()
+
+        keys.append(cache_key)
+        await asyncio.gather(*(asyncio.ensure_future(page()) for _ in range(9)))
+
+    monkeypatch.setattr(handler._popular_searches, "top", lambda n: SEARCHES[:n])
+    monkeypatch.setattr(handler._restaurant_cache, "remaining_ttl", lambda key: 0.0)
+    monkeypatch.setattr(handler, "_refresh", fake_refresh)
+    return keys
+
+@pytest.mark.parametrize("budget, expected", [(0, 0), (1, 1), (9, 1), (10, 2), (18, 2), (100, 5)])
+def test_budget_counts_upstream_requests(refreshed_keys, budget, expected):
+    before = handler.get_refresh_stats()["refresh_upstream_calls"]
+    refreshed = asyncio.run(handler.refresh_popular_searches(top_n=5, budget=budget, refresh_ahead=60))
+    assert refreshed == expected
+    assert len(refreshed_keys) == expected
+    assert handler.get_refresh_stats()["refresh_upstream_calls"] - before == 9 * expected
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from maat_mcp.util.resilience import PRIORITY_BACKGROUND, request_priority
+from maat_mcp.util.single_flight import SingleFlight
+
+class _Upstream:
+    """호출 횟수를 세고, release()가 불릴 때까지 응답을 미루는 업스트림입니다."""
+
+    def __init__(self, error: Exception = None):
+        self.calls = 0
+        self.error = error
+        self.released = asyncio.Event()
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await self.released.wait()
+        if self.error is not None:
+            raise self.error
+        return "result"
+
+def test_concurrent_callers_share_one_upstream_call():
+    async def scenario():
+        flight = SingleFlight()
+        upstream = _Upstream()
+        waiters = [asyncio.create_task(flight.do("key", upstream)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert len(flight) == 1
+        upstream.released.set()
+        assert await asyncio.gather(*waiters) == ["result"] * 5
+        assert upstream.calls == 1
+        assert len(flight) == 0
+
+    asyncio.run(scenario())
+
+def test_cancelled_waiter_does_not_cancel_others():
+    async def scenario():
+        flight = SingleFlight()
+        upstream = _Upstream()
+        first = asyncio.create_task(flight.do("key", upstream))
+        second = asyncio.create_task(flight.do("key", upstream))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        upstream.released.set()
+        assert await second == "result"
+        assert first.cancelled()
+        assert upstream.calls == 1
+
+    asyncio.run(scenario())
+
+def test_error_propagates_to_every_waiter():
+    async def scenario():
+        flight = SingleFlight()
+        upstream = _Upstream(RuntimeError("upstream failed"))
+        waiters = [asyncio.create_task(flight.do("key", upstream)) for _ in range(3)]
+        await asyncio.sleep(0)
+        upstream.released.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert upstream.calls == 1
+        # 실패한 작업은 남지 않으므로 다음 호출은 다시 업스트림을 부릅니다.
+        upstream.error = None
+        assert await flight.do("key", upstream) == "result"
+        assert upstream.calls == 2
+
+    asyncio.run(scenario())
+
+def test_different_priorities_are_not_coalesced():
+    async def background():
+        with request_priority(PRIORITY_BACKGROUND):
+            return await flight.do("key", upstream)
+
+    async def scenario():
+        interactive = asyncio.create_task(flight.do("key", upstream))
+        refresh = asyncio.create_task(background())
+        await asyncio.sleep(0)
+        upstream.released.set()
+        assert await asyncio.gather(interactive, refresh) == ["result", "result"]
+        assert upstream.calls == 2
+
+    flight = SingleFlight()
+    upstream = _Upstream()
+    asyncio.run(scenario())
+
+def test_shared_call_finishes_after_every_waiter_is_cancelled():
+    async def scenario():
+        flight = SingleFlight()
+        upstream = _Upstream(RuntimeError("upstream failed"))
+        waiter = asyncio.create_task(flight.do("key", upstream))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        upstream.released.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert len(flight) == 0
+
+    asyncio.run(scenario())